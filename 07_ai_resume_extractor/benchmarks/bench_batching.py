@@ -0,0 +1,102 @@
+"""
+Benchmark: resumes/minute, per-resume parsing vs cross-resume batching
+
+Parses every resume in a folder three ways with the two_pass engine:
+- per_resume: parse_resume one resume at a time (fields run concurrently)
+- batched:    parse_resumes over groups of PARSE_BATCH_SIZE, no packing
+- packed:     parse_resumes with PACK_SIZE short resumes per pass-1 prompt
+
+and prints resumes/minute, LLM calls per resume, and how many resumes
+produced the same skills as the per-resume run (a cheap check that packing
+does not hurt quality). The LLM cache is bypassed so every run really calls
+the model. Source files are NOT deleted and nothing is saved.
+
+Needs Ollama running with the model from config.py.
+
+Usage:
+    python benchmarks/bench_batching.py [folder] [batch size]
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain_core.tracers.context import collect_runs
+from langchain_ollama import ChatOllama
+from config import SOURCE_FOLDER, MODEL_NAME, TEMPERATURE, PARSE_BATCH_SIZE, PACK_SIZE, BATCH_CONCURRENCY
+from file_loader import load_all_resumes
+import parser_production
+import telemetry
+
+
+def count_llm_calls(runs) -> int:
+    """Count LLM runs in a list of traced runs (including nested runs)."""
+    return sum((run.run_type == "llm") + count_llm_calls(run.child_runs) for run in runs)
+
+
+def run_mode(mode: str, texts: list, batch_size: int) -> dict:
+    """Parse all texts in one mode; returns seconds, LLM calls and results."""
+    results = []
+    start = time.perf_counter()
+    with collect_runs() as tracer:
+        if mode == "per_resume":
+            for text in texts:
+                try:
+                    results.append(parser_production.parse_resume(text))
+                except Exception as e:
+                    results.append(e)
+        else:
+            pack_size = PACK_SIZE if mode == "packed" else 1
+            for first in range(0, len(texts), batch_size):
+                group = texts[first:first + batch_size]
+                results += parser_production.parse_resumes(group, BATCH_CONCURRENCY, pack_size)
+    return {"seconds": time.perf_counter() - start, "calls": count_llm_calls(tracer.traced_runs),
+            "results": results}
+
+
+def same_skills(a, b) -> bool:
+    if isinstance(a, Exception) or isinstance(b, Exception):
+        return False
+    return {s.lower() for s in a.skills} == {s.lower() for s in b.skills}
+
+
+def main():
+    folder = sys.argv[1] if len(sys.argv) > 1 else str(SOURCE_FOLDER)
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else PARSE_BATCH_SIZE
+
+    resumes = load_all_resumes(folder)
+    if not resumes:
+        print(f"📭 No resumes found in {folder}")
+        return
+    texts = list(resumes.values())
+
+    # No response cache: every mode must really call the model
+    parser_production._llm = ChatOllama(model=MODEL_NAME, temperature=TEMPERATURE, cache=False,
+                                        callbacks=telemetry.llm_callbacks())
+
+    results = {}
+    for mode in ("per_resume", "batched", "packed"):
+        print(f"\n🤖 {mode}: {len(texts)} resume(s), batch size {batch_size}...")
+        results[mode] = run_mode(mode, texts, batch_size)
+
+    count = len(texts)
+    baseline = results["per_resume"]
+    print("\n" + "=" * 60)
+    print(f"CROSS-RESUME BATCHING ({count} resumes, {MODEL_NAME})")
+    print("=" * 60)
+    print(f"   {'mode':<11} {'resumes/min':>11} {'speedup':>8} {'calls/resume':>13} {'failed':>7} {'same skills':>12}")
+    for mode, r in results.items():
+        failed = sum(isinstance(x, Exception) for x in r["results"])
+        agree = sum(same_skills(a, b) for a, b in zip(r["results"], baseline["results"]))
+        print(f"   {mode:<11} {count / r['seconds'] * 60:>11.1f} {baseline['seconds'] / r['seconds']:>7.2f}x "
+              f"{r['calls'] / count:>13.1f} {failed:>7} {agree:>8}/{count}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark: how many contact LLM calls the regex fast path saves
+
+Runs the deterministic contact extractor (contact_heuristics.py) on every
+resume in a folder and prints each field's guess and confidence, then the
+fraction of resumes - and of contact LLM calls - that skip the LLM.
+
+Does not need Ollama. Source files are NOT deleted.
+
+Usage:
+    python benchmarks/bench_contact_fast_path.py [folder] [threshold]
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import SOURCE_FOLDER, CONTACT_FAST_PATH_THRESHOLD
+from file_loader import load_all_resumes
+from contact_heuristics import guess_contact, confident_contact
+
+# Two-pass contact extraction = extract + cleanup
+CALLS_PER_CONTACT = 2
+
+
+def main():
+    folder = sys.argv[1] if len(sys.argv) > 1 else str(SOURCE_FOLDER)
+    threshold = float(sys.argv[2]) if len(sys.argv) > 2 else CONTACT_FAST_PATH_THRESHOLD
+
+    resumes = load_all_resumes(folder)
+    if not resumes:
+        print(f"📭 No resumes found in {folder}")
+        return
+
+    fast = 0
+    elapsed = 0.0
+    for filename, text in resumes.items():
+        start = time.perf_counter()
+        guess = guess_contact(text)
+        contact = confident_contact(guess, threshold)
+        elapsed += time.perf_counter() - start
+
+        if contact is not None:
+            fast += 1
+        marker = "⚡" if contact is not None else "🤖"
+        fields = "  ".join(f"{field}={value!r} ({confidence:.2f})" for field, (value, confidence) in guess.items())
+        print(f"{marker} {filename}: {fields}")
+
+    count = len(resumes)
+    print("\n" + "=" * 60)
+    print(f"CONTACT FAST PATH ({count} resumes, threshold {threshold})")
+    print("=" * 60)
+    print(f"   Resumes without contact LLM calls: {fast}/{count} ({fast / count:.0%})")
+    print(f"   Contact LLM calls saved:           {fast * CALLS_PER_CONTACT}/{count * CALLS_PER_CONTACT}")
+    print(f"   Heuristic time per resume:         {elapsed / count * 1000:.2f} ms")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: per-call database functions vs ResumeRepository
+
+Inserts and reads synthetic resumes in a temporary database and prints
+rows/sec for each design, plus peak memory of a full-table read with
+get_all_resumes() vs the streaming iter_resumes(). No LLM or Ollama needed.
+
+Usage:
+    python benchmarks/bench_database.py [rows]
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database
+from models import Resume, ContactInfo, JobExperience, Education
+
+
+def make_resume(i: int) -> Resume:
+    """Build a realistic-sized fake resume."""
+    return Resume(
+        contact=ContactInfo(name=f"Candidate {i}", email=f"candidate{i}@example.com",
+                            phone=f"555{i:07d}"[:10], location="Austin"),
+        summary="Senior engineer with experience building data platforms and APIs.",
+        skills=["Python", "SQL", "AWS", "Docker", "Kubernetes", "Pandas"],
+        experience=[JobExperience(company="Acme", title="Engineer", duration="2020-Present",
+                                  responsibilities=["Built pipelines", "Led team of 4"])],
+        education=[Education(institution="UT Austin", degree="BS", field="CS", year="2018")],
+    )
+
+
+def timed(label: str, rows: int, func):
+    """Run func once and print rows/sec."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # save_resume prints every row
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"   {label:<40} {elapsed:8.3f}s  {rows / elapsed:12,.0f} rows/sec")
+    return elapsed
+
+
+def peak_memory(label: str, rows: int, func):
+    """Run func once and print rows/sec and peak Python memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"   {label:<40} {elapsed:8.3f}s  {rows / elapsed:12,.0f} rows/sec  {peak / 2**20:8.1f} MB peak")
+    return peak
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    resumes = [make_resume(i) for i in range(rows)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print("=" * 60)
+        print(f"DATABASE BENCHMARK ({rows} rows)")
+        print("=" * 60)
+
+        # Per-call design: new connection + commit for every resume
+        database.DATABASE_FILE = Path(tmp) / "per_call.db"
+        with contextlib.redirect_stdout(io.StringIO()):
+            database.create_database()
+
+        print("\n💾 Inserts")
+        old_insert = timed("save_resume() per call", rows,
+                           lambda: [database.save_resume(r) for r in resumes])
+
+        # Repository: one connection, WAL, one transaction
+        repo = database.ResumeRepository(Path(tmp) / "repository.db")
+        new_insert = timed("ResumeRepository.save_resumes()", rows,
+                           lambda: repo.save_resumes(resumes))
+
+        print("\n🔍 Lookups by ID")
+        ids = range(1, rows + 1)
+        old_read = timed("get_resume_by_id() per call", rows,
+                         lambda: [database.get_resume_by_id(i) for i in ids])
+        new_read = timed("ResumeRepository.get_resume_by_id()", rows,
+                         lambda: [repo.get_resume_by_id(i) for i in ids])
+        repo.close()
+
+        print("\n📤 Full-table read (export)")
+        old_peak = peak_memory("get_all_resumes()", rows,
+                               lambda: sum(1 for _ in database.get_all_resumes()))
+        new_peak = peak_memory("iter_resumes()", rows,
+                               lambda: sum(1 for _ in database.iter_resumes()))
+
+        print("\n📊 Speedup")
+        print(f"   Inserts: {old_insert / new_insert:.1f}x")
+        print(f"   Lookups: {old_read / new_read:.1f}x")
+        print(f"   Export memory: {old_peak / new_peak:.1f}x less")
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: ranking N stored resumes against a job description
+
+Builds synthetic per-resume features (skills drawn from a shared vocabulary,
+last-job years 2000-present) and a throwaway vector index of random unit
+vectors, then times CandidateMatcher.rank - skill overlap, recency,
+semantic similarity and the top-k - with and without the semantic signal.
+Embedding the JD (one Ollama call) and reading k rows from SQLite are not
+included. Also times loading the feature file from disk.
+
+Does not need Ollama. Everything is written to a temp folder and deleted.
+
+Usage:
+    python benchmarks/bench_matching.py [resumes] [dims] [k]
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import datetime
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+from matching import CandidateMatcher, MatchFeatures
+from vector_index import VectorIndex
+
+BUDGET_MS = 1000
+QUERIES = 10
+VOCABULARY = 2000
+SKILLS_PER_RESUME = 15
+JD_SKILLS = 8
+BUILD_BATCH = 50_000
+
+
+def fake_features(count: int, rng: np.random.Generator) -> MatchFeatures:
+    indptr = np.arange(count + 1, dtype=np.int64) * SKILLS_PER_RESUME
+    # Skewed like real skills: a few (python, sql) are on most resumes
+    indices = np.minimum(rng.zipf(1.3, count * SKILLS_PER_RESUME) - 1, VOCABULARY - 1).astype(np.int32)
+    years = rng.integers(2000, datetime.date.today().year + 1, count).astype(np.float32)
+    return MatchFeatures(np.arange(1, count + 1, dtype=np.int64), indptr, indices,
+                         [f"skill{i}" for i in range(VOCABULARY)], years, (count, count))
+
+
+def time_rank(matcher: CandidateMatcher, queries: list, k: int) -> list:
+    times = []
+    for skills, vector in queries:
+        start = time.perf_counter()
+        matcher.rank(skills, vector, k)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    dims = int(sys.argv[2]) if len(sys.argv) > 2 else 768
+    k = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    rng = np.random.default_rng(7)
+
+    with tempfile.TemporaryDirectory() as folder:
+        features = fake_features(count, rng)
+        features.save(Path(folder) / "features.npz")
+        start = time.perf_counter()
+        features = MatchFeatures.load(Path(folder) / "features.npz")
+        load = (time.perf_counter() - start) * 1000
+
+        index = VectorIndex(folder, model="bench")
+        for first in range(0, count, BUILD_BATCH):
+            rows = min(BUILD_BATCH, count - first)
+            index.add(list(range(first + 1, first + rows + 1)), rng.standard_normal((rows, dims), dtype=np.float32))
+
+        matcher = CandidateMatcher(db_file=Path(folder) / "unused.db", index=index)
+        matcher.features = features
+        queries = [([f"skill{i}" for i in rng.choice(200, JD_SKILLS, replace=False)],
+                    rng.standard_normal(dims, dtype=np.float32)) for _ in range(QUERIES)]
+        matcher.rank(*queries[0], k)  # align with the vector index, warm the page cache
+
+        full = time_rank(matcher, queries, k)
+        no_semantic = time_rank(matcher, [(skills, None) for skills, _ in queries], k)
+
+    p50 = statistics.median(full)
+    print(f"📐 {count:,} resumes, {SKILLS_PER_RESUME} skills each, {dims}-dim vectors "
+          f"(feature file loaded in {load:.0f} ms)")
+    print(f"🎯 skills + recency + semantic: p50 {p50:7.1f} ms   max {max(full):7.1f} ms")
+    print(f"🧮 skills + recency only:       p50 {statistics.median(no_semantic):7.1f} ms")
+    print(f"{'✅' if p50 <= BUDGET_MS else '❌'} Budget {BUDGET_MS} ms")
+
+
+if __name__ == "__main__":
+    main()
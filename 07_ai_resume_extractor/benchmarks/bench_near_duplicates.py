@@ -0,0 +1,103 @@
+"""
+Benchmark: MinHash/LSH near-duplicate lookup vs comparing every signature
+
+Fills a throwaway database with N synthetic resumes (random word soup from a
+shared vocabulary, so unrelated resumes still share some words), then looks up
+edited copies of stored resumes (a few words changed) and brand-new resumes:
+- LSH lookup time (NearDuplicateIndex.find)
+- the same lookup done by comparing against every stored signature
+- how many edited copies were found, and false positives on new resumes
+
+Does not need Ollama.
+
+Usage:
+    python benchmarks/bench_near_duplicates.py [resumes] [lookups]
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+from config import NEAR_DUPLICATE_THRESHOLD
+from database import ResumeRepository, INSERT_RESUME_SQL, _resume_row
+from file_loader import compute_text_hash
+from models import Resume, ContactInfo
+from near_duplicates import NearDuplicateIndex, minhash, similarity
+
+VOCABULARY = [f"word{i}" for i in range(5000)]
+WORDS_PER_RESUME = 400
+EDITS = 3
+
+
+def fake_resume(rng: random.Random) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(WORDS_PER_RESUME))
+
+
+def edit(text: str, rng: random.Random) -> str:
+    """Change a few words, like a candidate updating a resume."""
+    words = text.split()
+    for _ in range(EDITS):
+        words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    return " ".join(words)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    rng = random.Random(7)
+    placeholder = Resume(contact=ContactInfo(name="Bench", email="bench@example.com", phone="5550000000"))
+
+    with tempfile.TemporaryDirectory() as folder:
+        repo = ResumeRepository(Path(folder) / "bench.db")
+        near = NearDuplicateIndex(repo)
+
+        start = time.perf_counter()
+        texts, signatures = [], []
+        for _ in range(count):
+            text = fake_resume(rng)
+            content_hash = compute_text_hash(text)
+            signature = minhash(text)
+            with repo.transaction() as conn:
+                conn.execute(INSERT_RESUME_SQL, _resume_row(placeholder, None, content_hash))
+            near.add(content_hash, signature)
+            texts.append(text)
+            signatures.append(signature)
+        build = time.perf_counter() - start
+        stored = np.stack(signatures)
+
+        lsh_times, scan_times = [], []
+        found = false_positives = 0
+        for _ in range(lookups):
+            signature = minhash(edit(rng.choice(texts), rng))
+
+            start = time.perf_counter()
+            found += near.find(signature) is not None
+            lsh_times.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            (stored == signature).mean(axis=1).max()
+            scan_times.append((time.perf_counter() - start) * 1000)
+
+            false_positives += near.find(minhash(fake_resume(rng))) is not None
+        repo.close()
+
+    expected = statistics.mean(similarity(minhash(t), minhash(edit(t, rng))) for t in texts[:50])
+    print(f"📦 {count:,} resumes indexed in {build:.1f}s ({build / count * 1000:.2f} ms each)")
+    print(f"🪞 Edited copies ({EDITS} words changed, ~{expected:.0%} similar, threshold "
+          f"{NEAR_DUPLICATE_THRESHOLD:.0%}): {found}/{lookups} found")
+    print(f"🆕 New resumes flagged by mistake: {false_positives}/{lookups}")
+    print(f"⚡ LSH lookup:       p50 {statistics.median(lsh_times):.2f} ms")
+    print(f"🐢 Compare all:      p50 {statistics.median(scan_times):.2f} ms (grows with the table)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: LLM calls and latency per resume for each parser engine
+
+Parses every resume in a folder with each engine (single_pass, two_pass,
+schema) and prints calls per resume and seconds per resume. Source files
+are NOT deleted and nothing is saved to the database.
+
+Needs Ollama running with the model from config.py.
+
+Usage:
+    python benchmarks/bench_parser_engines.py [folder] [engine ...]
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain_core.tracers.context import collect_runs
+from config import SOURCE_FOLDER, PARSER_MODULES, load_parser
+from file_loader import load_all_resumes
+
+
+def count_llm_calls(runs) -> int:
+    """Count LLM runs in a list of traced runs (including nested chain runs)."""
+    total = 0
+    for run in runs:
+        if run.run_type == "llm":
+            total += 1
+        total += count_llm_calls(run.child_runs)
+    return total
+
+
+def bench_engine(engine: str, resumes: dict) -> dict:
+    """Parse all resumes with one engine and collect calls, time and failures."""
+    parse_resume = load_parser(engine)
+    calls = 0
+    failures = 0
+    start = time.perf_counter()
+
+    for filename, text in resumes.items():
+        with collect_runs() as tracer:
+            try:
+                parse_resume(text)
+            except Exception as e:
+                print(f"   ❌ {engine} failed on {filename}: {e}")
+                failures += 1
+        calls += count_llm_calls(tracer.traced_runs)
+
+    elapsed = time.perf_counter() - start
+    return {"calls": calls, "seconds": elapsed, "failures": failures}
+
+
+def main():
+    folder = sys.argv[1] if len(sys.argv) > 1 else str(SOURCE_FOLDER)
+    engines = sys.argv[2:] or list(PARSER_MODULES)
+
+    resumes = load_all_resumes(folder)
+    if not resumes:
+        print(f"📭 No resumes found in {folder}")
+        return
+
+    results = {}
+    for engine in engines:
+        print(f"\n🤖 Running {engine} on {len(resumes)} resume(s)...")
+        results[engine] = bench_engine(engine, resumes)
+
+    count = len(resumes)
+    print("\n" + "=" * 60)
+    print(f"PARSER ENGINES ({count} resumes)")
+    print("=" * 60)
+    print(f"   {'engine':<12} {'calls/resume':>12} {'sec/resume':>12} {'failures':>9}")
+    for engine, r in results.items():
+        print(f"   {engine:<12} {r['calls'] / count:>12.1f} {r['seconds'] / count:>12.2f} {r['failures']:>9}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: prompt size and coverage of section routing vs text[:2000]
+
+For every resume in a folder, compares what the four two-pass extractors
+would be sent with the old fixed 2000-character prefix and with section
+routing (sections.py):
+- prompt tokens per resume (approximate, CHARS_PER_TOKEN)
+- how much of the experience section the experience extractor sees
+
+Does not need Ollama. Source files are NOT deleted.
+
+Usage:
+    python benchmarks/bench_section_routing.py [folder]
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import SOURCE_FOLDER, CHARS_PER_TOKEN
+from file_loader import load_all_resumes
+from sections import split_sections, route_text
+
+FIELDS = ["contact", "skills", "summary", "experience"]
+OLD_PREFIX = 2000
+
+
+def coverage(section: str, sent: str) -> float:
+    """Fraction of a section's lines that appear in the text sent to the model."""
+    lines = [line for line in section.splitlines() if line.strip()]
+    if not lines:
+        return 1.0
+    return sum(1 for line in lines if line in sent) / len(lines)
+
+
+def main():
+    folder = sys.argv[1] if len(sys.argv) > 1 else str(SOURCE_FOLDER)
+
+    resumes = load_all_resumes(folder)
+    if not resumes:
+        print(f"📭 No resumes found in {folder}")
+        return
+
+    old_tokens = new_tokens = 0
+    old_coverage = new_coverage = 0.0
+    with_experience = 0
+    elapsed = 0.0
+
+    for filename, text in resumes.items():
+        start = time.perf_counter()
+        sections = split_sections(text)
+        routed = {field: route_text(text, field) for field in FIELDS}
+        elapsed += time.perf_counter() - start
+
+        old = len(FIELDS) * min(len(text), OLD_PREFIX) // CHARS_PER_TOKEN
+        new = sum(len(t) for t in routed.values()) // CHARS_PER_TOKEN
+        old_tokens += old
+        new_tokens += new
+
+        line = f"   {filename}: sections={','.join(sections)}  tokens {old} → {new}"
+        if "experience" in sections:
+            with_experience += 1
+            before = coverage(sections["experience"], text[:OLD_PREFIX])
+            after = coverage(sections["experience"], routed["experience"])
+            old_coverage += before
+            new_coverage += after
+            line += f"  experience seen {before:.0%} → {after:.0%}"
+        print(line)
+
+    count = len(resumes)
+    print("\n" + "=" * 60)
+    print(f"SECTION ROUTING ({count} resumes)")
+    print("=" * 60)
+    print(f"   Prompt tokens/resume (4 extractors): {old_tokens / count:.0f} → {new_tokens / count:.0f}")
+    if with_experience:
+        print(f"   Experience section seen:             "
+              f"{old_coverage / with_experience:.0%} → {new_coverage / with_experience:.0%}")
+    print(f"   Segmenting time per resume:          {elapsed / count * 1000:.2f} ms")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: skill extraction with the Aho-Corasick dictionary
+
+Runs the dictionary pass of extract_skills (parser_production.plan_skills)
+on every resume in a folder and prints the canonical skills found, the
+skills-section items the dictionary does not know, and what the LLM still
+has to do. Then the fraction of skill LLM calls saved and the time per
+resume (the old extractor always made 2 LLM calls).
+
+Does not need Ollama. Source files are NOT deleted.
+
+Usage:
+    python benchmarks/bench_skill_dictionary.py [folder]
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import SOURCE_FOLDER
+from file_loader import load_all_resumes
+from parser_production import plan_skills
+from sections import route_text
+from skills import get_skill_dictionary
+
+# Two-pass skill extraction = extract + cleanup
+CALLS_PER_SKILLS = 2
+REPEAT = 200
+
+
+def main():
+    folder = sys.argv[1] if len(sys.argv) > 1 else str(SOURCE_FOLDER)
+
+    resumes = load_all_resumes(folder)
+    if not resumes:
+        print(f"📭 No resumes found in {folder}")
+        return
+
+    start = time.perf_counter()
+    dictionary = get_skill_dictionary()
+    build = time.perf_counter() - start
+
+    no_llm = terms_only = 0
+    scan_us = []
+    for filename, text in resumes.items():
+        known, job = plan_skills(text)
+        routed = route_text(text, "skills")
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            dictionary.scan(routed)
+        scan_us.append((time.perf_counter() - start) / REPEAT * 1e6)
+
+        if job is None:
+            no_llm += 1
+            marker, todo = "⚡", "no LLM call"
+        elif job[0] == "skill_terms":
+            terms_only += 1
+            marker, todo = "🔎", f"LLM checks: {job[1].replace(chr(10), ', ')}"
+        else:
+            marker, todo = "🤖", "full LLM extraction (no known skills)"
+        print(f"{marker} {filename}: {', '.join(known) or '(none)'}  [{todo}]")
+
+    count = len(resumes)
+    print("\n" + "=" * 60)
+    print(f"SKILL DICTIONARY ({count} resumes, {len(dictionary)} aliases, compiled in {build * 1000:.1f} ms)")
+    print("=" * 60)
+    print(f"   Resumes without skill LLM calls:  {no_llm}/{count} ({no_llm / count:.0%})")
+    print(f"   Only unknown terms sent to LLM:   {terms_only}/{count}")
+    print(f"   Skill LLM calls saved:            {no_llm * CALLS_PER_SKILLS}/{count * CALLS_PER_SKILLS}")
+    print(f"   Dictionary scan per resume:       {sum(scan_us) / count:.0f} µs")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark: cold-start import time of the resume extractor
+
+Runs `python -X importtime -c "import main"` in fresh interpreters and
+reports the median import time of main.py, the slowest imports it pulls
+in, and whether it fits STARTUP_BUDGET_MS (config.py). Exits with status 1
+when over budget, so it can run in CI.
+
+Document loaders (PDF/DOCX) and Ollama clients are imported on first use,
+so they should NOT show up here.
+
+Usage:
+    python benchmarks/bench_startup.py [runs] [module]
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+
+from config import STARTUP_BUDGET_MS
+
+
+def import_times(module: str) -> list:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        List of (depth, module name, self µs, cumulative µs) in import order
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+    )
+
+    rows = []
+    for line in result.stderr.splitlines():
+        # "import time:   self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((depth, name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    module = sys.argv[2] if len(sys.argv) > 2 else "main"
+
+    totals = []
+    last = []
+    for _ in range(runs):
+        last = import_times(module)
+        totals.append(next(cum for _, name, _, cum in last if name == module) / 1000)
+
+    median_ms = statistics.median(totals)
+
+    # importtime lists children before their parent: the module's subtree is
+    # every row between the previous top-level import and the module itself
+    end = next(i for i, (depth, name, _, _) in enumerate(last) if depth == 0 and name == module)
+    start = end
+    while start > 0 and last[start - 1][0] > 0:
+        start -= 1
+    subtree = last[start:end]
+
+    # Heaviest modules imported directly by the module under test
+    direct = sorted(((cum, name) for depth, name, _, cum in subtree if depth == 1), reverse=True)[:10]
+
+    print("=" * 60)
+    print(f"STARTUP: import {module} ({runs} runs)")
+    print("=" * 60)
+    print(f"   median {median_ms:.0f} ms   min {min(totals):.0f} ms   max {max(totals):.0f} ms")
+    print("\n   Slowest direct imports (last run):")
+    for cum, name in direct:
+        print(f"   {cum / 1000:8.1f} ms  {name}")
+
+    heavy = [name for _, name, _, _ in subtree
+             if name.startswith(("langchain_community", "langchain_ollama", "pypdf", "unstructured"))]
+    if heavy:
+        print(f"\n   ⚠️  Eager heavy imports: {', '.join(sorted(set(heavy))[:5])}")
+
+    print()
+    if median_ms <= STARTUP_BUDGET_MS:
+        print(f"✅ Within budget: {median_ms:.0f} ms <= {STARTUP_BUDGET_MS} ms")
+    else:
+        print(f"❌ Over budget: {median_ms:.0f} ms > {STARTUP_BUDGET_MS} ms")
+    print("=" * 60)
+
+    if median_ms > STARTUP_BUDGET_MS:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
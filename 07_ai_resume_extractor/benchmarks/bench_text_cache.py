@@ -0,0 +1,80 @@
+"""
+Benchmark: loading a folder with and without the extracted-text cache
+
+Loads every resume in a folder three times through load_resume_text with a
+fresh cache in a temp folder:
+- cold:    empty cache, every file goes through PyPDF/Unstructured
+- warm:    same files, unchanged - served from the cache by path/size/mtime
+- touched: mtime bumped on every file - served by content hash
+
+and prints the time per file, the speedup and how well the text compresses.
+Does not need Ollama. Source files are NOT deleted or modified (the touched
+run works on copies).
+
+Usage:
+    python benchmarks/bench_text_cache.py [folder]
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import SOURCE_FOLDER
+from file_loader import list_resume_files, load_resume_text
+import text_cache
+
+
+def load_folder(files: list) -> float:
+    """Seconds to load every file (files that fail to load are skipped)."""
+    start = time.perf_counter()
+    for file_path in files:
+        try:
+            load_resume_text(str(file_path))
+        except Exception as e:
+            print(f"❌ {file_path.name}: {e}")
+    return time.perf_counter() - start
+
+
+def main():
+    folder = sys.argv[1] if len(sys.argv) > 1 else str(SOURCE_FOLDER)
+    files = list_resume_files(folder)
+    if not files:
+        print(f"📭 No resumes found in {folder}")
+        return
+
+    with tempfile.TemporaryDirectory() as temp:
+        copies = []
+        for file_path in files:
+            copies.append(Path(temp) / file_path.name)
+            shutil.copy2(file_path, copies[-1])
+
+        text_cache._cache = text_cache.TextCache(Path(temp) / "text_cache.db")
+        cold = load_folder(copies)
+        warm = load_folder(copies)
+        for copy in copies:
+            copy.touch()
+        touched = load_folder(copies)
+        stats = text_cache._cache.stats()
+        text_cache._cache.conn.close()
+
+    count = len(files)
+    print("\n" + "=" * 60)
+    print(f"TEXT CACHE ({count} files from {folder})")
+    print("=" * 60)
+    print(f"   Cold (PDF/DOCX parsing):  {cold / count * 1000:8.1f} ms per file")
+    print(f"   Warm (path/size/mtime):   {warm / count * 1000:8.1f} ms per file ({cold / warm:,.0f}x faster)")
+    print(f"   Touched (content hash):   {touched / count * 1000:8.1f} ms per file ({cold / touched:,.0f}x faster)")
+    print(f"   Hits: {stats['hits']} ({stats['hash_hits']} by hash), misses: {stats['misses']}")
+    print(f"   Stored: {stats['stored_mb'] * 1024:.1f} KB compressed ({stats['compression']:.1f}x smaller than the text)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
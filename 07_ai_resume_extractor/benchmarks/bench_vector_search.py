@@ -0,0 +1,95 @@
+"""
+Benchmark: top-k query latency of the local vector index
+
+Builds a throwaway index of random unit vectors (float16 memmap, same
+format as vector_index.py) and times VectorIndex.search - the part of
+find_similar_candidates that grows with the number of resumes. Embedding
+the query (one Ollama call) and reading k rows from SQLite are not included.
+
+Times both search modes - the exact float16 scan and the sign-bit
+prefilter + rerank used past EXACT_SEARCH_MAX_ROWS - and reports the
+prefilter's recall against the exact top-k. Random vectors are a worst
+case for the prefilter; real embeddings cluster and do better.
+
+Does not need Ollama. The index is written to a temp folder and deleted.
+
+Usage:
+    python benchmarks/bench_vector_search.py [resumes] [dims] [k]
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+from vector_index import VectorIndex
+from config import SEARCH_WORKERS, EXACT_SEARCH_MAX_ROWS, RERANK_CANDIDATES
+
+BUDGET_MS = 100
+QUERIES = 20
+BUILD_BATCH = 50_000
+
+
+def time_search(index: VectorIndex, queries: np.ndarray, k: int, exact: bool) -> tuple:
+    """Returns (latencies in ms, set of resume ids per query)."""
+    times, results = [], []
+    for query in queries:
+        start = time.perf_counter()
+        matches = index.search(query, k, exact=exact)
+        times.append((time.perf_counter() - start) * 1000)
+        results.append({resume_id for resume_id, _ in matches})
+    return times, results
+
+
+def report(label: str, times: list):
+    p50 = statistics.median(times)
+    p95 = sorted(times)[int(len(times) * 0.95) - 1]
+    print(f"🔎 {label:<28} p50 {p50:7.1f} ms   p95 {p95:7.1f} ms")
+    return p50
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    dims = int(sys.argv[2]) if len(sys.argv) > 2 else 768
+    k = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    rng = np.random.default_rng(7)
+
+    with tempfile.TemporaryDirectory() as folder:
+        index = VectorIndex(folder, model="bench")
+        start = time.perf_counter()
+        for first in range(0, count, BUILD_BATCH):
+            rows = min(BUILD_BATCH, count - first)
+            index.add(list(range(first + 1, first + rows + 1)), rng.standard_normal((rows, dims), dtype=np.float32))
+        build = time.perf_counter() - start
+
+        # Queries near stored resumes (a job description close to a few candidates)
+        targets = rng.integers(0, count, QUERIES)
+        queries = (np.asarray(index.vectors[np.sort(targets)], dtype=np.float32)
+                   + rng.standard_normal((QUERIES, dims), dtype=np.float32) / np.sqrt(dims))
+        index.search(queries[0], k, exact=True)  # warm the page cache
+
+        exact_times, exact_results = time_search(index, queries, k, exact=True)
+        fast_times, fast_results = time_search(index, queries, k, exact=False)
+        recall = statistics.mean(len(a & b) / k for a, b in zip(exact_results, fast_results))
+
+    print(f"📐 {count:,} resumes x {dims} dims: {count * dims * 2 / 1e6:,.0f} MB float16 + "
+          f"{count * dims / 8 / 1e6:,.0f} MB sign bits (built in {build:.1f}s)")
+    report(f"exact scan ({SEARCH_WORKERS} threads)", exact_times)
+    p50 = report(f"sign prefilter + rerank {RERANK_CANDIDATES}", fast_times)
+    print(f"🎯 Prefilter recall@{k} vs exact: {recall:.0%}")
+    default = "exact scan" if count <= EXACT_SEARCH_MAX_ROWS else "prefilter"
+    if count > EXACT_SEARCH_MAX_ROWS:
+        print(f"{'✅' if p50 <= BUDGET_MS else '❌'} Budget {BUDGET_MS} ms ({default} is the default at this size)")
+    else:
+        print(f"ℹ️  {default} is the default at this size (EXACT_SEARCH_MAX_ROWS = {EXACT_SEARCH_MAX_ROWS:,})")
+
+
+if __name__ == "__main__":
+    main()
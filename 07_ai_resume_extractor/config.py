@@ -8,6 +8,7 @@ Date: December 15, 2025
 """
 
 from pathlib import Path
+import importlib
 
 # ============================================================
 # PROJECT PATHS
@@ -31,6 +32,145 @@ DATABASE_FILE = BASE_DIR / "resumes.db"
 MODEL_NAME = "qwen3:4b"
 TEMPERATURE = 0.1  # Low temperature for consistent extraction
 
+# Max LLM calls in flight while extracting the fields of ONE resume
+# (1 = extract fields one after another). In pipeline mode the model server
+# sees up to PARSE_WORKERS * EXTRACTION_CONCURRENCY requests at once.
+EXTRACTION_CONCURRENCY = 4
+
+
+# On-disk cache of LLM responses (see llm_cache.py). Re-running an unchanged
+# corpus with the same model/temperature/prompts never calls Ollama.
+LLM_CACHE_ENABLED = True
+LLM_CACHE_FILE = BASE_DIR / "llm_cache.db"
+LLM_CACHE_MAX_ENTRIES = 50_000  # least recently used entries are evicted past this
+
+# On-disk cache of extracted file text (see text_cache.py), zlib-compressed.
+# Files with the same path, size and mtime (or the same bytes) skip PDF/DOCX parsing.
+TEXT_CACHE_ENABLED = True
+TEXT_CACHE_FILE = BASE_DIR / "text_cache.db"
+TEXT_CACHE_MAX_MB = 256       # compressed text; least recently used entries are evicted past this
+TEXT_CACHE_COMPRESSION = 6    # zlib level (1 = fastest, 9 = smallest)
+
+# Contact info comes from regexes/heuristics (contact_heuristics.py) when the
+# name, email and phone guesses all score at least this confidence; otherwise
+# the LLM is asked. Set above 1.0 to always use the LLM.
+CONTACT_FAST_PATH_THRESHOLD = 0.8
+
+# Resume text sent to each two-pass extractor (see sections.py): only the
+# sections that field needs, trimmed to a budget of approximate tokens
+FIELD_TOKEN_BUDGETS = {
+	"contact": 150,
+	"skills": 300,
+	"summary": 400,
+	"experience": 900,
+	"education": 300,
+}
+DEFAULT_TOKEN_BUDGET = 500  # unrouted text (the old 2000-character prefix)
+CHARS_PER_TOKEN = 4         # rough average for English text
+
+# Semantic candidate search (vector_index.py): summary, skills and experience
+# are embedded at ingest time and stored as float16 vectors next to resumes.db
+VECTOR_INDEX_ENABLED = True
+VECTOR_INDEX_DIR = BASE_DIR / "resumes_vectors"
+EMBEDDING_MODEL = "nomic-embed-text"
+EMBEDDING_BATCH_SIZE = 32   # texts per embedding request
+SEARCH_WORKERS = 4          # threads scoring vector chunks in parallel
+EXACT_SEARCH_MAX_ROWS = 100_000  # above this, prefilter by sign bits and rerank
+RERANK_CANDIDATES = 10_000       # rows given the exact score after the prefilter
+
+# Near-duplicate detection (near_duplicates.py): MinHash signatures of the
+# resume text, LSH buckets for lookup. A resume whose estimated Jaccard
+# similarity to a saved one reaches the threshold is flagged; with
+# NEAR_DUPLICATE_REUSE it is not parsed, and the saved record is reused.
+# Changing the MinHash settings requires clearing the minhash_* tables.
+NEAR_DUPLICATE_ENABLED = True
+NEAR_DUPLICATE_THRESHOLD = 0.85
+NEAR_DUPLICATE_REUSE = False
+SHINGLE_SIZE = 5            # words per shingle
+MINHASH_PERMUTATIONS = 128
+MINHASH_BANDS = 16          # 8 rows per band: 99.4% of pairs at 0.85 share a bucket, 6% at 0.5
+MINHASH_SEED = 1
+
+# Skill normalization (skills.py): skill_aliases.json maps canonical skill
+# names to their spellings and is compiled into an Aho-Corasick automaton.
+# Skills the dictionary finds need no LLM call; with SKILL_LLM_FALLBACK the
+# LLM is asked about skills-section items it does not know, and does the
+# full extraction when it finds no skills at all.
+SKILL_ALIASES_FILE = BASE_DIR / "skill_aliases.json"
+SKILL_LLM_FALLBACK = True
+MAX_SKILLS = 30             # skills kept per resume
+
+# Job-description matching (matching.py): every resume is scored on skill
+# overlap, how recent its experience is and semantic similarity, from
+# per-resume features precomputed into MATCH_FEATURES_FILE. Weights are
+# renormalized when a signal is unavailable (e.g. embeddings not indexed).
+MATCH_FEATURES_FILE = BASE_DIR / "resumes_features.npz"
+MATCH_WEIGHTS = {"skills": 0.5, "semantic": 0.35, "recency": 0.15}
+MATCH_RECENCY_HALF_LIFE = 3.0   # years since the last job until the recency score halves
+
+# Which parser turns resume text into a Resume:
+# - "single_pass": parser.py - one call, PydanticOutputParser format instructions
+# - "two_pass":    parser_production.py - extract + clean per field (8 calls)
+# - "schema":      parser_schema.py - one JSON-schema constrained call,
+#                  two-pass fallback only for fields that fail validation
+PARSER_ENGINE = "two_pass"
+
+PARSER_MODULES = {
+    "single_pass": "parser",
+    "two_pass": "parser_production",
+    "schema": "parser_schema",
+}
+
+
+# ============================================================
+# PIPELINE SETTINGS
+# ============================================================
+
+# Worker processes extracting text from PDF/DOCX files (CPU-bound)
+LOAD_WORKERS = 4
+
+# Per-file limits for text extraction in worker processes
+LOAD_TIMEOUT = 60       # seconds per file (0 = no limit)
+LOAD_MEMORY_MB = 1024   # address space per worker (0 = no limit, Unix only)
+
+# Number of parse workers running AI extraction at the same time
+PARSE_WORKERS = 4
+
+# Cross-resume batching (pipeline mode, two_pass engine): a parse worker takes
+# up to PARSE_BATCH_SIZE queued resumes and sends each extractor's prompts for
+# all of them through one llm.batch (BATCH_CONCURRENCY requests in flight).
+# Routed texts up to PACK_MAX_CHARS are packed PACK_SIZE per prompt with
+# ID-tagged answers; resumes missing from a packed answer are asked alone.
+# PARSE_BATCH_SIZE = 1 parses one resume at a time; PACK_SIZE = 1 turns packing off.
+PARSE_BATCH_SIZE = 8
+BATCH_CONCURRENCY = 8
+PACK_SIZE = 3
+PACK_MAX_CHARS = 1200
+
+# Max items waiting between stages (bounds memory on big batches)
+QUEUE_SIZE = 16
+
+# Max resumes the writer saves in one database transaction
+WRITE_BATCH_SIZE = 32
+
+# Seconds between progress reports in pipeline mode
+REPORT_INTERVAL = 5.0
+
+# Per-stage spans (telemetry.py): one JSON line per span, plus a Prometheus
+# textfile with totals per stage, rewritten during and after each run
+TELEMETRY_ENABLED = True
+TELEMETRY_SPANS_FILE = OUTPUT_FOLDER / "spans.jsonl"
+TELEMETRY_METRICS_FILE = OUTPUT_FOLDER / "metrics.prom"
+
+# Cold-start budget for `import main` in milliseconds, checked by
+# benchmarks/bench_startup.py. LangChain loaders and Ollama clients are
+# imported on first use, so startup is mostly Python + pydantic.
+STARTUP_BUDGET_MS = 300
+
+# Every file gets a row in the jobs table (see jobs.py). A file that failed
+# (or crashed the run) this many times is left in source_folder and skipped.
+JOB_MAX_ATTEMPTS = 3
+
 
 # ============================================================
 # AI EXTRACTION PROMPT
@@ -55,6 +195,42 @@ Return ONLY the JSON, no explanations."""
 # HELPER FUNCTIONS
 # ============================================================
 
+def load_parser(engine: str = None):
+	"""
+	Get the parse_resume function for a parser engine.
+
+	Args:
+	engine: One of PARSER_MODULES (defaults to PARSER_ENGINE)
+
+	Returns:
+	parse_resume(resume_text) -> Resume
+
+	Raises:
+	ValueError: If the engine name is unknown
+	"""
+	return _parser_module(engine).parse_resume
+
+
+def load_batch_parser(engine: str = None):
+	"""
+	Get the cross-resume batch parser of an engine, if it has one.
+
+	Returns:
+	parse_resumes(texts) -> list of Resume (or the Exception for a resume
+	that failed), or None when the engine only parses one resume at a time
+	"""
+	return getattr(_parser_module(engine), "parse_resumes", None)
+
+
+def _parser_module(engine: str = None):
+	engine = engine or PARSER_ENGINE
+	if engine not in PARSER_MODULES:
+		raise ValueError(f"Unknown parser engine: {engine}. Choose from: {', '.join(PARSER_MODULES)}")
+
+	# Imported on demand - each parser builds its own LLM client on first use
+	return importlib.import_module(PARSER_MODULES[engine])
+
+
 def ensure_folders_exist():
 	"""
 	Create source and output folders if they don't exist.
@@ -0,0 +1,261 @@
+"""
+Deterministic Contact Extraction (fast path)
+
+Pulls name, email, phone and city out of the resume header with regexes and
+simple heuristics, and gives each field a confidence score (0.0 - 1.0).
+When every required field is confident, the parser skips the two LLM calls
+for contact info entirely.
+
+Confidence rules (kept deliberately simple):
+- email: one distinct address → 0.95, several → 0.8 (first one wins)
+- phone: labelled ("Phone:", "Cell:") or in the header → 0.95, elsewhere → 0.85,
+         country code other than +1 stripped → 0.9 (0.7 if run into the number),
+         several different numbers → -0.15
+- name:  first header line that looks like 2-4 capitalized words (and has no
+         job title or company word) → 0.85, +0.1 when a name part also appears
+         in the email address
+- location: "Location: City, ..." → 0.9, "City, ST" in the header → 0.8,
+            "City, Region" in the header → 0.6
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import re
+import threading
+from typing import Optional
+from models import ContactInfo
+from config import CONTACT_FAST_PATH_THRESHOLD
+
+
+# How many lines count as the "header" of a resume
+HEADER_LINES = 8
+
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}")
+
+# Digit runs with the usual separators. With a "+" country code any grouping
+# is accepted (+91 80879 96634, +44 20 7946 0958, (+91) 8087996634); without
+# one only the US 3-3-4 shape (+1 (555) 123-4567, 555.123.4567), so tables of
+# numbers aren't read as phones. The digit count is checked after the
+# separators are stripped (_normalize_phone).
+PHONE_RE = re.compile(
+    r"(?<![\w+])(?:\(?\+\d{1,3}\)?(?:[ .-]?\(?\d{2,5}\)?){2,5}"
+    r"|(\+?\(?\+?\d{1,3}\)?[\s.-]?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4})(?!\w)"
+)
+# "+91 ...", "(+91) ...": a country code written apart from the number
+COUNTRY_CODE_RE = re.compile(r"\s*\(?\+(\d{1,3})(?:\)\s?|[ .-])(.+)")
+PHONE_LABEL_RE = re.compile(r"\b(phone|tel|telephone|mobile|cell|contact)\b", re.IGNORECASE)
+
+LOCATION_LABEL_RE = re.compile(r"^\s*(location|address|city)\s*:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+# "Boston, MA" (US state code) and the looser "Pune, Maharashtra"
+CITY_STATE_RE = re.compile(r"\b([A-Z][a-zA-Z.]+(?: [A-Z][a-zA-Z.]+){0,2}), *[A-Z]{2}\b")
+CITY_REGION_RE = re.compile(r"\b([A-Z][a-zA-Z.]+(?: [A-Z][a-zA-Z.]+){0,2}), *[A-Z][a-z]+\b")
+
+NAME_WORD_RE = re.compile(r"^[A-Za-z][A-Za-z.'-]*$")
+
+# Header lines that are never a person's name: section headings, job titles
+# and company names (a title or employer line can sit above the name)
+HEADING_WORDS = {
+    "resume", "curriculum", "vitae", "cv", "contact", "summary", "profile", "objective",
+    "experience", "education", "skills", "professional", "email", "phone", "address",
+    "linkedin", "github", "portfolio",
+}
+TITLE_WORDS = {
+    "software", "engineer", "developer", "manager", "senior", "junior", "lead", "principal",
+    "staff", "intern", "analyst", "architect", "consultant", "designer", "director",
+    "scientist", "specialist", "administrator", "officer", "president", "founder",
+    "associate", "coordinator", "technician", "programmer", "executive", "vp", "ceo", "cto",
+}
+COMPANY_WORDS = {
+    "inc", "llc", "llp", "ltd", "corp", "corporation", "company", "gmbh", "plc", "pvt",
+    "technologies", "technology", "solutions", "systems", "services", "consulting", "group",
+    "labs", "software", "university", "college", "institute", "bank",
+}
+NOT_NAMES = HEADING_WORDS | TITLE_WORDS | COMPANY_WORDS
+
+
+# ============================================================
+# FIELD GUESSERS
+# ============================================================
+
+def guess_email(text: str) -> tuple:
+    """Return (email, confidence)."""
+    emails = list(dict.fromkeys(m.group(0).rstrip(".") for m in EMAIL_RE.finditer(text)))
+    if not emails:
+        return None, 0.0
+    return emails[0].lower(), 0.95 if len(emails) == 1 else 0.8
+
+
+def _normalize_phone(raw: str) -> tuple:
+    """Reduce a phone match to 10 digits (per ContactInfo.phone). Returns (digits, confidence)."""
+    digits = re.sub(r'\D', '', raw)
+    international = COUNTRY_CODE_RE.match(raw)
+    if international:
+        number = re.sub(r'\D', '', international.group(2))
+        if len(number) == 10:
+            # Exactly where the country code ends is known - only non-US is less sure
+            return number, 1.0 if international.group(1) == '1' else 0.9
+    if len(digits) == 10:
+        return digits, 1.0
+    if len(digits) == 11 and digits.startswith('1'):
+        return digits[1:], 1.0
+    if 10 < len(digits) <= 13 and raw.lstrip().startswith(('+', '(+')):
+        # Country code run into the number: keep the last 10 digits, but be less sure
+        return digits[-10:], 0.7
+    return None, 0.0
+
+
+def guess_phone(text: str) -> tuple:
+    """Return (10-digit phone, confidence)."""
+    lines = text.splitlines()
+    found = []
+
+    for index, line in enumerate(lines):
+        for match in PHONE_RE.finditer(line):
+            digits, quality = _normalize_phone(match.group(0))
+            if not digits:
+                continue
+            labelled = PHONE_LABEL_RE.search(line) is not None
+            confidence = 0.95 if labelled or index < HEADER_LINES else 0.85
+            found.append((digits, min(confidence, quality)))
+
+    if not found:
+        return None, 0.0
+
+    digits, confidence = found[0]
+    if len({d for d, _ in found}) > 1:
+        confidence -= 0.15
+    return digits, confidence
+
+
+def guess_name(text: str, email: Optional[str] = None) -> tuple:
+    """Return (name, confidence) from the first name-like header line."""
+    header = [line.strip() for line in text.splitlines() if line.strip()][:HEADER_LINES]
+
+    for line in header:
+        # "Name: Jane Doe"
+        if ':' in line:
+            key, value = line.split(':', 1)
+            if key.strip().lower() != 'name':
+                continue
+            line = value.strip()
+
+        words = line.split()
+        if not 2 <= len(words) <= 4:
+            continue
+        if not all(NAME_WORD_RE.match(w) for w in words):
+            continue
+        if any(w.lower().strip(".") in NOT_NAMES for w in words):
+            continue
+        if not all(w[0].isupper() for w in words):
+            continue
+
+        name = " ".join(w.capitalize() if w.isupper() else w for w in words)
+        confidence = 0.85
+        if email:
+            local = email.split('@')[0].lower()
+            if any(len(w) > 2 and w.lower() in local for w in words):
+                confidence += 0.1
+        return name, confidence
+
+    return None, 0.0
+
+
+def guess_location(text: str) -> tuple:
+    """Return (city, confidence)."""
+    labelled = LOCATION_LABEL_RE.search(text)
+    if labelled:
+        city = labelled.group(2).split(',')[0].strip()
+        if city:
+            return city, 0.9
+
+    header = "\n".join(text.splitlines()[:HEADER_LINES])
+    match = CITY_STATE_RE.search(header)
+    if match:
+        return match.group(1).strip(), 0.8
+
+    match = CITY_REGION_RE.search(header)
+    if match:
+        return match.group(1).strip(), 0.6
+
+    return None, 0.0
+
+
+def guess_contact(text: str) -> dict:
+    """
+    Run every field guesser.
+
+    Returns:
+        {"name": (value, confidence), "email": ..., "phone": ..., "location": ...}
+    """
+    email = guess_email(text)
+    return {
+        "name": guess_name(text, email[0]),
+        "email": email,
+        "phone": guess_phone(text),
+        "location": guess_location(text),
+    }
+
+
+# ============================================================
+# DECISIONS
+# ============================================================
+
+REQUIRED_FIELDS = ("name", "email", "phone")
+
+
+def confident_contact(guess: dict, threshold: float = CONTACT_FAST_PATH_THRESHOLD) -> Optional[ContactInfo]:
+    """
+    Build ContactInfo from the guesses if every required field is confident.
+
+    Returns:
+        ContactInfo, or None when the LLM is needed
+    """
+    if any(guess[field][1] < threshold for field in REQUIRED_FIELDS):
+        return None
+
+    location, location_confidence = guess["location"]
+    return ContactInfo(
+        name=guess["name"][0],
+        email=guess["email"][0],
+        phone=guess["phone"][0],
+        location=location if location_confidence >= threshold else None
+    )
+
+
+def merge_contact(llm_contact: ContactInfo, guess: dict,
+                  threshold: float = CONTACT_FAST_PATH_THRESHOLD) -> ContactInfo:
+    """Prefer confident heuristic values over LLM output, field by field."""
+    values = llm_contact.model_dump()
+    for field, (value, confidence) in guess.items():
+        if value and confidence >= threshold:
+            values[field] = value
+    return ContactInfo(**values)
+
+
+# ============================================================
+# STATISTICS
+# ============================================================
+
+class FastPathStats:
+    """Counts how often contact extraction skipped the LLM."""
+
+    def __init__(self):
+        self.fast = 0
+        self.llm = 0
+        self._lock = threading.Lock()
+
+    def record(self, used_llm: bool):
+        with self._lock:
+            if used_llm:
+                self.llm += 1
+            else:
+                self.fast += 1
+
+    def saved_fraction(self) -> float:
+        """Fraction of contact extractions that needed no LLM call."""
+        total = self.fast + self.llm
+        return self.fast / total if total else 0.0
+
+
+stats = FastPathStats()
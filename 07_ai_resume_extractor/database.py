@@ -7,13 +7,64 @@ Author: Klement
 Date: December 15, 2025
 """
 
+import contextlib
 import sqlite3
 import json
-from typing import List, Optional
+import re
+import threading
+from collections.abc import Mapping
+from typing import Iterable, Iterator, List, Optional
 from models import Resume
 from config import DATABASE_FILE
 
 
+# ============================================================
+# SQL STATEMENTS
+# ============================================================
+
+# Shared by the module functions and ResumeRepository. Using the exact same
+# SQL text lets sqlite3's statement cache reuse the compiled statement.
+INSERT_RESUME_SQL = """
+    INSERT INTO resumes (name, email, phone, location, summary, skills, experience, education,
+                         file_hash, content_hash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SELECT_ALL_SQL = "SELECT * FROM resumes ORDER BY created_at DESC"
+SELECT_BY_ID_SQL = "SELECT * FROM resumes WHERE id = ?"
+FIND_DUPLICATE_SQL = """
+    SELECT id FROM resumes
+    WHERE file_hash = ? OR content_hash = ?
+    ORDER BY id
+    LIMIT 1
+"""
+DELETE_BY_ID_SQL = "DELETE FROM resumes WHERE id = ?"
+
+# Columns iter_resumes() can project, and the ones holding JSON text
+RESUME_COLUMNS = ("id", "name", "email", "phone", "location", "summary", "skills",
+                  "experience", "education", "file_hash", "content_hash", "created_at")
+JSON_COLUMNS = ("skills", "experience", "education")
+
+# Rows fetched per query by iter_resumes()
+PAGE_SIZE = 500
+
+
+def _resume_row(resume: Resume, file_hash: Optional[str] = None,
+                content_hash: Optional[str] = None) -> tuple:
+    """Convert a Resume into the parameter tuple for INSERT_RESUME_SQL."""
+    return (
+        resume.contact.name,
+        resume.contact.email,
+        resume.contact.phone,
+        resume.contact.location,
+        resume.summary,
+        json.dumps(resume.skills),
+        json.dumps([exp.model_dump() for exp in resume.experience]),
+        json.dumps([edu.model_dump() for edu in resume.education]),
+        file_hash,
+        content_hash
+    )
+
+
 # ============================================================
 # DATABASE SETUP
 # ============================================================
@@ -32,9 +83,23 @@ def create_database():
     - skills: JSON list of skills
     - experience: JSON list of job experiences
     - education: JSON list of education entries
+    - file_hash: SHA-256 of the source file bytes (duplicate detection)
+    - content_hash: SHA-256 of the normalized text (duplicate detection)
     - created_at: Timestamp when record was created
+
+    Search tables (kept in sync by triggers):
+    - resumes_fts: FTS5 full-text index over name, email, summary, skills
+    - resume_skills: one (skill, resume_id) row per skill, lowercased
     """
     conn = sqlite3.connect(DATABASE_FILE)
+    _create_tables(conn)
+    conn.commit()
+    conn.close()
+    print(f"✅ Database ready: {DATABASE_FILE}")
+
+
+def _create_tables(conn: sqlite3.Connection):
+    """Create tables and indexes on an open connection (shared with ResumeRepository)."""
     cursor = conn.cursor()
 
     cursor.execute("""
@@ -48,25 +113,111 @@ def create_database():
             skills TEXT,
             experience TEXT,
             education TEXT,
+            file_hash TEXT,
+            content_hash TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     """)
 
-    conn.commit()
-    conn.close()
-    print(f"✅ Database ready: {DATABASE_FILE}")
+    # Add hash columns to databases created before duplicate detection
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(resumes)")}
+    for column in ("file_hash", "content_hash"):
+        if column not in columns:
+            cursor.execute(f"ALTER TABLE resumes ADD COLUMN {column} TEXT")
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_resumes_file_hash ON resumes(file_hash)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_resumes_content_hash ON resumes(content_hash)")
+    # Keyset pagination for iter_resumes() (newest first)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_resumes_created_at ON resumes(created_at, id)")
+
+    _create_search_tables(cursor)
+
+
+# Full-text index over the searchable columns. External content (no copy of the
+# text); the triggers below keep it in sync with every insert/update/delete.
+# prefix='2 3' makes short prefix queries ("pyt*") index lookups too.
+SEARCH_SCHEMA = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS resumes_fts USING fts5(
+        name, email, summary, skills,
+        content='resumes', content_rowid='id', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS resume_skills (
+        skill TEXT NOT NULL,
+        resume_id INTEGER NOT NULL,
+        PRIMARY KEY (skill, resume_id)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_resume_skills_resume_id ON resume_skills(resume_id)",
+    """
+    CREATE TRIGGER IF NOT EXISTS resumes_search_insert AFTER INSERT ON resumes BEGIN
+        INSERT INTO resumes_fts(rowid, name, email, summary, skills)
+        VALUES (new.id, new.name, new.email, new.summary, new.skills);
+        INSERT OR IGNORE INTO resume_skills(skill, resume_id)
+        SELECT lower(trim(value)), new.id
+        FROM json_each(CASE WHEN json_valid(new.skills) THEN new.skills ELSE '[]' END)
+        WHERE trim(value) != '';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS resumes_search_delete AFTER DELETE ON resumes BEGIN
+        INSERT INTO resumes_fts(resumes_fts, rowid, name, email, summary, skills)
+        VALUES ('delete', old.id, old.name, old.email, old.summary, old.skills);
+        DELETE FROM resume_skills WHERE resume_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS resumes_search_update AFTER UPDATE ON resumes BEGIN
+        INSERT INTO resumes_fts(resumes_fts, rowid, name, email, summary, skills)
+        VALUES ('delete', old.id, old.name, old.email, old.summary, old.skills);
+        INSERT INTO resumes_fts(rowid, name, email, summary, skills)
+        VALUES (new.id, new.name, new.email, new.summary, new.skills);
+        DELETE FROM resume_skills WHERE resume_id = old.id;
+        INSERT OR IGNORE INTO resume_skills(skill, resume_id)
+        SELECT lower(trim(value)), new.id
+        FROM json_each(CASE WHEN json_valid(new.skills) THEN new.skills ELSE '[]' END)
+        WHERE trim(value) != '';
+    END
+    """,
+]
+
+
+def _create_search_tables(cursor: sqlite3.Cursor):
+    """Create the FTS5 index, normalized skills table and sync triggers."""
+    existed = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'resumes_fts'"
+    ).fetchone() is not None
+
+    for statement in SEARCH_SCHEMA:
+        cursor.execute(statement)
+
+    # Backfill databases created before the search index existed
+    if not existed:
+        cursor.execute("INSERT INTO resumes_fts(resumes_fts) VALUES ('rebuild')")
+        cursor.execute("""
+            INSERT OR IGNORE INTO resume_skills(skill, resume_id)
+            SELECT lower(trim(j.value)), r.id
+            FROM resumes r,
+                 json_each(CASE WHEN json_valid(r.skills) THEN r.skills ELSE '[]' END) j
+            WHERE trim(j.value) != ''
+        """)
 
 
 # ============================================================
 # SAVE RESUME
 # ============================================================
 
-def save_resume(resume: Resume) -> int:
+def save_resume(resume: Resume, file_hash: Optional[str] = None,
+                content_hash: Optional[str] = None) -> int:
     """
     Save a resume to the database.
 
     Args:
         resume: Resume object with extracted data
+        file_hash: Hash of the source file bytes (from compute_file_hash)
+        content_hash: Hash of the normalized text (from compute_text_hash)
 
     Returns:
         ID of the inserted record
@@ -78,19 +229,7 @@ def save_resume(resume: Resume) -> int:
     cursor = conn.cursor()
 
     try:
-        cursor.execute("""
-            INSERT INTO resumes (name, email, phone, location, summary, skills, experience, education)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            resume.contact.name,
-            resume.contact.email,
-            resume.contact.phone,
-            resume.contact.location,
-            resume.summary,
-            json.dumps(resume.skills),
-            json.dumps([exp.model_dump() for exp in resume.experience]),
-            json.dumps([edu.model_dump() for edu in resume.education])
-        ))
+        cursor.execute(INSERT_RESUME_SQL, _resume_row(resume, file_hash, content_hash))
 
         conn.commit()
         resume_id = cursor.lastrowid
@@ -112,6 +251,9 @@ def get_all_resumes() -> List[dict]:
     """
     Get all resumes from the database.
 
+    Loads the whole table into memory - use iter_resumes() for exports
+    and large tables.
+
     Returns:
         List of dictionaries with resume data
     """
@@ -119,7 +261,7 @@ def get_all_resumes() -> List[dict]:
     conn.row_factory = sqlite3.Row  # Return rows as dictionaries
     cursor = conn.cursor()
 
-    cursor.execute("SELECT * FROM resumes ORDER BY created_at DESC")
+    cursor.execute(SELECT_ALL_SQL)
     rows = cursor.fetchall()
 
     conn.close()
@@ -127,6 +269,113 @@ def get_all_resumes() -> List[dict]:
     return [dict(row) for row in rows]
 
 
+class ResumeRow(Mapping):
+    """
+    Read-only resume row that decodes JSON columns on first access.
+
+    Behaves like a dict: row["name"], row.get("skills"), dict(row).
+    skills/experience/education come back as lists, but json.loads only
+    runs for the ones actually read.
+    """
+
+    __slots__ = ("_row", "_decoded")
+
+    def __init__(self, row: sqlite3.Row):
+        self._row = row
+        self._decoded = {}
+
+    def __getitem__(self, key: str):
+        if key in self._decoded:
+            return self._decoded[key]
+        try:
+            value = self._row[key]
+        except IndexError:
+            raise KeyError(key) from None
+        if key in JSON_COLUMNS:
+            value = json.loads(value) if value else []
+            self._decoded[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._row.keys())
+
+    def __len__(self):
+        return len(self._row)
+
+    def __repr__(self):
+        return f"ResumeRow(id={self._row['id']})"
+
+
+def _select_columns(columns: Optional[Iterable[str]]) -> str:
+    """Validate a column projection; id and created_at are always included (page cursor)."""
+    if columns is None:
+        return ", ".join(RESUME_COLUMNS)
+
+    columns = list(dict.fromkeys(columns))
+    unknown = [c for c in columns if c not in RESUME_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(unknown)}. Choose from: {', '.join(RESUME_COLUMNS)}")
+
+    for column in ("created_at", "id"):
+        if column not in columns:
+            columns.insert(0, column)
+    return ", ".join(columns)
+
+
+def _iter_pages(conn: sqlite3.Connection, columns: Optional[Iterable[str]], page_size: int,
+                lock=None) -> Iterator[ResumeRow]:
+    """
+    Keyset pagination on (created_at, id), newest first.
+
+    Each page is a separate query that starts right after the last row seen,
+    so no OFFSET scan and at most page_size rows in memory at a time.
+    """
+    select = _select_columns(columns)
+    first_page = f"SELECT {select} FROM resumes ORDER BY created_at DESC, id DESC LIMIT ?"
+    next_page = (f"SELECT {select} FROM resumes WHERE (created_at, id) < (?, ?) "
+                 f"ORDER BY created_at DESC, id DESC LIMIT ?")
+
+    cursor = None
+    while True:
+        params = (page_size,) if cursor is None else (*cursor, page_size)
+        with lock or contextlib.nullcontext():
+            rows = conn.execute(first_page if cursor is None else next_page, params).fetchall()
+
+        for row in rows:
+            yield ResumeRow(row)
+
+        if len(rows) < page_size:
+            return
+        cursor = (rows[-1]["created_at"], rows[-1]["id"])
+
+
+def iter_resumes(columns: Optional[Iterable[str]] = None, page_size: int = PAGE_SIZE) -> Iterator[ResumeRow]:
+    """
+    Stream resumes newest first without loading the table into memory.
+
+    Args:
+        columns: Columns to read, e.g. ["name", "email", "skills"]
+                 (None = all; id and created_at are always included)
+        page_size: Rows fetched per query
+
+    Returns:
+        Iterator of ResumeRow (dict-like, JSON columns decoded lazily)
+
+    Raises:
+        ValueError: If a column name is unknown
+
+    Example:
+        for row in iter_resumes(["name", "skills"]):
+            print(row["name"], row["skills"])
+    """
+    conn = sqlite3.connect(DATABASE_FILE)
+    conn.row_factory = sqlite3.Row
+    try:
+        yield from _iter_pages(conn, columns, page_size)
+    finally:
+        conn.close()
+
+
 def get_resume_by_id(resume_id: int) -> Optional[dict]:
     """
     Get a specific resume by ID.
@@ -141,7 +390,7 @@ def get_resume_by_id(resume_id: int) -> Optional[dict]:
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
-    cursor.execute("SELECT * FROM resumes WHERE id = ?", (resume_id,))
+    cursor.execute(SELECT_BY_ID_SQL, (resume_id,))
     row = cursor.fetchone()
 
     conn.close()
@@ -149,32 +398,133 @@ def get_resume_by_id(resume_id: int) -> Optional[dict]:
     return dict(row) if row else None
 
 
-def search_resumes(keyword: str) -> List[dict]:
+def find_duplicate(file_hash: str, content_hash: str) -> Optional[int]:
     """
-    Search resumes by keyword (searches name, email, skills).
+    Find an already-ingested resume with the same file bytes or text.
+
+    Both hash columns are indexed, so this is a fast lookup even on large tables.
 
     Args:
-        keyword: Search term
+        file_hash: Hash of the source file bytes
+        content_hash: Hash of the normalized text
 
     Returns:
-        List of matching resumes
+        ID of the existing resume, or None if this resume is new
     """
     conn = sqlite3.connect(DATABASE_FILE)
-    conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
-    cursor.execute("""
-        SELECT * FROM resumes
-        WHERE name LIKE ? OR email LIKE ? OR skills LIKE ?
-        ORDER BY created_at DESC
-    """, (f"%{keyword}%", f"%{keyword}%", f"%{keyword}%"))
+    cursor.execute(FIND_DUPLICATE_SQL, (file_hash, content_hash))
+    row = cursor.fetchone()
 
-    rows = cursor.fetchall()
     conn.close()
 
+    return row[0] if row else None
+
+
+def _fts_query(text: str, match_any: bool = False) -> str:
+    """
+    Turn user input into a safe FTS5 query.
+
+    Each word becomes a quoted prefix term, so "pyth data" matches
+    "Python" and "database", and FTS5 operators in user input are ignored.
+    """
+    terms = [f'"{word}"*' for word in re.findall(r"\w+", text.lower())]
+    return (" OR " if match_any else " AND ").join(terms)
+
+
+def _search(conn: sqlite3.Connection, query: str = "", skills: Optional[List[str]] = None,
+            limit: Optional[int] = None, match_any: bool = False) -> List[dict]:
+    """Run a ranked search on an open connection (shared with ResumeRepository)."""
+    fts_query = _fts_query(query, match_any) if query.strip() else ""
+    skills = [s.strip().lower() for s in (skills or []) if s.strip()]
+
+    # Text with no searchable words (e.g. "++") matches nothing - not everything
+    if query.strip() and not fts_query and not skills:
+        return []
+
+    # Let FTS5 intersect the skill postings too, so only candidates that
+    # already mention every skill get ranked (EXISTS below keeps it exact)
+    if fts_query and skills:
+        skill_terms = [" ".join(re.findall(r"\w+", skill)) for skill in skills]
+        fts_query = f"({fts_query}) " + " ".join(
+            f'AND skills : "{term}"' for term in skill_terms if term
+        )
+
+    params = []
+    if fts_query:
+        # rank is FTS5's built-in BM25 score (lower = better match)
+        sql = """
+            SELECT r.* FROM resumes_fts
+            JOIN resumes r ON r.id = resumes_fts.rowid
+            WHERE resumes_fts MATCH ?
+        """
+        params.append(fts_query)
+        id_column = "r.id"
+        order = "ORDER BY rank"
+    elif skills:
+        # Walk the first skill's index range backwards (newest first) and probe
+        # the other skills by primary key - LIMIT stops the walk early
+        sql = """
+            SELECT r.* FROM resume_skills s0
+            JOIN resumes r ON r.id = s0.resume_id
+            WHERE s0.skill = ?
+        """
+        params.append(skills[0])
+        skills = skills[1:]
+        id_column = "s0.resume_id"
+        order = "ORDER BY s0.resume_id DESC"
+    else:
+        sql = "SELECT r.* FROM resumes r WHERE 1"
+        id_column = "r.id"
+        order = "ORDER BY r.created_at DESC, r.id DESC"
+
+    # Skill-AND filter: every requested skill must be present
+    for skill in skills:
+        sql += f" AND EXISTS (SELECT 1 FROM resume_skills WHERE skill = ? AND resume_id = {id_column})"
+        params.append(skill)
+
+    sql += f" {order}"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    rows = conn.execute(sql, params).fetchall()
     return [dict(row) for row in rows]
 
 
+def search_resumes(keyword: str = "", skills: Optional[List[str]] = None,
+                   limit: Optional[int] = None, match_any: bool = False) -> List[dict]:
+    """
+    Search resumes with the full-text index (name, email, summary, skills).
+
+    Results are ranked by relevance (BM25). Multiple words must all match
+    unless match_any=True. Skill filters are exact (case-insensitive) and
+    a resume must have ALL of them.
+
+    Args:
+        keyword: Search text, e.g. "senior python" (empty = no text filter;
+                 punctuation only = no match unless skills are given)
+        skills: Required skills, e.g. ["python", "aws"]
+        limit: Max results (None = all)
+        match_any: Match any word instead of all words
+
+    Returns:
+        List of matching resumes, best match first
+
+    Example:
+        search_resumes("data engineer", skills=["python", "sql"], limit=20)
+    """
+    conn = sqlite3.connect(DATABASE_FILE)
+    conn.row_factory = sqlite3.Row
+
+    results = _search(conn, keyword, skills, limit, match_any)
+
+    conn.close()
+
+    return results
+
+
 # ============================================================
 # DELETE OPERATIONS
 # ============================================================
@@ -192,7 +542,7 @@ def delete_resume(resume_id: int) -> bool:
     conn = sqlite3.connect(DATABASE_FILE)
     cursor = conn.cursor()
 
-    cursor.execute("DELETE FROM resumes WHERE id = ?", (resume_id,))
+    cursor.execute(DELETE_BY_ID_SQL, (resume_id,))
     conn.commit()
 
     deleted = cursor.rowcount > 0
@@ -216,3 +566,148 @@ def reset_database():
 
     print(f"✅ Deleted {count} resumes from database")
     return count
+
+
+# ============================================================
+# REPOSITORY (long-lived connection for bulk work)
+# ============================================================
+
+# Applied once per connection. WAL lets readers run while the writer commits,
+# and synchronous=NORMAL is safe with WAL (only the last commit can be lost on
+# power failure, the database is never corrupted).
+CONNECTION_PRAGMAS = [
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",      # 64 MB page cache
+    "PRAGMA mmap_size = 268435456",    # 256 MB memory-mapped reads
+    "PRAGMA busy_timeout = 5000",
+]
+
+
+class ResumeRepository:
+    """
+    Resume storage backed by one long-lived SQLite connection.
+
+    The module functions above open a new connection (and commit) on every
+    call. That is fine for a handful of resumes but dominates bulk loads.
+    The repository keeps a single tuned connection, reuses compiled
+    statements, and saves many resumes in one transaction.
+
+    Usage:
+        with ResumeRepository() as repo:
+            repo.save_resumes(resumes)
+            print(repo.get_resume_by_id(1))
+    """
+
+    def __init__(self, db_file=None):
+        self.db_file = db_file or DATABASE_FILE
+        # check_same_thread=False: created by one thread, used by the pipeline writer.
+        # The lock keeps calls from different threads from interleaving.
+        self.conn = sqlite3.connect(self.db_file, check_same_thread=False, cached_statements=256)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+
+        for pragma in CONNECTION_PRAGMAS:
+            self.conn.execute(pragma)
+
+        with self.conn:
+            _create_tables(self.conn)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Close the underlying connection."""
+        with self._lock:
+            self.conn.close()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Run several statements as one transaction on the shared connection.
+
+        Commits on success, rolls back on error. Used by jobs.JobLedger so a
+        resume and its job status are committed together.
+        """
+        with self._lock, self.conn:
+            yield self.conn
+
+    # -------------------- writes --------------------
+
+    def save_resume(self, resume: Resume, file_hash: Optional[str] = None,
+                    content_hash: Optional[str] = None) -> int:
+        """
+        Save one resume in its own transaction.
+
+        Returns:
+            ID of the inserted record
+        """
+        with self._lock, self.conn:
+            cursor = self.conn.execute(INSERT_RESUME_SQL, _resume_row(resume, file_hash, content_hash))
+            return cursor.lastrowid
+
+    def save_resumes(self, resumes: Iterable) -> int:
+        """
+        Save many resumes in a single transaction with executemany.
+
+        Args:
+            resumes: Iterable of Resume objects, or (resume, file_hash, content_hash) tuples.
+                     Consumed lazily, so a generator never has to fit in memory.
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            sqlite3.Error: If any insert fails (the whole batch is rolled back)
+        """
+        def rows():
+            for item in resumes:
+                if isinstance(item, Resume):
+                    yield _resume_row(item)
+                else:
+                    yield _resume_row(*item)
+
+        with self._lock, self.conn:
+            cursor = self.conn.executemany(INSERT_RESUME_SQL, rows())
+            return cursor.rowcount
+
+    def delete_resume(self, resume_id: int) -> bool:
+        """Delete a resume by ID. Returns True if deleted, False if not found."""
+        with self._lock, self.conn:
+            cursor = self.conn.execute(DELETE_BY_ID_SQL, (resume_id,))
+            return cursor.rowcount > 0
+
+    # -------------------- reads --------------------
+
+    def get_resume_by_id(self, resume_id: int) -> Optional[dict]:
+        """Get a specific resume by ID, or None if not found."""
+        with self._lock:
+            row = self.conn.execute(SELECT_BY_ID_SQL, (resume_id,)).fetchone()
+        return dict(row) if row else None
+
+    def get_all_resumes(self) -> List[dict]:
+        """Get all resumes, newest first."""
+        with self._lock:
+            rows = self.conn.execute(SELECT_ALL_SQL).fetchall()
+        return [dict(row) for row in rows]
+
+    def iter_resumes(self, columns: Optional[Iterable[str]] = None,
+                     page_size: int = PAGE_SIZE) -> Iterator[ResumeRow]:
+        """Stream resumes newest first, one page at a time (see module iter_resumes)."""
+        return _iter_pages(self.conn, columns, page_size, lock=self._lock)
+
+    def search_resumes(self, keyword: str = "", skills: Optional[List[str]] = None,
+                       limit: Optional[int] = None, match_any: bool = False) -> List[dict]:
+        """Ranked full-text + skill-AND search (see module search_resumes)."""
+        with self._lock:
+            return _search(self.conn, keyword, skills, limit, match_any)
+
+    def find_duplicate(self, file_hash: str, content_hash: str) -> Optional[int]:
+        """ID of an existing resume with the same file bytes or text, or None."""
+        with self._lock:
+            row = self.conn.execute(FIND_DUPLICATE_SQL, (file_hash, content_hash)).fetchone()
+        return row[0] if row else None
@@ -4,13 +4,73 @@ Resume File Loader
 Loads resume files (PDF, DOCX, TXT) and extracts raw text.
 Uses LangChain document loaders for format-specific extraction.
 
+Loaders are looked up in the LOADERS registry (extension → loader class)
+and imported on first use, so importing this module stays cheap: a run
+with no PDFs never imports the PDF stack.
+
+load_resume_text adds the extracted-text cache (text_cache.py): files that
+have not changed since their last extraction are not parsed again.
+
 Author: Klement
 Date: December 15, 2025
 """
 
-from langchain_community.document_loaders import TextLoader,PyPDFLoader
-from langchain_community.document_loaders import UnstructuredWordDocumentLoader
 from pathlib import Path
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+from config import LOAD_WORKERS, LOAD_TIMEOUT, LOAD_MEMORY_MB
+import telemetry
+import hashlib
+import importlib
+import signal
+import time
+
+try:
+	import resource  # Unix only
+except ImportError:
+	resource = None
+
+# Extension -> (module, class) of the LangChain loader, imported on first use.
+# Add a format with register_loader(".md", "langchain_community.document_loaders", "TextLoader").
+LOADERS = {
+	".pdf": ("langchain_community.document_loaders", "PyPDFLoader"),
+	".docx": ("langchain_community.document_loaders", "UnstructuredWordDocumentLoader"),
+	".txt": ("langchain_community.document_loaders", "TextLoader"),
+}
+
+SUPPORTED_EXTENSIONS = set(LOADERS)
+
+def register_loader(ext: str, module: str, class_name: str):
+	"""
+	Register (or replace) the loader for a file extension.
+	Args:
+	ext: Extension including the dot, e.g. '.md'
+	module: Module to import the loader from
+	class_name: Loader class name (called with the file path, must have .load())
+	"""
+	ext = ext.lower()
+	LOADERS[ext] = (module, class_name)
+	SUPPORTED_EXTENSIONS.add(ext)
+	get_loader_class.cache_clear()
+
+@lru_cache(maxsize=None)
+def get_loader_class(ext: str):
+	"""
+	Import and return the loader class for an extension (cached after the first call).
+	Args:
+	ext: Extension including the dot, e.g. '.pdf'
+	Returns:
+	Loader class
+	Raises:
+	ValueError: If file type is not supported
+	"""
+	if ext not in LOADERS:
+		raise ValueError(f"Unsupported file type: {ext}. Supported: {', '.join(sorted(LOADERS))}")
+	module, class_name = LOADERS[ext]
+	return getattr(importlib.import_module(module), class_name)
 
 def get_file_extension(file_path: str) -> str:
 	"""
@@ -44,14 +104,7 @@ def load_resume_file(file_path: str) -> str:
 
 	#Detect file type and use appropriate loader
 	ext = get_file_extension(file_path)
-	if ext == ".pdf":
-		loader=PyPDFLoader(file_path)
-	elif ext == ".docx":
-		loader=UnstructuredWordDocumentLoader(file_path)
-	elif ext == ".txt":
-		loader=TextLoader(file_path)
-	else:
-		raise ValueError(f"Unsupported file type: {ext}. Supported: .pdf, .docx, .txt")
+	loader = get_loader_class(ext)(file_path)
 
 
 	# Load Documents and extract text
@@ -60,45 +113,256 @@ def load_resume_file(file_path: str) -> str:
 	text = "\n".join([doc.page_content for doc in docs])
 	return text
 
-def load_all_resumes(source_folder: str) -> dict:
+def load_resume_text(file_path: str, file_hash: str = None) -> str:
 	"""
-	Load all resume files from a folder.
+	load_resume_file through the extracted-text cache (text_cache.py).
+	Unchanged files skip format parsing entirely.
 	Args:
-	source_folder: Path to folder containing resume files 
+	file_path: Path to the resume file
+	file_hash: compute_file_hash of the file, if the caller already has it
 	Returns:
-	Dictionary mapping filename to extracted text
-	Example: {"resume1.pdf": "John Doe\n...", "resume2.docx": "Jane Smith\n..."}
+	Extracted text content as a single string
+	"""
+	cache = _text_cache()
+	if cache is None:
+		return load_resume_file(file_path)
+
+	text = cache.get(file_path, file_hash)
+	if text is None:
+		start = time.perf_counter()
+		text = load_resume_file(file_path)
+		cache.put(file_path, text, time.perf_counter() - start, file_hash)
+	return text
+
+def _text_cache():
+	# Imported on first use, like the loaders
+	from text_cache import get_text_cache
+	return get_text_cache()
+
+def compute_file_hash(file_path: str) -> str:
+	"""
+	Hash the raw bytes of a file (catches exact re-uploads).
+	Args:
+	file_path: Path to the file
+	Returns:
+	SHA-256 hex digest of the file contents
+	"""
+	digest = hashlib.sha256()
+	with open(file_path, "rb") as f:
+		for block in iter(lambda: f.read(1 << 16), b""):
+			digest.update(block)
+	return digest.hexdigest()
+
+def compute_text_hash(text: str) -> str:
+	"""
+	Hash extracted text after normalizing case and whitespace.
+	Catches the same resume saved again as a different PDF/DOCX.
+	Args:
+	text: Text returned by load_resume_file
+	Returns:
+	SHA-256 hex digest of the normalized text
+	"""
+	normalized = " ".join(text.lower().split())
+	return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+def list_resume_files(source_folder: str) -> list:
+	"""
+	List supported resume files in a folder.
+	Args:
+	source_folder: Path to folder containing resume files
+	Returns:
+	List of Paths, sorted by name
+	Raises:
+	FileNotFoundError: If the folder doesn't exist
 	"""
 	folder = Path(source_folder)
 	if not folder.exists():
 		raise FileNotFoundError(f"Folder not found: {source_folder}")
- 
-	results = {}
-	supported_extensions = {".pdf",".docx",".txt"}
 
 	#Get all supporrted files
-	for file_path in folder.iterdir():
-		if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
-			try:
-				text = load_resume_file(str(file_path))
-				results[file_path.name] = text
-				print(f"Loaded {file_path.name}")
-			except Exception as e:
-				print(f"❌ Failed to load {file_path.name}: {e}")
+	return sorted(
+		file_path for file_path in folder.iterdir()
+		if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_EXTENSIONS
+	)
 
-	return results
- 
+def iter_resume_files(source_folder: str, files=None, on_error=None, file_hashes=None):
+	"""
+	Lazily load resume files from a folder, one at a time.
+	Args:
+	source_folder: Path to folder containing resume files
+	files: Paths to load instead of every file in the folder
+	on_error: Optional callback(filename, message) for files that fail to load
+	file_hashes: Optional filename -> compute_file_hash, for the text cache
+	Yields:
+	(filename, extracted text) tuples - files that fail to load are skipped
+	"""
+	if files is None:
+		files = list_resume_files(source_folder)
+	file_hashes = file_hashes or {}
 
+	for file_path in files:
+		try:
+			with telemetry.trace(file_path.name), telemetry.span("load", ext=file_path.suffix.lower()):
+				text = load_resume_text(str(file_path), file_hashes.get(file_path.name))
+		except Exception as e:
+			print(f"❌ Failed to load {file_path.name}: {e}")
+			if on_error:
+				on_error(file_path.name, str(e) or type(e).__name__)
+			continue
+		print(f"Loaded {file_path.name}")
+		yield file_path.name, text
+
+def load_all_resumes(source_folder: str) -> dict:
+	"""
+	Load all resume files from a folder.
+	Args:
+	source_folder: Path to folder containing resume files 
+	Returns:
+	Dictionary mapping filename to extracted text
+	Example: {"resume1.pdf": "John Doe\n...", "resume2.docx": "Jane Smith\n..."}
+	"""
+	return dict(iter_resume_files(source_folder))
 
 
+# ============================================================
+# PROCESS-POOL EXTRACTION
+# ============================================================
 
+def _limit_worker_memory(memory_mb: int):
+	"""
+	Pool initializer: let the worker grow by at most memory_mb.
+	A huge PDF then fails with MemoryError in its worker instead of
+	swapping the whole machine.
+	"""
+	if resource is None or not memory_mb:
+		return
 
+	# Workers start with the parent's imports already mapped, so the cap is
+	# added on top of the current address space size
+	try:
+		with open("/proc/self/statm") as f:
+			current = int(f.read().split()[0]) * resource.getpagesize()
+	except (OSError, ValueError):
+		current = 0
+	limit = current + memory_mb * 1024 * 1024
+	resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
 
+def _on_timeout(signum, frame):
+	raise TimeoutError("text extraction timed out")
+
+def _extract_text_worker(file_path: str, timeout: int) -> tuple:
+	"""
+	Runs in a worker process: load_resume_file with a time limit.
+	Each worker is its own process, so SIGALRM only interrupts this file.
+	Returns (text, seconds) - the parent records the load span.
+	"""
+	use_alarm = timeout and hasattr(signal, "SIGALRM")
+	if use_alarm:
+		signal.signal(signal.SIGALRM, _on_timeout)
+		signal.alarm(timeout)
+	start = time.perf_counter()
+	try:
+		return load_resume_file(file_path), time.perf_counter() - start
+	finally:
+		if use_alarm:
+			signal.alarm(0)
+
+def iter_resumes_parallel(source_folder: str, workers: int = LOAD_WORKERS,
+		timeout: int = LOAD_TIMEOUT, memory_mb: int = LOAD_MEMORY_MB, files=None, on_error=None,
+		file_hashes=None):
+	"""
+	Extract text from resume files in a pool of worker processes.
+	PDF/DOCX parsing is CPU-bound, so processes (not threads) give real
+	parallelism. Results stream back as soon as each file finishes.
+	One pathological file cannot stall the batch:
+	- each file has a timeout (seconds)
+	- each worker has a memory cap (MB)
+	- if a worker crashes, the pool is restarted and the files that were
+	  in flight are retried once before being skipped
+	Files found in the text cache are yielded without going to a worker.
+	Args:
+	source_folder: Path to folder containing resume files
+	workers: Number of worker processes
+	timeout: Max seconds per file (0 = no limit)
+	memory_mb: Max memory per worker in MB (0 = no limit)
+	files: Paths to load instead of every file in the folder
+	on_error: Optional callback(filename, message) for files that fail to load
+	file_hashes: Optional filename -> compute_file_hash, for the text cache
+	Yields:
+	(filename, extracted text) tuples in completion order - failures are printed and skipped
+	"""
+	if files is None:
+		files = list_resume_files(source_folder)
+	file_hashes = file_hashes or {}
+	cache = _text_cache()
 
+	pending = deque(files)
+	suspects = deque()
 
+	while pending or suspects:
+		# After a crash, re-run the files that were in flight one at a time,
+		# so the next crash points at exactly one file
+		isolate = bool(suspects)
+		todo = suspects if isolate else pending
+		max_in_flight = 1 if isolate else workers * 2
 
+		# "spawn": forking is unsafe when the caller runs threads (pipeline mode)
+		with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+				initializer=_limit_worker_memory, initargs=(memory_mb,)) as pool:
+			in_flight = {}
+			submitted = {}
+			broken = False
 
+			while (todo or in_flight) and not broken:
+				# Keep a small backlog per worker instead of submitting everything
+				while todo and len(in_flight) < max_in_flight:
+					file_path = todo.popleft()
 
+					# Unchanged since it was last extracted - no worker needed
+					start = time.perf_counter()
+					text = cache.get(file_path, file_hashes.get(file_path.name)) if cache and not isolate else None
+					if text is not None:
+						telemetry.record_span("load", time.perf_counter() - start, trace_id=file_path.name,
+							ext=file_path.suffix.lower(), cached=True)
+						print(f"Loaded {file_path.name} (cached)")
+						yield file_path.name, text
+						continue
 
+					future = pool.submit(_extract_text_worker, str(file_path), timeout)
+					in_flight[future] = file_path
+					submitted[future] = time.perf_counter()
 
+				done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+				for future in done:
+					file_path = in_flight.pop(future)
+					waited = time.perf_counter() - submitted.pop(future)
+					try:
+						text, seconds = future.result()
+					except BrokenProcessPool:
+						broken = True
+						in_flight[future] = file_path
+						continue
+					except Exception as e:
+						message = str(e) or type(e).__name__
+						telemetry.record_span("load", waited, trace_id=file_path.name, error=message,
+							ext=file_path.suffix.lower())
+						print(f"❌ Failed to load {file_path.name}: {message}")
+						if on_error:
+							on_error(file_path.name, message)
+						continue
+					telemetry.record_span("load", seconds, trace_id=file_path.name, ext=file_path.suffix.lower(),
+						queued_ms=round((waited - seconds) * 1000, 3))
+					if cache:
+						cache.put(file_path, text, seconds, file_hashes.get(file_path.name))
+					print(f"Loaded {file_path.name}")
+					yield file_path.name, text
 
+		# A worker died (e.g. killed by the OS) and took the pool with it
+		if broken:
+			for file_path in in_flight.values():
+				if isolate:
+					print(f"❌ Failed to load {file_path.name}: worker process crashed")
+					if on_error:
+						on_error(file_path.name, "worker process crashed")
+				else:
+					suspects.append(file_path)
@@ -0,0 +1,181 @@
+"""
+Job Ledger - crash-safe, resumable batch runs
+
+Every source file gets a row in the `jobs` table (same SQLite file as the
+resumes) that records how far it got:
+
+    pending → extracting → parsing → saved
+                  ↘           ↘
+                    failed (attempts, last_error)
+
+- The parsed Resume is stored in the job row as soon as the LLM returns, so a
+  run killed before the save finishes saves it next time without any LLM calls
+- A resume and its job's "saved" status are committed in one transaction
+- Source files are deleted only after that commit; a file whose job is
+  already "saved" is simply deleted on the next run
+- Files that failed JOB_MAX_ATTEMPTS times are skipped (left in source_folder)
+
+A job is keyed by filename; if the file's bytes change, the job starts over.
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+from typing import Iterable, Optional
+from models import Resume
+from config import JOB_MAX_ATTEMPTS
+from database import ResumeRepository, INSERT_RESUME_SQL, _resume_row
+import telemetry
+
+
+# Job statuses
+PENDING = "pending"
+EXTRACTING = "extracting"
+PARSING = "parsing"
+SAVED = "saved"
+FAILED = "failed"
+
+JOBS_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS jobs (
+        filename TEXT PRIMARY KEY,
+        file_hash TEXT NOT NULL,
+        content_hash TEXT,
+        status TEXT NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        last_error TEXT,
+        result TEXT,
+        resume_id INTEGER,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)",
+]
+
+SELECT_JOB_SQL = "SELECT * FROM jobs WHERE filename = ?"
+RESET_JOB_SQL = """
+    INSERT OR REPLACE INTO jobs (filename, file_hash, status, attempts)
+    VALUES (?, ?, 'pending', 0)
+"""
+SET_STATUS_SQL = """
+    UPDATE jobs SET status = ?, attempts = attempts + ?, updated_at = CURRENT_TIMESTAMP
+    WHERE filename = ?
+"""
+STORE_RESULT_SQL = """
+    UPDATE jobs SET content_hash = ?, result = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE filename = ?
+"""
+FAIL_JOB_SQL = """
+    UPDATE jobs SET status = 'failed', last_error = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE filename = ?
+"""
+SAVE_JOB_SQL = """
+    UPDATE jobs SET status = 'saved', content_hash = ?, resume_id = ?, result = NULL,
+                    last_error = NULL, updated_at = CURRENT_TIMESTAMP
+    WHERE filename = ?
+"""
+
+
+class JobLedger:
+    """
+    Per-file job state stored next to the resumes.
+
+    Shares the ResumeRepository connection, so saving a resume and marking
+    its job "saved" happen in the same transaction. Thread-safe (the
+    repository serializes access to the connection).
+
+    Usage:
+        with ResumeRepository() as repo:
+            ledger = JobLedger(repo)
+            job = ledger.begin("resume1.pdf", file_hash)
+    """
+
+    def __init__(self, repo: ResumeRepository, max_attempts: int = JOB_MAX_ATTEMPTS):
+        self.repo = repo
+        self.max_attempts = max_attempts
+        with self.repo.transaction() as conn:
+            for statement in JOBS_SCHEMA:
+                conn.execute(statement)
+
+    # -------------------- lookups --------------------
+
+    def get(self, filename: str) -> Optional[dict]:
+        """Job row for a file, or None."""
+        with self.repo.transaction() as conn:
+            row = conn.execute(SELECT_JOB_SQL, (filename,)).fetchone()
+        return dict(row) if row else None
+
+    def begin(self, filename: str, file_hash: str) -> dict:
+        """
+        Get the job for a file, starting a fresh one if the file is new or changed.
+
+        Returns:
+            Job row as a dict (status, attempts, last_error, result, ...)
+        """
+        with self.repo.transaction() as conn:
+            row = conn.execute(SELECT_JOB_SQL, (filename,)).fetchone()
+            if row is None or row["file_hash"] != file_hash:
+                conn.execute(RESET_JOB_SQL, (filename, file_hash))
+                row = conn.execute(SELECT_JOB_SQL, (filename,)).fetchone()
+        return dict(row)
+
+    def exhausted(self, job: dict) -> bool:
+        """True if the job is unfinished and has used up its attempts."""
+        return job["status"] != SAVED and job["attempts"] >= self.max_attempts
+
+    @staticmethod
+    def stored_result(job: dict) -> Optional[Resume]:
+        """Resume parsed by an earlier run that never got saved, or None."""
+        if not job.get("result"):
+            return None
+        return Resume.model_validate_json(job["result"])
+
+    def counts(self) -> dict:
+        """Number of jobs per status."""
+        with self.repo.transaction() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    # -------------------- checkpoints --------------------
+
+    def mark(self, filename: str, status: str, new_attempt: bool = False):
+        """Move a job to a new status (new_attempt=True counts a new try)."""
+        with self.repo.transaction() as conn:
+            conn.execute(SET_STATUS_SQL, (status, int(new_attempt), filename))
+
+    def store_result(self, filename: str, resume: Resume, content_hash: str):
+        """Checkpoint the LLM output so it is never requested again for this file."""
+        with self.repo.transaction() as conn:
+            conn.execute(STORE_RESULT_SQL, (content_hash, resume.model_dump_json(), filename))
+
+    def fail(self, filename: str, error):
+        """Mark a job failed with its error message."""
+        message = str(error) or type(error).__name__
+        with self.repo.transaction() as conn:
+            conn.execute(FAIL_JOB_SQL, (message[:1000], filename))
+
+    def save(self, items: Iterable[tuple]) -> list:
+        """
+        Save resumes and mark their jobs "saved" in a single transaction.
+
+        Args:
+            items: (filename, resume, file_hash, content_hash, existing_id) tuples.
+                   resume=None records a duplicate of existing_id without inserting.
+
+        Returns:
+            Resume ID for each item, in order
+
+        Raises:
+            sqlite3.Error: If anything fails (nothing from the batch is committed)
+        """
+        items = list(items)
+        ids = []
+        with telemetry.span("save", rows=len(items)), self.repo.transaction() as conn:
+            for filename, resume, file_hash, content_hash, existing_id in items:
+                resume_id = existing_id
+                if resume is not None:
+                    cursor = conn.execute(INSERT_RESUME_SQL, _resume_row(resume, file_hash, content_hash))
+                    resume_id = cursor.lastrowid
+                conn.execute(SAVE_JOB_SQL, (content_hash, resume_id, filename))
+                ids.append(resume_id)
+        return ids
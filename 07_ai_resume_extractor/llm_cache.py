@@ -0,0 +1,172 @@
+"""
+Persistent LLM Response Cache
+
+Stores LLM responses on disk (SQLite) so re-running the same corpus while
+tuning the parsers never hits Ollama for a prompt it has already answered.
+
+- Key: SHA-256 of LangChain's llm_string (model name, temperature, format, ...)
+  plus the prompt, so changing the model or temperature never returns stale answers
+- Size-bounded: least recently used entries are evicted past max_entries
+- Hit/miss counters for reporting
+
+Plugged into ChatOllama through LangChain's standard cache hook:
+    llm = ChatOllama(model=MODEL_NAME, temperature=TEMPERATURE, cache=get_llm_cache())
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Optional, Sequence
+from langchain_core.caches import BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+from config import LLM_CACHE_ENABLED, LLM_CACHE_FILE, LLM_CACHE_MAX_ENTRIES
+
+
+def _dump_generations(generations: Sequence[Generation]) -> str:
+    """Serialize generations (chat messages keep content and token usage)."""
+    return json.dumps([
+        {"message": message_to_dict(g.message)} if isinstance(g, ChatGeneration) else {"text": g.text}
+        for g in generations
+    ])
+
+
+def _load_generations(response: str) -> list:
+    """Inverse of _dump_generations."""
+    return [
+        ChatGeneration(message=messages_from_dict([item["message"]])[0]) if "message" in item
+        else Generation(text=item["text"])
+        for item in json.loads(response)
+    ]
+
+
+class BoundedSQLiteCache(BaseCache):
+    """LRU-bounded LangChain cache stored in a SQLite file."""
+
+    def __init__(self, db_file=LLM_CACHE_FILE, max_entries: int = LLM_CACHE_MAX_ENTRIES):
+        self.db_file = db_file
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # One connection shared by parse workers and llm.batch threads
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache(last_used)")
+        self._size = self.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        """Hash of model settings + prompt."""
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        """Return cached generations, or None on a miss."""
+        key = self._key(prompt, llm_string)
+        with self._lock:
+            row = self.conn.execute("SELECT response FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            generations = _load_generations(row[0])
+        except (ValueError, KeyError, TypeError):
+            generations = None
+
+        with self._lock, self.conn:
+            if generations is None:
+                # Unreadable entry - a miss, and dropped so the fresh answer replaces it
+                self.misses += 1
+                # (unless another thread already replaced it)
+                if self.conn.execute("DELETE FROM llm_cache WHERE key = ? AND response = ?", (key, row[0])).rowcount:
+                    self._size -= 1
+                return None
+
+            self.hits += 1
+            self.conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (time.time(), key))
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        """Store generations and evict the least recently used entries if over the limit."""
+        key = self._key(prompt, llm_string)
+        response = _dump_generations(return_val)
+
+        with self._lock, self.conn:
+            exists = self.conn.execute("SELECT 1 FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, last_used) VALUES (?, ?, ?)",
+                (key, response, time.time())
+            )
+            if not exists:
+                self._size += 1
+
+            if self._size > self.max_entries:
+                # Evict 10% extra so we don't evict on every single insert
+                excess = self._size - self.max_entries + max(1, self.max_entries // 10)
+                self.conn.execute("""
+                    DELETE FROM llm_cache WHERE key IN (
+                        SELECT key FROM llm_cache ORDER BY last_used LIMIT ?
+                    )
+                """, (excess,))
+                self.evictions += excess
+                self._size -= excess
+
+    def clear(self, **kwargs) -> None:
+        """Delete every cached response."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM llm_cache")
+            self._size = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters for this process."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": self._size,
+            "evictions": self.evictions,
+        }
+
+
+# ============================================================
+# SHARED INSTANCE
+# ============================================================
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[BoundedSQLiteCache]:
+    """
+    Get the cache shared by all parsers (None when LLM_CACHE_ENABLED is False).
+
+    Returns:
+        BoundedSQLiteCache instance, or None to disable caching
+    """
+    global _cache
+    if not LLM_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = BoundedSQLiteCache()
+    return _cache
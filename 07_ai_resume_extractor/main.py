@@ -7,15 +7,43 @@ Orchestrates the entire resume extraction pipeline:
 3. Save to database
 4. Delete processed files
 
+Run with --pipeline to process files concurrently (see pipeline.py):
+    python main.py --pipeline --workers 8
+
 Author: Klement
 Date: December 15, 2025
 """
 
+import argparse
+import sys
 from pathlib import Path
-from config import SOURCE_FOLDER, ensure_folders_exist
-from file_loader import load_all_resumes
-from parser_production import parse_resume
-from database import create_database, save_resume
+from config import (SOURCE_FOLDER, LOAD_WORKERS, PARSE_WORKERS, PARSE_BATCH_SIZE, QUEUE_SIZE, PARSER_ENGINE,
+                    PARSER_MODULES, JOB_MAX_ATTEMPTS, VECTOR_INDEX_ENABLED, NEAR_DUPLICATE_ENABLED, NEAR_DUPLICATE_REUSE,
+                    ensure_folders_exist, load_parser)
+from file_loader import list_resume_files, load_resume_text, compute_file_hash, compute_text_hash
+from database import create_database, ResumeRepository
+from jobs import JobLedger, EXTRACTING, PARSING, SAVED
+import contact_heuristics
+import telemetry
+
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Extract structured data from resumes")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Process files concurrently with a pool of parse workers")
+    parser.add_argument("--workers", type=int, default=PARSE_WORKERS,
+                        help=f"Parse workers in pipeline mode (default: {PARSE_WORKERS})")
+    parser.add_argument("--load-workers", type=int, default=LOAD_WORKERS,
+                        help=f"Processes extracting PDF/DOCX text in pipeline mode (default: {LOAD_WORKERS})")
+    parser.add_argument("--parse-batch", type=int, default=PARSE_BATCH_SIZE,
+                        help=f"Resumes parsed together per worker in pipeline mode, two_pass engine "
+                             f"(default: {PARSE_BATCH_SIZE}, 1 = one at a time)")
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE,
+                        help=f"Max items buffered between stages (default: {QUEUE_SIZE})")
+    parser.add_argument("--engine", choices=list(PARSER_MODULES), default=PARSER_ENGINE,
+                        help=f"Parser engine (default: {PARSER_ENGINE})")
+    return parser.parse_args()
 
 
 def main():
@@ -24,11 +52,16 @@ def main():
 
     Workflow:
     1. Ensure folders and database exist
-    2. Load all resumes from source_folder/
-    3. Parse each resume with AI
+    2. Find resumes in source_folder/
+    3. Extract text and parse each resume with AI
     4. Save to database
-    5. Delete processed files
+    5. Delete processed files (only after the save is committed)
+
+    Progress is recorded per file in the job ledger (jobs.py), so an
+    interrupted run picks up where it stopped without repeating AI work.
     """
+    args = parse_args()
+
     print("=" * 60)
     print("AI RESUME EXTRACTOR")
     print("=" * 60)
@@ -38,49 +71,233 @@ def main():
     ensure_folders_exist()
     create_database()
 
-    # Step 2: Load resumes
+    if args.pipeline:
+        run_pipelined(args.workers, args.load_workers, args.queue_size, args.engine, args.parse_batch)
+        return
+
+    # Step 2: Find resumes
     print(f"\n📂 Loading resumes from {SOURCE_FOLDER}...")
-    resumes_text = load_all_resumes(str(SOURCE_FOLDER))
+    files = list_resume_files(str(SOURCE_FOLDER))
 
-    if not resumes_text:
+    if not files:
         print("📭 No resumes found in source_folder/")
         print("💡 Drop PDF, DOCX, or TXT files in source_folder/ and run again")
         return
 
-    print(f"✅ Found {len(resumes_text)} resume(s)")
+    print(f"✅ Found {len(files)} resume(s)")
+    parse_resume = load_parser(args.engine)
 
-    # Step 3: Process each resume
+    # Step 3: Process each resume (every step is checkpointed in the job ledger)
     print("\n🤖 Processing with AI...")
     success_count = 0
+    duplicate_count = 0
+    recovered_count = 0
+    skipped_count = 0
+    near_count = 0
     fail_count = 0
 
-    for filename, text in resumes_text.items():
-        print(f"\n📄 Processing: {filename}")
+    with ResumeRepository() as repo:
+        ledger = JobLedger(repo)
+        near = open_near_duplicates(repo)
+
+        for file_path in files:
+            filename = file_path.name
+            print(f"\n📄 Processing: {filename}")
+
+            try:
+                # One trace per file: load, extract_*, validate and save spans
+                with telemetry.trace(filename), telemetry.span("resume") as resume_span:
+                    file_hash = compute_file_hash(str(file_path))
+                    job = ledger.begin(filename, file_hash)
+
+                    # Saved by an earlier run that stopped before deleting the file
+                    if job["status"] == SAVED:
+                        file_path.unlink()
+                        print(f"🗑️  Already saved as resume ID {job['resume_id']} - deleted {filename}")
+                        recovered_count += 1
+                        continue
+
+                    if ledger.exhausted(job):
+                        print(f"⏭️  Failed {job['attempts']} times ({job['last_error']}) - skipping")
+                        skipped_count += 1
+                        continue
 
-        try:
-            # Parse with AI
-            resume_data = parse_resume(text)
+                    # An earlier run already tried this file
+                    if job["attempts"]:
+                        resume_span.add(retries=1)
 
-            # Save to database
-            save_resume(resume_data)
+                    # Parsed by an earlier run but never saved - no AI calls
+                    resume_data = ledger.stored_result(job)
+                    if resume_data is not None:
+                        ledger.mark(filename, PARSING, new_attempt=True)
+                        content_hash = job["content_hash"]
+                        print("♻️  Using the result parsed by an earlier run")
+                        recovered_count += 1
+                    else:
+                        ledger.mark(filename, EXTRACTING, new_attempt=True)
+                        with telemetry.span("load", ext=file_path.suffix.lower()):
+                            text = load_resume_text(str(file_path), file_hash)
 
-            # Delete source file
-            file_path = SOURCE_FOLDER / filename
-            file_path.unlink()
-            print(f"🗑️  Deleted: {filename}")
+                        # Skip resumes that are already in the database (no AI calls)
+                        content_hash = compute_text_hash(text)
+                        existing_id = repo.find_duplicate(file_hash, content_hash)
 
-            success_count += 1
+                        if existing_id is not None:
+                            print(f"♻️  Duplicate of resume ID {existing_id} - skipping AI parsing")
+                            ledger.save([(filename, None, file_hash, content_hash, existing_id)])
+                            file_path.unlink()
+                            print(f"🗑️  Deleted: {filename}")
+                            duplicate_count += 1
+                            continue
 
-        except Exception as e:
-            print(f"❌ Failed to process {filename}: {e}")
-            fail_count += 1
+                        # Slightly edited copy of a saved resume? Flag it (or reuse the saved one)
+                        signature = near_match = None
+                        if near is not None:
+                            with telemetry.span("near_duplicate"):
+                                signature = near.signature(text)
+                                near_match = near.find(signature)
+                        if near_match is not None:
+                            near_id, similarity = near_match
+                            print(f"🪞 Near-duplicate of resume ID {near_id} ({similarity:.0%} similar)")
+                            near_count += 1
+                            if NEAR_DUPLICATE_REUSE:
+                                ledger.save([(filename, None, file_hash, content_hash, near_id)])
+                                file_path.unlink()
+                                print(f"🗑️  Reused resume ID {near_id} - deleted {filename}")
+                                duplicate_count += 1
+                                continue
+
+                        # Parse with AI, checkpoint the result right away
+                        ledger.mark(filename, PARSING)
+                        resume_data = parse_resume(text)
+                        ledger.store_result(filename, resume_data, content_hash)
+                        if signature is not None:
+                            near.add(content_hash, signature, near_match)
+                        success_count += 1
+
+                    # Save to database (resume + job status in one transaction)
+                    resume_id = ledger.save([(filename, resume_data, file_hash, content_hash, None)])[0]
+                    print(f"✅ Saved: {resume_data.contact.name} (ID: {resume_id})")
+                    index_for_search([resume_id], [resume_data])
+
+                    # Delete source file only after the commit
+                    file_path.unlink()
+                    print(f"🗑️  Deleted: {filename}")
+
+            except Exception as e:
+                print(f"❌ Failed to process {filename}: {e}")
+                ledger.fail(filename, e)
+                fail_count += 1
 
     # Step 4: Summary
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
     print(f"✅ Successfully processed: {success_count}")
+    print(f"♻️  Duplicates skipped: {duplicate_count}")
+    print(f"🪞 Near-duplicates flagged: {near_count}")
+    print(f"🔁 Resumed from an earlier run: {recovered_count}")
     print(f"❌ Failed: {fail_count}")
+    print(f"⏭️  Skipped after {JOB_MAX_ATTEMPTS} failed attempts: {skipped_count}")
+    print_cache_stats()
+    print_text_cache_stats()
+    print_fast_path_stats()
+    print_telemetry()
+    print(f"💾 Database: {create_database.__globals__['DATABASE_FILE']}")
+    print("=" * 60)
+
+
+def open_near_duplicates(repo: ResumeRepository):
+    """MinHash near-duplicate index on the repository's connection, or None if disabled."""
+    if not NEAR_DUPLICATE_ENABLED:
+        return None
+    # NumPy is only imported once there are resumes to process
+    from near_duplicates import NearDuplicateIndex
+    return NearDuplicateIndex(repo)
+
+
+def index_for_search(resume_ids: list, resumes: list):
+    """Embed saved resumes into the semantic search index (vector_index.py)."""
+    if not VECTOR_INDEX_ENABLED:
+        return
+    # NumPy and the embedding client are only imported once something is saved
+    import vector_index
+    vector_index.try_index_resumes(resume_ids, resumes)
+
+
+def print_cache_stats():
+    """Print LLM cache hits/misses for this run (if the cache is enabled)."""
+    # The cache module is only imported once a parser has made an LLM client
+    llm_cache = sys.modules.get("llm_cache")
+    cache = llm_cache.get_llm_cache() if llm_cache else None
+    if cache is None:
+        return
+    stats = cache.stats()
+    print(f"🧠 LLM cache: {stats['hits']} hits, {stats['misses']} misses "
+          f"({stats['hit_rate']:.0%} hit rate, {stats['entries']} entries)")
+
+
+def print_text_cache_stats():
+    """Print extracted-text cache hits/misses for this run (if the cache is enabled)."""
+    # Only imported once a file has been loaded
+    text_cache = sys.modules.get("text_cache")
+    cache = text_cache.get_text_cache() if text_cache else None
+    if cache is None:
+        return
+    stats = cache.stats()
+    print(f"📦 Text cache: {stats['hits']} hits, {stats['misses']} misses "
+          f"({stats['seconds_saved']:.1f}s of extraction saved, {stats['entries']} entries, "
+          f"{stats['stored_mb']:.1f} MB)")
+
+
+def print_fast_path_stats():
+    """Print how many contact extractions skipped the LLM (two-pass engine only)."""
+    stats = contact_heuristics.stats
+    total = stats.fast + stats.llm
+    if not total:
+        return
+    print(f"⚡ Contact fast path: {stats.fast}/{total} resumes without LLM "
+          f"({stats.saved_fraction():.0%} of contact LLM calls saved)")
+
+
+def print_telemetry():
+    """Write the metrics file and print time spent per stage."""
+    telemetry.write_metrics()
+    telemetry.print_summary()
+
+
+def run_pipelined(workers: int, load_workers: int, queue_size: int, engine: str, parse_batch: int = 1):
+    """Run the concurrent pipeline and print the same summary as serial mode."""
+    from pipeline import run_pipeline
+
+    print(f"\n🚀 Pipeline mode: {load_workers} load processes, {workers} parse workers, "
+          f"queue size {queue_size}, engine {engine}, parse batch {parse_batch}")
+    stats = run_pipeline(SOURCE_FOLDER, workers=workers, load_workers=load_workers,
+                         queue_size=queue_size, engine=engine, parse_batch=parse_batch)
+
+    if stats["load"].processed == 0 and stats["recovered"] == 0:
+        print("📭 No resumes found in source_folder/")
+        print("💡 Drop PDF, DOCX, or TXT files in source_folder/ and run again")
+        return
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    print(f"✅ Successfully processed: {stats['save'].processed - stats['duplicates']}")
+    print(f"♻️  Duplicates skipped: {stats['duplicates']}")
+    print(f"🪞 Near-duplicates flagged: {stats['near_duplicates']}")
+    print(f"🔁 Resumed from an earlier run: {stats['recovered']}")
+    print(f"❌ Failed: {stats['parse'].failed + stats['save'].failed}")
+    print(f"⏭️  Skipped after {JOB_MAX_ATTEMPTS} failed attempts: {stats['skipped']}")
+    print(f"⏸️  Left for the next run (a copy failed): {stats['deferred']}")
+    for name in ("load", "parse", "save"):
+        stage = stats[name]
+        print(f"⏱️  {name}: {stage.throughput(stats['elapsed']):.2f} files/s, "
+              f"{stage.busy_seconds:.1f}s busy")
+    print_cache_stats()
+    print_text_cache_stats()
+    print_fast_path_stats()
+    print_telemetry()
     print(f"💾 Database: {create_database.__globals__['DATABASE_FILE']}")
     print("=" * 60)
 
@@ -0,0 +1,417 @@
+"""
+Job-Description Matching
+
+Ranks every stored resume against a job description on three signals:
+
+- skills:   fraction of the JD's skills the resume lists (canonical names, skills.py)
+- recency:  how recently the candidate's last job ended (halves every
+            MATCH_RECENCY_HALF_LIFE years; "Present" counts as this year)
+- semantic: cosine similarity of the JD to the resume's embedding
+            (vector_index.py - skipped if the index or Ollama is unavailable)
+
+combined with MATCH_WEIGHTS. Nothing is parsed at query time: skills and the
+last-job year of every resume are precomputed into MATCH_FEATURES_FILE
+(a CSR skill matrix + one float per resume) and rebuilt when the resumes
+table changes. A query is a few NumPy passes over those arrays - a
+bincount for skill overlap, one vector scan - and argpartition for the top k,
+so 100k candidates rank in well under a second.
+
+Usage:
+    from matching import match_candidates
+    for match in match_candidates(open("jd.txt").read(), k=20):
+        print(match["score"], match["name"], match["matched_skills"])
+
+    python matching.py jd.txt [k]      # rank from the command line
+    python matching.py --rebuild       # recompute the feature file
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import datetime
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional
+import numpy as np
+from config import (DATABASE_FILE, VECTOR_INDEX_ENABLED, MATCH_FEATURES_FILE, MATCH_WEIGHTS,
+                    MATCH_RECENCY_HALF_LIFE)
+from skills import get_skill_dictionary, skill_key
+
+
+# Longest skill name (in words) looked for in job description text
+MAX_SKILL_WORDS = 4
+
+_YEAR_RE = re.compile(r"\b(19[5-9]\d|20\d\d)\b")
+_PRESENT_RE = re.compile(r"\b(present|current|now|today|ongoing)\b", re.IGNORECASE)
+# Words of a job description: split on spaces and list separators, keep
+# punctuation inside a word ("c++", "node.js", "ci/cd")
+_TOKEN_RE = re.compile(r"[^\s,;:()\[\]|•]+")
+
+
+# ============================================================
+# FEATURES
+# ============================================================
+
+def normalize_skill(skill: str) -> str:
+    """Comparison key for a skill name: canonical name (skills.py), lowercased."""
+    return skill_key(skill)
+
+
+def last_year(duration: Optional[str], current_year: int = None) -> float:
+    """
+    Year a job ended, from its duration text ("2019 - 2021", "Mar 2020 - Present").
+
+    Returns:
+        The latest year mentioned (the current year for "Present"), or NaN
+    """
+    if not duration:
+        return np.nan
+    if _PRESENT_RE.search(duration):
+        return float(current_year or datetime.date.today().year)
+    years = _YEAR_RE.findall(duration)
+    return float(max(int(y) for y in years)) if years else np.nan
+
+
+class MatchFeatures:
+    """
+    Precomputed per-resume features, one row per resume (ordered by id).
+
+    skills are stored CSR-style: the skill ids of row i are
+    indices[indptr[i]:indptr[i + 1]], names in vocab.
+    """
+
+    def __init__(self, ids: np.ndarray, indptr: np.ndarray, indices: np.ndarray,
+                 vocab: List[str], last_years: np.ndarray, stamp: tuple):
+        self.ids = ids
+        self.indptr = indptr
+        self.indices = indices
+        self.vocab = vocab
+        self.last_years = last_years
+        self.stamp = tuple(int(v) for v in stamp)
+        # Row of every (row, skill) entry - the bincount key for skill overlap
+        self.rows = np.repeat(np.arange(len(ids), dtype=np.int32), np.diff(indptr))
+        self.vocab_ids = {skill: i for i, skill in enumerate(vocab)}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row_skills(self, row: int) -> List[str]:
+        return [self.vocab[i] for i in self.indices[self.indptr[row]:self.indptr[row + 1]]]
+
+    def save(self, path):
+        """Write the features (temp file + rename, so readers never see half a file)."""
+        path = Path(path)
+        temp = path.with_name(path.name + ".tmp")
+        with open(temp, "wb") as f:
+            np.savez(f, ids=self.ids, indptr=self.indptr, indices=self.indices,
+                     vocab=np.array(self.vocab, dtype=str), last_years=self.last_years,
+                     stamp=np.array(self.stamp, dtype=np.int64))
+        os.replace(temp, path)
+
+    @classmethod
+    def load(cls, path) -> "MatchFeatures":
+        with np.load(path) as data:
+            return cls(data["ids"], data["indptr"], data["indices"], data["vocab"].tolist(),
+                       data["last_years"], data["stamp"])
+
+
+def _table_stamp(conn: sqlite3.Connection) -> tuple:
+    """(row count, max id, alias file checksum): changes when resumes are added or deleted, or skills re-keyed."""
+    count, max_id = conn.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM resumes").fetchone()
+    return count, max_id, get_skill_dictionary().fingerprint
+
+
+def _current_stamp(db_file=None) -> tuple:
+    """_table_stamp of a database file (one short-lived connection)."""
+    conn = sqlite3.connect(db_file or DATABASE_FILE)
+    try:
+        return _table_stamp(conn)
+    finally:
+        conn.close()
+
+
+def build_features(db_file=None) -> MatchFeatures:
+    """Compute the features of every resume in the database (streamed, not loaded at once)."""
+    conn = sqlite3.connect(db_file or DATABASE_FILE)
+    try:
+        stamp = _table_stamp(conn)
+        current_year = datetime.date.today().year
+        ids, indptr, indices, years = [], [0], [], []
+        vocab_ids = {}
+
+        for resume_id, skills, experience in conn.execute(
+                "SELECT id, skills, experience FROM resumes ORDER BY id"):
+            ids.append(resume_id)
+            names = {normalize_skill(s) for s in json.loads(skills or "[]") if s and s.strip()}
+            indices.extend(vocab_ids.setdefault(name, len(vocab_ids)) for name in sorted(names))
+            indptr.append(len(indices))
+            ends = [last_year(job.get("duration"), current_year) for job in json.loads(experience or "[]")]
+            ends = [y for y in ends if not np.isnan(y)]
+            years.append(max(ends) if ends else np.nan)
+    finally:
+        conn.close()
+
+    return MatchFeatures(np.array(ids, dtype=np.int64), np.array(indptr, dtype=np.int64),
+                         np.array(indices, dtype=np.int32), list(vocab_ids),
+                         np.array(years, dtype=np.float32), stamp)
+
+
+def load_features(db_file=None, path=MATCH_FEATURES_FILE, rebuild: bool = False) -> MatchFeatures:
+    """
+    The feature file, rebuilt first if the resumes table changed since it was written.
+
+    Args:
+        db_file: Database the features describe (defaults to DATABASE_FILE)
+        path: Feature file (defaults to MATCH_FEATURES_FILE)
+        rebuild: Recompute even if the file looks current
+    """
+    path = Path(path)
+    if not rebuild and path.exists():
+        stamp = _current_stamp(db_file)
+        try:
+            features = MatchFeatures.load(path)
+            if features.stamp == stamp:
+                return features
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠️  Rebuilding unreadable feature file {path.name} ({e})")
+
+    features = build_features(db_file)
+    features.save(path)
+    return features
+
+
+# ============================================================
+# MATCHER
+# ============================================================
+
+class CandidateMatcher:
+    """
+    Scores all resumes against a job description.
+
+    Holds the features (and their alignment to the vector index) between
+    queries; refresh() picks up resumes saved since.
+    """
+
+    def __init__(self, db_file=None, features_file=MATCH_FEATURES_FILE, index=None):
+        self.db_file = db_file or DATABASE_FILE
+        self.features_file = features_file
+        self.index = index
+        self.features = None
+        self._vector_rows = None
+        self._vector_count = -1
+        self._lock = threading.Lock()
+
+    def refresh(self, rebuild: bool = False) -> MatchFeatures:
+        """
+        Load the features, rebuilding them if resumes were added or deleted.
+
+        Cheap when nothing changed: the features already held (and their
+        vector index rows) are kept if the table stamp still matches.
+        """
+        with self._lock:
+            if not rebuild and self.features is not None and self.features.stamp == _current_stamp(self.db_file):
+                return self.features
+            self.features = load_features(self.db_file, self.features_file, rebuild)
+            self._vector_rows = None
+            self._vector_count = -1
+        return self.features
+
+    # -------------------- query side --------------------
+
+    def jd_skills(self, text: str) -> List[str]:
+        """
+        Skills a job description asks for: dictionary skills (skills.py), then
+        other skills of stored resumes mentioned in it.
+        """
+        features = self.features or self.refresh()
+        found = {normalize_skill(skill): None for skill in get_skill_dictionary().scan(text)}
+        words = [w.strip(".!?'\"").lower() for w in _TOKEN_RE.findall(text)]
+        for start in range(len(words)):
+            for size in range(min(MAX_SKILL_WORDS, len(words) - start), 0, -1):
+                phrase = " ".join(words[start:start + size])
+                if phrase in features.vocab_ids:
+                    found.setdefault(phrase, None)
+                    break
+        return list(found)
+
+    def _semantic_scores(self, query_vector) -> Optional[np.ndarray]:
+        """Cosine similarity per feature row (0 for resumes not in the index), or None."""
+        index = self.index
+        if index is None:
+            from vector_index import get_index
+            index = self.index = get_index()
+        if not len(index):
+            return None
+
+        features = self.features
+        if self._vector_count != len(index):
+            self._vector_rows = index.rows(features.ids)
+            self._vector_count = len(index)
+        rows = self._vector_rows
+        if not (rows >= 0).any():
+            return None
+
+        scores = index.scores(query_vector)
+        return np.where(rows >= 0, np.clip(scores[rows], 0.0, 1.0), 0.0).astype(np.float32)
+
+    def rank(self, skills: Iterable[str], query_vector=None, k: int = 20,
+             weights: Optional[dict] = None) -> List[dict]:
+        """
+        Top-k resumes for a set of required skills and (optionally) a JD embedding.
+
+        Args:
+            skills: Skills the job asks for (any spelling; normalized here)
+            query_vector: Embedding of the job description, or None to skip
+                          semantic similarity
+            k: Number of results
+            weights: Override MATCH_WEIGHTS (missing signals are dropped and
+                     the remaining weights renormalized)
+
+        Returns:
+            List of dicts, best first: id, score, skill_score, recency,
+            semantic, matched_skills, missing_skills
+        """
+        features = self.features or self.refresh()
+        count = len(features)
+        if not count or k <= 0:
+            return []
+        weights = dict(weights or MATCH_WEIGHTS)
+        wanted_names = list(dict.fromkeys(normalize_skill(s) for s in skills if s and s.strip()))
+
+        # Skill overlap: flag the wanted skill ids, count flagged entries per row
+        wanted = np.zeros(len(features.vocab), dtype=bool)
+        wanted_ids = [features.vocab_ids[s] for s in wanted_names if s in features.vocab_ids]
+        wanted[wanted_ids] = True
+        if wanted_names:
+            skill_score = np.bincount(features.rows, weights=wanted[features.indices],
+                                      minlength=count).astype(np.float32) / len(wanted_names)
+        else:
+            skill_score = np.zeros(count, dtype=np.float32)
+            weights.pop("skills", None)
+
+        # Recency: 1.0 for a current job, halving every MATCH_RECENCY_HALF_LIFE years
+        since = np.maximum(datetime.date.today().year - features.last_years, 0)
+        recency = np.nan_to_num(0.5 ** (since / MATCH_RECENCY_HALF_LIFE), nan=0.0).astype(np.float32)
+
+        semantic = self._semantic_scores(query_vector) if query_vector is not None else None
+        if semantic is None:
+            semantic = np.zeros(count, dtype=np.float32)
+            weights.pop("semantic", None)
+
+        total = sum(weights.values()) or 1.0
+        score = np.zeros(count, dtype=np.float32)
+        for name, values in (("skills", skill_score), ("recency", recency), ("semantic", semantic)):
+            if weights.get(name):
+                score += (weights[name] / total) * values
+
+        k = min(k, count)
+        top = np.argpartition(score, count - k)[-k:]
+        top = top[np.argsort(score[top])[::-1]]
+
+        results = []
+        for row in top:
+            matched = [s for s in features.row_skills(row) if wanted[features.vocab_ids[s]]]
+            results.append({
+                "id": int(features.ids[row]),
+                "score": float(score[row]),
+                "skill_score": float(skill_score[row]),
+                "recency": float(recency[row]),
+                "semantic": float(semantic[row]),
+                "matched_skills": matched,
+                "missing_skills": [s for s in wanted_names if s not in matched],
+            })
+        return results
+
+    def match(self, job_description: str, k: int = 20, skills: Optional[List[str]] = None,
+              weights: Optional[dict] = None) -> List[dict]:
+        """
+        Rank stored resumes against a job description (see match_candidates).
+        """
+        self.refresh()
+        skills = self.jd_skills(job_description) if skills is None else skills
+
+        query_vector = None
+        if VECTOR_INDEX_ENABLED:
+            try:
+                from vector_index import get_embeddings, QUERY_PREFIX
+                query_vector = get_embeddings().embed_query(QUERY_PREFIX + job_description)
+            except Exception as e:
+                print(f"⚠️  Ranking without semantic similarity ({e})")
+
+        matches = self.rank(skills, query_vector, k, weights)
+        if not matches:
+            return []
+
+        conn = sqlite3.connect(self.db_file)
+        conn.row_factory = sqlite3.Row
+        try:
+            placeholders = ", ".join("?" * len(matches))
+            rows = conn.execute(f"SELECT id, name, email, phone, location FROM resumes WHERE id IN ({placeholders})",
+                                [m["id"] for m in matches]).fetchall()
+        finally:
+            conn.close()
+
+        by_id = {row["id"]: dict(row) for row in rows}
+        return [{**by_id[m["id"]], **m} for m in matches if m["id"] in by_id]
+
+
+_matcher = None
+_matcher_lock = threading.Lock()
+
+
+def get_matcher() -> CandidateMatcher:
+    """The shared matcher for DATABASE_FILE, created on first use."""
+    global _matcher
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                _matcher = CandidateMatcher()
+    return _matcher
+
+
+def match_candidates(job_description: str, k: int = 20, skills: Optional[List[str]] = None,
+                     weights: Optional[dict] = None) -> List[dict]:
+    """
+    Rank every stored resume against a job description.
+
+    Args:
+        job_description: The job posting text
+        k: Number of candidates to return
+        skills: Required skills (default: known skills mentioned in the JD)
+        weights: Override MATCH_WEIGHTS, e.g. {"skills": 1.0} for skills only
+
+    Returns:
+        List of dicts, best first: id, name, email, phone, location, score,
+        skill_score, recency, semantic, matched_skills, missing_skills
+    """
+    return get_matcher().match(job_description, k, skills, weights)
+
+
+# ============================================================
+# COMMAND LINE
+# ============================================================
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python matching.py job_description.txt [k] | --rebuild")
+        sys.exit(1)
+
+    if sys.argv[1] == "--rebuild":
+        features = get_matcher().refresh(rebuild=True)
+        print(f"🧮 Features for {len(features)} resume(s), {len(features.vocab)} distinct skills "
+              f"→ {MATCH_FEATURES_FILE}")
+    else:
+        jd = Path(sys.argv[1]).read_text(encoding="utf-8")
+        k = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+        matcher = get_matcher()
+        matches = matcher.match(jd, k)
+        print(f"🎯 JD skills: {', '.join(matcher.jd_skills(jd)) or '(none recognized)'}\n")
+        for m in matches:
+            print(f"{m['score']:.3f}  #{m['id']:<6} {m['name']:<25} skills {m['skill_score']:.0%}  "
+                  f"recency {m['recency']:.2f}  semantic {m['semantic']:.2f}  "
+                  f"[{', '.join(m['matched_skills'])}]")
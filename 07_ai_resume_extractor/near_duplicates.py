@@ -0,0 +1,189 @@
+"""
+Near-Duplicate Detection (MinHash + LSH)
+
+Exact duplicates are caught by file/content hashes (database.find_duplicate).
+This module catches the slightly edited copies: same resume, new phone
+number, one more bullet point, a reworded summary.
+
+- Text from load_resume_file is cut into word shingles (SHINGLE_SIZE words)
+- A MinHash signature (MINHASH_PERMUTATIONS uint32 values) estimates the
+  Jaccard similarity of two shingle sets: the fraction of equal positions
+- LSH: the signature is split into MINHASH_BANDS bands, each hashed to a
+  bucket. Resumes sharing any bucket are candidates, and only candidates
+  have their signatures compared. The bucket lookup is an index seek per
+  band, so it stays fast with millions of stored resumes.
+
+Signatures live in the same SQLite file as the resumes, keyed by the
+content hash of the text, and are stored once the resume has been parsed.
+
+Usage:
+    with ResumeRepository() as repo:
+        near = NearDuplicateIndex(repo)
+        signature = near.signature(text)
+        match = near.find(signature)      # (resume_id, similarity) or None
+        ...
+        near.add(content_hash, signature, match)
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import hashlib
+import re
+import zlib
+from typing import List, Optional
+import numpy as np
+from config import (NEAR_DUPLICATE_THRESHOLD, MINHASH_PERMUTATIONS, MINHASH_BANDS, SHINGLE_SIZE,
+                    MINHASH_SEED)
+from database import ResumeRepository
+
+
+NEAR_DUPLICATES_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS minhash_signatures (
+        content_hash TEXT PRIMARY KEY,
+        signature BLOB NOT NULL,
+        near_duplicate_of INTEGER,
+        similarity REAL
+    )
+    """,
+    # One row per band; (band, bucket) lookups are seeks on the primary key
+    """
+    CREATE TABLE IF NOT EXISTS minhash_buckets (
+        band INTEGER NOT NULL,
+        bucket INTEGER NOT NULL,
+        content_hash TEXT NOT NULL,
+        PRIMARY KEY (band, bucket, content_hash)
+    ) WITHOUT ROWID
+    """,
+]
+
+INSERT_SIGNATURE_SQL = """
+    INSERT OR REPLACE INTO minhash_signatures (content_hash, signature, near_duplicate_of, similarity)
+    VALUES (?, ?, ?, ?)
+"""
+INSERT_BUCKET_SQL = "INSERT OR IGNORE INTO minhash_buckets (band, bucket, content_hash) VALUES (?, ?, ?)"
+FIND_BUCKET_SQL = "SELECT content_hash FROM minhash_buckets WHERE band = ? AND bucket = ?"
+# Only signatures whose resume was saved count (parsed-but-failed ones have no row)
+CANDIDATES_SQL = """
+    SELECT s.content_hash, s.signature, MIN(r.id) AS resume_id
+    FROM minhash_signatures s JOIN resumes r ON r.content_hash = s.content_hash
+    WHERE s.content_hash IN ({placeholders})
+    GROUP BY s.content_hash
+"""
+FLAGGED_SQL = """
+    SELECT r.id AS resume_id, s.near_duplicate_of, s.similarity
+    FROM minhash_signatures s JOIN resumes r ON r.content_hash = s.content_hash
+    WHERE s.near_duplicate_of IS NOT NULL
+    ORDER BY r.id
+"""
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Multiply-shift hash functions h(x) = (a*x + b) >> 32 over uint64 (wraps mod 2^64)
+_rng = np.random.default_rng(MINHASH_SEED)
+_A = _rng.integers(1, 2**63, MINHASH_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+_B = _rng.integers(0, 2**63, MINHASH_PERMUTATIONS, dtype=np.uint64)
+_ROWS_PER_BAND = MINHASH_PERMUTATIONS // MINHASH_BANDS
+
+
+# ============================================================
+# SIGNATURES
+# ============================================================
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """Word n-grams of the lowercased text (punctuation and spacing ignored)."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash(text: str) -> np.ndarray:
+    """MinHash signature of a text (MINHASH_PERMUTATIONS uint32 values)."""
+    hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles(text)), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        permuted = (_A[:, None] * hashes[None, :] + _B[:, None]) >> np.uint64(32)
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+def band_buckets(signature: np.ndarray) -> List[int]:
+    """One bucket id (signed 64-bit, fits SQLite INTEGER) per band."""
+    return [
+        int.from_bytes(hashlib.blake2b(band.tobytes(), digest_size=8).digest(), "big", signed=True)
+        for band in signature[:_ROWS_PER_BAND * MINHASH_BANDS].reshape(MINHASH_BANDS, _ROWS_PER_BAND)
+    ]
+
+
+# ============================================================
+# INDEX
+# ============================================================
+
+class NearDuplicateIndex:
+    """
+    MinHash LSH index stored next to the resumes.
+
+    Shares the ResumeRepository connection (and its lock), like jobs.JobLedger.
+    """
+
+    def __init__(self, repo: ResumeRepository, threshold: float = NEAR_DUPLICATE_THRESHOLD):
+        self.repo = repo
+        self.threshold = threshold
+        with self.repo.transaction() as conn:
+            for statement in NEAR_DUPLICATES_SCHEMA:
+                conn.execute(statement)
+
+    @staticmethod
+    def signature(text: str) -> np.ndarray:
+        """MinHash signature of resume text (see minhash)."""
+        return minhash(text)
+
+    def find(self, signature: np.ndarray) -> Optional[tuple]:
+        """
+        Most similar saved resume at or above the threshold.
+
+        Returns:
+            (resume_id, estimated Jaccard similarity), or None
+        """
+        with self.repo.transaction() as conn:
+            candidates = set()
+            for band, bucket in enumerate(band_buckets(signature)):
+                candidates.update(row[0] for row in conn.execute(FIND_BUCKET_SQL, (band, bucket)))
+            if not candidates:
+                return None
+
+            rows = conn.execute(CANDIDATES_SQL.format(placeholders=", ".join("?" * len(candidates))),
+                                list(candidates)).fetchall()
+
+        best = None
+        for row in rows:
+            score = similarity(signature, np.frombuffer(row["signature"], dtype=np.uint32))
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (row["resume_id"], score)
+        return best
+
+    def add(self, content_hash: str, signature: np.ndarray, near_duplicate: Optional[tuple] = None):
+        """
+        Store a parsed resume's signature so later copies can find it.
+
+        Args:
+            content_hash: compute_text_hash of the text
+            signature: Its MinHash signature
+            near_duplicate: The find() result for it, recorded as a flag
+        """
+        near_id, score = near_duplicate or (None, None)
+        with self.repo.transaction() as conn:
+            conn.execute(INSERT_SIGNATURE_SQL, (content_hash, signature.astype(np.uint32).tobytes(), near_id, score))
+            conn.executemany(INSERT_BUCKET_SQL, [
+                (band, bucket, content_hash) for band, bucket in enumerate(band_buckets(signature))
+            ])
+
+    def flagged(self) -> List[dict]:
+        """Saved resumes flagged as near-duplicates: resume_id, near_duplicate_of, similarity."""
+        with self.repo.transaction() as conn:
+            return [dict(row) for row in conn.execute(FLAGGED_SQL)]
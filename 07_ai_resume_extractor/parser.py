@@ -7,38 +7,60 @@ Author: Klement
 Date: December 15, 2025
 """
 
-from langchain_ollama import ChatOllama
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 from models import Resume
 from config import MODEL_NAME, TEMPERATURE, EXTRACTION_PROMPT
+from skills import get_skill_dictionary
+import telemetry
+import threading
 
 
 # ============================================================
 # SETUP PARSER
 # ============================================================
 
-# Create output parser (converts LLM response to Resume object)
-output_parser = PydanticOutputParser(pydantic_object=Resume)
+# Built on first use - importing LangChain/Ollama is slow, and main.py
+# shouldn't pay for it when there is nothing to parse
+_chain = None
+_chain_lock = threading.Lock()
 
-# Create prompt template
-prompt_template = PromptTemplate(
-    template="{instructions}\n\nResume Text:\n{resume_text}\n\n{format_instructions}",
-    input_variables=["resume_text"],
-    partial_variables={
-        "instructions": EXTRACTION_PROMPT,
-        "format_instructions": output_parser.get_format_instructions()
-    }
-)
 
-# Create LLM
-llm = ChatOllama(
-    model=MODEL_NAME,
-    temperature=TEMPERATURE
-)
+def get_chain():
+    """Build the Prompt → LLM → Parser chain on the first call and reuse it."""
+    global _chain
+    if _chain is not None:
+        return _chain
 
-# Build the chain: Prompt → LLM → Parser
-chain = prompt_template | llm | output_parser
+    with _chain_lock:
+        if _chain is None:
+            from langchain_ollama import ChatOllama
+            from langchain_core.prompts import PromptTemplate
+            from langchain_core.output_parsers import PydanticOutputParser
+            from llm_cache import get_llm_cache
+
+            # Create output parser (converts LLM response to Resume object)
+            output_parser = PydanticOutputParser(pydantic_object=Resume)
+
+            # Create prompt template
+            prompt_template = PromptTemplate(
+                template="{instructions}\n\nResume Text:\n{resume_text}\n\n{format_instructions}",
+                input_variables=["resume_text"],
+                partial_variables={
+                    "instructions": EXTRACTION_PROMPT,
+                    "format_instructions": output_parser.get_format_instructions()
+                }
+            )
+
+            # Create LLM
+            llm = ChatOllama(
+                model=MODEL_NAME,
+                temperature=TEMPERATURE,
+                cache=get_llm_cache(),
+                callbacks=telemetry.llm_callbacks()
+            )
+
+            # Build the chain: Prompt → LLM → Parser
+            _chain = prompt_template | llm | output_parser
+    return _chain
 
 
 # ============================================================
@@ -59,7 +81,10 @@ def parse_resume(resume_text: str) -> Resume:
         Exception: If parsing fails or LLM returns invalid data
     """
     try:
-        result = chain.invoke({"resume_text": resume_text})
+        with telemetry.span("extract_all"):
+            result = get_chain().invoke({"resume_text": resume_text})
+        # Same skill names as the other engines ("JS" → "JavaScript")
+        result.skills = get_skill_dictionary().canonicalize(result.skills)
         return result
     except Exception as e:
         print(f"❌ Parsing failed: {e}")
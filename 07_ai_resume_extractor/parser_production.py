@@ -5,44 +5,108 @@ Uses two-pass extraction for better results with small models:
 1. Extract raw data
 2. Clean and structure the output
 
+Skills are looked up in the skill dictionary (skills.py) first; the LLM
+only sees the skills-section items it does not know.
+
 Author: Klement
 Date: December 16, 2025
 """
 
-from langchain_ollama import ChatOllama
 from models import Resume, ContactInfo, JobExperience, Education
-from config import MODEL_NAME, TEMPERATURE
+from config import (MODEL_NAME, TEMPERATURE, EXTRACTION_CONCURRENCY, BATCH_CONCURRENCY, PACK_SIZE,
+                    PACK_MAX_CHARS, SKILL_LLM_FALLBACK, MAX_SKILLS)
+from sections import route_text, split_sections
+from skills import get_skill_dictionary
+import contact_heuristics
+import telemetry
 import json
 import re
+import threading
+
+
+# LLM client, created on first use (importing langchain_ollama is slow)
+_llm = None
+_llm_lock = threading.Lock()
 
 
-# Create LLM
-llm = ChatOllama(model=MODEL_NAME, temperature=TEMPERATURE)
+def get_llm():
+    """Get the shared ChatOllama client, creating it on the first call."""
+    global _llm
+    if _llm is None:
+        with _llm_lock:
+            if _llm is None:
+                from langchain_ollama import ChatOllama
+                from llm_cache import get_llm_cache
+                _llm = ChatOllama(model=MODEL_NAME, temperature=TEMPERATURE, cache=get_llm_cache(),
+                                  callbacks=telemetry.llm_callbacks())
+    return _llm
 
 
-def two_pass_extract(text: str, extraction_prompt: str, cleanup_prompt: str) -> str:
+def two_pass_extract(text: str, extraction_prompt: str, cleanup_prompt: str, field: str = None) -> str:
     """
     Two-pass extraction to handle thinking/verbose models.
 
     Pass 1: Extract (model may think/explain)
     Pass 2: Clean (extract only the answer)
+
+    Only the resume sections relevant to `field` are sent (see sections.py).
     """
-    # Pass 1: Extract
-    response1 = llm.invoke(extraction_prompt.format(text=text[:2000]))
-    raw_output = response1.content.strip()
+    llm = get_llm()
+    with telemetry.span(f"extract_{field or 'text'}"):
+        # Pass 1: Extract
+        response1 = llm.invoke(extraction_prompt.format(text=route_text(text, field)))
+        raw_output = response1.content.strip()
 
-    # Pass 2: Clean
-    cleanup = cleanup_prompt.format(raw_output=raw_output)
-    response2 = llm.invoke(cleanup)
-    clean_output = response2.content.strip()
+        # Pass 2: Clean
+        cleanup = cleanup_prompt.format(raw_output=raw_output)
+        response2 = llm.invoke(cleanup)
+        clean_output = response2.content.strip()
 
     return clean_output
 
 
-def extract_contact(text: str) -> ContactInfo:
-    """Extract contact information with two-pass approach"""
+def two_pass_extract_many(tasks: list, max_concurrency: int) -> list:
+    """
+    Run several independent two-pass extractions concurrently.
 
-    extraction_prompt = """From this resume, extract:
+    All pass-1 prompts go out together, then all pass-2 prompts, so the
+    wall time is about two LLM round trips instead of two per task.
+
+    Args:
+        tasks: List of (text, extraction_prompt, cleanup_prompt, field) tuples
+        max_concurrency: Max LLM requests in flight at once
+
+    Returns:
+        Cleaned outputs, in the same order as tasks
+    """
+    llm = get_llm()
+    fields = [field for *_, field in tasks]
+    # One config per prompt: the field name tags each LLM span
+    config = [{"max_concurrency": max_concurrency, "metadata": {"field": field}} for field in fields]
+
+    with telemetry.span("extract_fields", fields=fields):
+        # Pass 1: Extract (all fields at once)
+        pass1 = [
+            extraction_prompt.format(text=route_text(text, field))
+            for text, extraction_prompt, _, field in tasks
+        ]
+        responses1 = llm.batch(pass1, config=config)
+
+        # Pass 2: Clean (all fields at once)
+        pass2 = [
+            cleanup_prompt.format(raw_output=response.content.strip())
+            for (_, _, cleanup_prompt, _), response in zip(tasks, responses1)
+        ]
+        responses2 = llm.batch(pass2, config=config)
+
+    return [response.content.strip() for response in responses2]
+
+
+# ============================================================
+# CONTACT INFO
+# ============================================================
+
+CONTACT_EXTRACTION_PROMPT = """From this resume, extract:
 - Name
 - Email
 - Phone (10 digits only)
@@ -52,7 +116,7 @@ Resume:
 {text}
 """
 
-    cleanup_prompt = """From this text, extract ONLY the contact info in this exact format:
+CONTACT_CLEANUP_PROMPT = """From this text, extract ONLY the contact info in this exact format:
 Name: [name]
 Email: [email]
 Phone: [10 digits]
@@ -63,9 +127,21 @@ Text:
 
 Answer in exact format above:"""
 
-    result = two_pass_extract(text, extraction_prompt, cleanup_prompt)
 
-    # Parse the cleaned result
+def extract_contact(text: str) -> ContactInfo:
+    """Extract contact information - regex fast path, two-pass LLM only when unsure"""
+    guess = contact_heuristics.guess_contact(text)
+    contact = contact_heuristics.confident_contact(guess)
+    contact_heuristics.stats.record(used_llm=contact is None)
+    if contact is not None:
+        return contact
+
+    result = two_pass_extract(text, CONTACT_EXTRACTION_PROMPT, CONTACT_CLEANUP_PROMPT, "contact")
+    return contact_heuristics.merge_contact(parse_contact(result), guess)
+
+
+def parse_contact(result: str) -> ContactInfo:
+    """Parse cleaned 'Key: value' contact lines into ContactInfo"""
     name = "Unknown"
     email = "unknown@example.com"
     phone = "0000000000"
@@ -94,55 +170,128 @@ Answer in exact format above:"""
     )
 
 
-def extract_skills(text: str) -> list:
-    """Extract skills with two-pass approach"""
+# ============================================================
+# SKILLS
+# ============================================================
 
-    extraction_prompt = """What are the technical skills in this resume?
+SKILLS_EXTRACTION_PROMPT = """What are the technical skills in this resume?
 
 Resume:
 {text}
 """
 
-    cleanup_prompt = """From this text, list ONLY the skill names separated by commas.
+SKILLS_CLEANUP_PROMPT = """From this text, list ONLY the skill names separated by commas.
 
 Text:
 {raw_output}
 
 Skills (comma separated):"""
 
-    result = two_pass_extract(text, extraction_prompt, cleanup_prompt)
 
+# Skills-section items the dictionary does not know (skills.py); the LLM picks the real skills
+SKILL_TERMS_PROMPT = """Which of these items from a resume's skills section are technical skills, tools or competencies? Give the standard name of each one.
+
+Resume:
+{text}
+"""
+
+
+def plan_skills(text: str) -> tuple:
+    """
+    Dictionary pass over a resume's skills - no LLM call.
+
+    Returns:
+        (canonical skills found, LLM job) where the job is None when nothing
+        is left to ask, ("skill_terms", unknown items) when the skills section
+        has items the dictionary does not know, or ("skills", resume text)
+        when the dictionary found no skills at all
+    """
+    dictionary = get_skill_dictionary()
+    known = dictionary.scan(route_text(text, "skills"))
+    if not SKILL_LLM_FALLBACK:
+        return known, None
+
+    section = split_sections(text).get("skills")
+    unknown = dictionary.unknown_terms(section) if section else []
+    if unknown:
+        return known, ("skill_terms", "\n".join(unknown))
+    if not known:
+        return known, ("skills", text)
+    return known, None
+
+
+def merge_skills(known: list, extra: list = ()) -> list:
+    """Dictionary skills followed by the LLM's (both canonical), without duplicates"""
+    merged = {}
+    for skill in [*known, *extra]:
+        merged.setdefault(skill.lower(), skill)
+    skills = list(merged.values())[:MAX_SKILLS]
+    return skills if skills else ["General Skills"]
+
+
+def extract_skills(text: str) -> list:
+    """Extract skills: dictionary first, the two-pass LLM only for what it does not know"""
+    known, job = plan_skills(text)
+    if job is None:
+        return merge_skills(known)
+
+    field, job_text = job
+    result = two_pass_extract(job_text, *FIELD_EXTRACTORS[field][:2], field)
+    return merge_skills(known, FIELD_EXTRACTORS[field][2](result))
+
+
+def _skill_names(result: str) -> list:
+    """Skill names from a cleaned comma separated list, mapped to canonical names"""
     # Parse skills
     skills = [s.strip() for s in result.split(',') if s.strip()]
 
     # Clean up
     cleaned = []
-    for skill in skills[:15]:
+    for skill in skills[:MAX_SKILLS]:
         skill = skill.lstrip('0123456789.-•*) ')
-        if skill and 2 < len(skill) < 30:
+        if skill and 2 < len(skill) < 30 and skill.lower() != "none":
             cleaned.append(skill)
 
-    return cleaned[:10] if cleaned else ["General Skills"]
+    return get_skill_dictionary().canonicalize(cleaned)
 
 
-def extract_summary(text: str) -> str:
-    """Extract professional summary"""
+def parse_skills(result: str) -> list:
+    """Parse a cleaned comma separated skill list"""
+    cleaned = _skill_names(result)
+    return cleaned if cleaned else ["General Skills"]
+
+
+def parse_skill_terms(result: str) -> list:
+    """Parse the skills the LLM kept from the unknown skills-section items (may be empty)"""
+    return _skill_names(result)
+
+
+# ============================================================
+# SUMMARY
+# ============================================================
 
-    extraction_prompt = """Write a one-sentence professional summary for this candidate.
+SUMMARY_EXTRACTION_PROMPT = """Write a one-sentence professional summary for this candidate.
 
 Resume:
 {text}
 """
 
-    cleanup_prompt = """From this text, extract ONLY the professional summary sentence.
+SUMMARY_CLEANUP_PROMPT = """From this text, extract ONLY the professional summary sentence.
 
 Text:
 {raw_output}
 
 Summary:"""
 
-    result = two_pass_extract(text, extraction_prompt, cleanup_prompt)
 
+def extract_summary(text: str) -> str:
+    """Extract professional summary"""
+    result = two_pass_extract(text, SUMMARY_EXTRACTION_PROMPT, SUMMARY_CLEANUP_PROMPT, "summary")
+    return parse_summary(result)
+
+
+def parse_summary(result: str) -> str:
+    """Keep the first sentence of the cleaned summary"""
     # Take first sentence
     if '.' in result:
         result = result.split('.')[0] + '.'
@@ -150,16 +299,17 @@ Summary:"""
     return result[:300] if len(result) > 10 else None
 
 
-def extract_experience(text: str) -> list:
-    """Extract most recent job"""
+# ============================================================
+# EXPERIENCE
+# ============================================================
 
-    extraction_prompt = """What is the most recent job in this resume?
+EXPERIENCE_EXTRACTION_PROMPT = """What is the most recent job in this resume?
 
 Resume:
 {text}
 """
 
-    cleanup_prompt = """From this text, extract job details in this format:
+EXPERIENCE_CLEANUP_PROMPT = """From this text, extract job details in this format:
 Company: [company]
 Title: [title]
 Duration: [dates]
@@ -169,8 +319,15 @@ Text:
 
 Answer in exact format:"""
 
-    result = two_pass_extract(text, extraction_prompt, cleanup_prompt)
 
+def extract_experience(text: str) -> list:
+    """Extract most recent job"""
+    result = two_pass_extract(text, EXPERIENCE_EXTRACTION_PROMPT, EXPERIENCE_CLEANUP_PROMPT, "experience")
+    return parse_experience(result)
+
+
+def parse_experience(result: str) -> list:
+    """Parse cleaned 'Company/Title/Duration' lines into JobExperience"""
     # Parse
     try:
         lines = [l for l in result.split('\n') if ':' in l]
@@ -191,34 +348,273 @@ Answer in exact format:"""
     return []
 
 
-def parse_resume(resume_text: str) -> Resume:
+# ============================================================
+# MAIN FUNCTION
+# ============================================================
+
+# Fields of a Resume filled by the extractors below
+RESUME_FIELDS = ("contact", "skills", "summary", "experience")
+
+# Field name -> (extraction prompt, cleanup prompt, parse function)
+FIELD_EXTRACTORS = {
+    "contact": (CONTACT_EXTRACTION_PROMPT, CONTACT_CLEANUP_PROMPT, parse_contact),
+    "skills": (SKILLS_EXTRACTION_PROMPT, SKILLS_CLEANUP_PROMPT, parse_skills),
+    "skill_terms": (SKILL_TERMS_PROMPT, SKILLS_CLEANUP_PROMPT, parse_skill_terms),
+    "summary": (SUMMARY_EXTRACTION_PROMPT, SUMMARY_CLEANUP_PROMPT, parse_summary),
+    "experience": (EXPERIENCE_EXTRACTION_PROMPT, EXPERIENCE_CLEANUP_PROMPT, parse_experience),
+}
+
+
+def parse_resume(resume_text: str, concurrency: int = EXTRACTION_CONCURRENCY) -> Resume:
     """
     Parse resume using two-pass extraction.
 
     Args:
         resume_text: Raw text from resume
+        concurrency: Max LLM calls in flight. With 1 the fields are extracted
+                     one after another (8 round trips); with more, the four
+                     independent fields run together (about 2 round trips).
 
     Returns:
         Resume object with structured data
     """
-    print("      → Extracting contact info...")
-    contact = extract_contact(resume_text)
+    if concurrency <= 1:
+        print("      → Extracting contact info...")
+        contact = extract_contact(resume_text)
+
+        print("      → Extracting skills...")
+        skills = extract_skills(resume_text)
+
+        print("      → Extracting summary...")
+        summary = extract_summary(resume_text)
+
+        print("      → Extracting experience...")
+        experience = extract_experience(resume_text)
+    else:
+        # Contact info skips the LLM when the regex guesses are confident
+        guess = contact_heuristics.guess_contact(resume_text)
+        fast_contact = contact_heuristics.confident_contact(guess)
+        contact_heuristics.stats.record(used_llm=fast_contact is None)
+        # Skills come from the dictionary; the LLM only gets what it does not know
+        known_skills, skills_job = plan_skills(resume_text)
+        jobs = [
+            (resume_text, f) for f in RESUME_FIELDS
+            if f != "skills" and not (f == "contact" and fast_contact)
+        ]
+        if skills_job:
+            jobs.append((skills_job[1], skills_job[0]))
+
+        print(f"      → Extracting {', '.join(field for _, field in jobs)} (concurrency {concurrency})...")
+        tasks = [(text, *FIELD_EXTRACTORS[field][:2], field) for text, field in jobs]
+        results = two_pass_extract_many(tasks, concurrency)
+        values = {
+            field: FIELD_EXTRACTORS[field][2](result) for (_, field), result in zip(jobs, results)
+        }
+
+        if fast_contact:
+            contact = fast_contact
+        else:
+            contact = contact_heuristics.merge_contact(values["contact"], guess)
+        skills = merge_skills(known_skills, values.get("skills") or values.get("skill_terms") or [])
+        summary, experience = values["summary"], values["experience"]
+
+    with telemetry.span("validate"):
+        resume = Resume(
+            contact=contact,
+            summary=summary,
+            skills=skills,
+            experience=experience,
+            education=[]
+        )
 
-    print("      → Extracting skills...")
-    skills = extract_skills(resume_text)
+    return resume
 
-    print("      → Extracting summary...")
-    summary = extract_summary(resume_text)
 
-    print("      → Extracting experience...")
-    experience = extract_experience(resume_text)
+# ============================================================
+# CROSS-RESUME BATCHING
+# ============================================================
 
-    resume = Resume(
-        contact=contact,
-        summary=summary,
-        skills=skills,
-        experience=experience,
-        education=[]
-    )
+# Several short resumes in one prompt, one ID-tagged answer each
+PACKED_EXTRACTION_PROMPT = """Below are {count} resumes, each between <resume id="N"> and </resume>.
+Answer this question separately for EVERY resume: {question}
 
-    return resume
+{documents}
+
+Write each answer between <answer id="N"> and </answer>, using the id of its resume."""
+
+ANSWER_RE = re.compile(r'<answer id="?(\d+)"?>(.*?)</answer>', re.DOTALL)
+
+
+def _question(extraction_prompt: str) -> str:
+    """The instruction part of a field's extraction prompt (everything before the resume)."""
+    return extraction_prompt.split("\n\nResume:")[0]
+
+
+def _pack_prompt(field: str, texts: list) -> str:
+    """Multi-document pass-1 prompt for one field; resume ids are 1..len(texts)."""
+    documents = "\n\n".join(f'<resume id="{n}">\n{text}\n</resume>' for n, text in enumerate(texts, 1))
+    return PACKED_EXTRACTION_PROMPT.format(count=len(texts), question=_question(FIELD_EXTRACTORS[field][0]),
+                                           documents=documents)
+
+
+def _unpack_answers(content: str, count: int) -> dict:
+    """ID -> answer text from a packed response (ids outside 1..count are ignored)."""
+    answers = {}
+    for match in ANSWER_RE.finditer(content):
+        n = int(match.group(1))
+        if 1 <= n <= count and match.group(2).strip():
+            answers.setdefault(n, match.group(2).strip())
+    return answers
+
+
+def batch_extract(jobs: list, max_concurrency: int = BATCH_CONCURRENCY, pack_size: int = PACK_SIZE,
+                  pack_max_chars: int = PACK_MAX_CHARS) -> list:
+    """
+    Two-pass extraction for many (resume, field) jobs at once.
+
+    Each field's pass-1 prompts for all resumes go through one llm.batch;
+    short routed texts are packed pack_size per prompt. Pass 2 (cleanup)
+    stays one prompt per job, also batched.
+
+    Args:
+        jobs: List of (resume text, field) tuples
+        max_concurrency: Max LLM requests in flight
+        pack_size: Resumes per packed prompt (1 = no packing)
+        pack_max_chars: Only routed texts up to this size are packed
+
+    Returns:
+        Cleaned output for each job, in order (the Exception if its LLM call failed)
+    """
+    llm = get_llm()
+    routed = [route_text(text, field) for text, field in jobs]
+
+    # Pass 1 requests: (prompt, job indices answered by it, field)
+    requests = []
+    by_field = {}
+    for i, (_, field) in enumerate(jobs):
+        by_field.setdefault(field, []).append(i)
+    for field, indices in by_field.items():
+        packable = [i for i in indices if pack_size > 1 and len(routed[i]) <= pack_max_chars]
+        for i in indices:
+            if i not in packable:
+                requests.append((FIELD_EXTRACTORS[field][0].format(text=routed[i]), [i], field))
+        for start in range(0, len(packable), pack_size):
+            group = packable[start:start + pack_size]
+            if len(group) == 1:
+                requests.append((FIELD_EXTRACTORS[field][0].format(text=routed[group[0]]), group, field))
+            else:
+                requests.append((_pack_prompt(field, [routed[i] for i in group]), group, field))
+
+    raw = [None] * len(jobs)
+    with telemetry.span("extract_batch", jobs=len(jobs), requests=len(requests)) as batch_span:
+        responses = llm.batch(
+            [prompt for prompt, _, _ in requests],
+            config=[{"max_concurrency": max_concurrency, "metadata": {"field": field}} for _, _, field in requests],
+            return_exceptions=True
+        )
+
+        # Unpack; resumes a packed answer left out (or a failed packed call) are asked alone
+        missing = []
+        for (_, group, _), response in zip(requests, responses):
+            if len(group) == 1:
+                raw[group[0]] = response if isinstance(response, Exception) else response.content.strip()
+                continue
+            answers = {} if isinstance(response, Exception) else _unpack_answers(response.content, len(group))
+            for n, i in enumerate(group, 1):
+                if n in answers:
+                    raw[i] = answers[n]
+                else:
+                    missing.append(i)
+
+        if missing:
+            batch_span.add(retries=len(missing))
+            retried = llm.batch(
+                [FIELD_EXTRACTORS[jobs[i][1]][0].format(text=routed[i]) for i in missing],
+                config=[{"max_concurrency": max_concurrency, "metadata": {"field": jobs[i][1]}} for i in missing],
+                return_exceptions=True
+            )
+            for i, response in zip(missing, retried):
+                raw[i] = response if isinstance(response, Exception) else response.content.strip()
+
+        # Pass 2: one cleanup prompt per job
+        todo = [i for i in range(len(jobs)) if not isinstance(raw[i], Exception)]
+        cleaned = llm.batch(
+            [FIELD_EXTRACTORS[jobs[i][1]][1].format(raw_output=raw[i]) for i in todo],
+            config=[{"max_concurrency": max_concurrency, "metadata": {"field": jobs[i][1]}} for i in todo],
+            return_exceptions=True
+        )
+
+    outputs = list(raw)
+    for i, response in zip(todo, cleaned):
+        outputs[i] = response if isinstance(response, Exception) else response.content.strip()
+    return outputs
+
+
+def parse_resumes(texts: list, concurrency: int = BATCH_CONCURRENCY, pack_size: int = PACK_SIZE) -> list:
+    """
+    Parse many resumes together (cross-resume batching).
+
+    Instead of 8 requests per resume sent resume by resume, every extractor's
+    prompts for all the resumes share one llm.batch, and short resumes are
+    packed several per prompt.
+
+    Args:
+        texts: Raw text of each resume
+        concurrency: Max LLM requests in flight
+        pack_size: Resumes per packed pass-1 prompt (1 = no packing)
+
+    Returns:
+        Resume for each text, in order - or the Exception for a resume that failed
+    """
+    guesses = []
+    known_skills = []
+    jobs = []
+    owners = []
+    for r, text in enumerate(texts):
+        # Contact info skips the LLM when the regex guesses are confident
+        guess = contact_heuristics.guess_contact(text)
+        fast_contact = contact_heuristics.confident_contact(guess)
+        contact_heuristics.stats.record(used_llm=fast_contact is None)
+        guesses.append((guess, fast_contact))
+        for field in RESUME_FIELDS:
+            if field != "skills" and not (field == "contact" and fast_contact):
+                jobs.append((text, field))
+                owners.append(r)
+
+        # Skills come from the dictionary; the LLM only gets what it does not know
+        known, skills_job = plan_skills(text)
+        known_skills.append(known)
+        if skills_job:
+            jobs.append((skills_job[1], skills_job[0]))
+            owners.append(r)
+
+    print(f"      → Extracting {len(jobs)} fields of {len(texts)} resumes (batched, concurrency {concurrency})...")
+    outputs = batch_extract(jobs, concurrency, pack_size)
+
+    values = [{} for _ in texts]
+    failures = [None] * len(texts)
+    for (_, field), r, output in zip(jobs, owners, outputs):
+        if isinstance(output, Exception):
+            failures[r] = failures[r] or output
+        else:
+            values[r][field] = FIELD_EXTRACTORS[field][2](output)
+
+    results = []
+    for r, (guess, fast_contact) in enumerate(guesses):
+        if failures[r] is not None:
+            results.append(failures[r])
+            continue
+        try:
+            with telemetry.span("validate"):
+                contact = fast_contact or contact_heuristics.merge_contact(values[r]["contact"], guess)
+                results.append(Resume(
+                    contact=contact,
+                    summary=values[r]["summary"],
+                    skills=merge_skills(known_skills[r],
+                                        values[r].get("skills") or values[r].get("skill_terms") or []),
+                    experience=values[r]["experience"],
+                    education=[]
+                ))
+        except Exception as e:
+            results.append(e)
+    return results
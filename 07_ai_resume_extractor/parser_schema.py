@@ -0,0 +1,145 @@
+"""
+Schema-Constrained Resume Parser - Single-Pass Approach
+
+Makes ONE Ollama call whose output is constrained to the JSON schema of the
+Resume model (Ollama structured outputs). The server only samples tokens that
+fit the schema, so there is no verbose text to clean up and no second pass.
+
+Fields that still fail validation (e.g. a phone that isn't 10 digits) are
+re-extracted with the two-pass approach from parser_production.py - only
+those fields, not the whole resume.
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+from pydantic import TypeAdapter, ValidationError
+from typing import List, Optional
+from models import Resume, ContactInfo, JobExperience, Education
+from config import MODEL_NAME, TEMPERATURE, EXTRACTION_PROMPT, EXTRACTION_CONCURRENCY
+from skills import get_skill_dictionary
+import parser_production
+import telemetry
+import json
+import re
+import threading
+
+
+# LLM with JSON-schema constrained output, created on first use
+_llm = None
+_llm_lock = threading.Lock()
+
+
+def get_llm():
+    """Get the schema-constrained ChatOllama client, creating it on the first call."""
+    global _llm
+    if _llm is None:
+        with _llm_lock:
+            if _llm is None:
+                from langchain_ollama import ChatOllama
+                from llm_cache import get_llm_cache
+                _llm = ChatOllama(
+                    model=MODEL_NAME,
+                    temperature=TEMPERATURE,
+                    format=Resume.model_json_schema(),
+                    cache=get_llm_cache(),
+                    callbacks=telemetry.llm_callbacks()
+                )
+    return _llm
+
+PROMPT = """{instructions}
+
+Resume Text:
+{resume_text}"""
+
+
+# Validators for each top-level Resume field
+FIELD_VALIDATORS = {
+    "contact": TypeAdapter(ContactInfo),
+    "summary": TypeAdapter(Optional[str]),
+    "skills": TypeAdapter(List[str]),
+    "experience": TypeAdapter(List[JobExperience]),
+    "education": TypeAdapter(List[Education]),
+}
+
+
+def validate_fields(data: dict) -> tuple:
+    """
+    Validate each Resume field on its own.
+
+    Args:
+        data: Decoded JSON from the model
+
+    Returns:
+        (valid fields dict, list of field names that failed)
+    """
+    valid = {}
+    failed = []
+
+    for field, validator in FIELD_VALIDATORS.items():
+        try:
+            value = validator.validate_python(data.get(field))
+        except ValidationError:
+            failed.append(field)
+            continue
+
+        # Same phone rule as the two-pass parser: exactly 10 digits
+        if field == "contact":
+            phone = re.sub(r'\D', '', value.phone)
+            if len(phone) == 11 and phone.startswith('1'):
+                phone = phone[1:]
+            if len(phone) != 10:
+                failed.append(field)
+                continue
+            value = value.model_copy(update={"phone": phone})
+
+        valid[field] = value
+
+    return valid, failed
+
+
+def parse_resume(resume_text: str, concurrency: int = EXTRACTION_CONCURRENCY) -> Resume:
+    """
+    Parse resume with one schema-constrained LLM call.
+
+    Args:
+        resume_text: Raw text from resume
+        concurrency: Max LLM calls in flight when falling back to two-pass
+
+    Returns:
+        Resume object with structured data
+    """
+    print("      → Extracting all fields (schema-constrained)...")
+    with telemetry.span("extract_all"):
+        response = get_llm().invoke(PROMPT.format(instructions=EXTRACTION_PROMPT, resume_text=resume_text))
+
+    try:
+        data = json.loads(response.content)
+        if not isinstance(data, dict):
+            data = {}
+    except json.JSONDecodeError:
+        data = {}
+
+    with telemetry.span("validate") as validation:
+        fields, failed = validate_fields(data)
+        validation.set(failed=list(failed))
+
+    # Education has no two-pass extractor - an invalid list just becomes empty
+    if "education" in failed:
+        failed.remove("education")
+        fields["education"] = []
+
+    if failed:
+        print(f"      → Falling back to two-pass for: {', '.join(failed)}")
+        tasks = [
+            (resume_text, *parser_production.FIELD_EXTRACTORS[field][:2], field)
+            for field in failed
+        ]
+        with telemetry.span("fallback", fields=list(failed), retries=len(failed)):
+            results = parser_production.two_pass_extract_many(tasks, concurrency)
+        for field, result in zip(failed, results):
+            fields[field] = parser_production.FIELD_EXTRACTORS[field][2](result)
+
+    # Same skill names as the other engines ("JS" → "JavaScript")
+    fields["skills"] = get_skill_dictionary().canonicalize(fields.get("skills", []))
+    return Resume(**fields)
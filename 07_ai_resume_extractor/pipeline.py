@@ -0,0 +1,543 @@
+"""
+Pipelined Resume Ingestion
+
+Runs the extraction workflow as concurrent stages instead of one file at a time:
+1. Loader: extracts text from files (in worker processes) into a bounded queue
+2. Parsers: a pool of workers calling the AI parser (most time is spent waiting on Ollama).
+   With a batch-capable engine, each worker parses up to PARSE_BATCH_SIZE
+   queued resumes together (see parser_production.parse_resumes)
+3. Writer: a single thread saving results to SQLite in batched transactions
+   and deleting source files
+
+Every file is checkpointed in the job ledger (jobs.py). A restarted run skips
+files already saved, saves stored LLM results without re-parsing, and only
+deletes a source file after its resume is committed.
+
+The bounded queues keep memory flat on huge batches: the loader blocks when
+parsers fall behind, and parsers block when the writer falls behind.
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from config import (SOURCE_FOLDER, LOAD_WORKERS, PARSE_WORKERS, QUEUE_SIZE, REPORT_INTERVAL,
+                    WRITE_BATCH_SIZE, PARSE_BATCH_SIZE, NEAR_DUPLICATE_ENABLED, NEAR_DUPLICATE_REUSE,
+                    load_parser, load_batch_parser)
+from file_loader import (iter_resume_files, iter_resumes_parallel, list_resume_files, compute_file_hash,
+                         compute_text_hash)
+from database import ResumeRepository
+from jobs import JobLedger, PENDING, EXTRACTING, PARSING, SAVED
+from near_duplicates import NearDuplicateIndex
+import telemetry
+import vector_index
+
+
+# Marks the end of the stream on a queue
+_DONE = object()
+
+
+# ============================================================
+# STAGE STATISTICS
+# ============================================================
+
+class StageStats:
+    """Thread-safe counters for one pipeline stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, ok: bool = True):
+        """Record one item handled by this stage."""
+        with self._lock:
+            self.busy_seconds += seconds
+            if ok:
+                self.processed += 1
+            else:
+                self.failed += 1
+
+    def throughput(self, elapsed: float) -> float:
+        """Items per second since the pipeline started."""
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+
+# ============================================================
+# STAGES
+# ============================================================
+
+def _plan_jobs(ledger: JobLedger, source_folder: Path) -> tuple:
+    """
+    Check every file against the job ledger before anything runs.
+
+    Returns:
+        (files to extract, recovered parse_queue items, number of skipped files)
+    """
+    to_extract = []
+    recovered = []
+    skipped = 0
+
+    for file_path in list_resume_files(source_folder):
+        filename = file_path.name
+        file_hash = compute_file_hash(str(file_path))
+        job = ledger.begin(filename, file_hash)
+
+        if job["status"] == SAVED:
+            # Committed by an earlier run that stopped before deleting the file
+            file_path.unlink()
+            print(f"🗑️  {filename} was already saved (resume ID {job['resume_id']}) - deleted")
+        elif ledger.exhausted(job):
+            skipped += 1
+            print(f"⏭️  Skipping {filename}: failed {job['attempts']} times ({job['last_error']})")
+        elif job["result"]:
+            # Parsed by an earlier run but never saved - no LLM calls needed
+            ledger.mark(filename, PARSING, new_attempt=True)
+            stored = (ledger.stored_result(job), job["content_hash"])
+            recovered.append((filename, None, file_hash, stored))
+        else:
+            ledger.mark(filename, EXTRACTING, new_attempt=True)
+            to_extract.append((file_path, file_hash))
+
+    return to_extract, recovered, skipped
+
+
+def _loader(source_folder: str, parse_queue: queue.Queue, stats: StageStats, workers: int,
+            load_workers: int, to_extract: list, recovered: list, ledger: JobLedger):
+    """Read files lazily and feed the parse queue (blocks when full)."""
+    try:
+        for item in recovered:
+            parse_queue.put(item)
+
+        hashes = {file_path.name: file_hash for file_path, file_hash in to_extract}
+        paths = [file_path for file_path, _ in to_extract]
+        if load_workers > 1:
+            files = iter_resumes_parallel(source_folder, workers=load_workers, files=paths, on_error=ledger.fail,
+                                          file_hashes=hashes)
+        else:
+            files = iter_resume_files(source_folder, files=paths, on_error=ledger.fail, file_hashes=hashes)
+        while True:
+            start = time.perf_counter()
+            try:
+                filename, text = next(files)
+            except StopIteration:
+                break
+            stats.record(time.perf_counter() - start)
+            parse_queue.put((filename, text, hashes[filename], None))
+    except Exception as e:
+        print(f"❌ Loader stopped: {e}")
+    finally:
+        # One end marker per parse worker
+        for _ in range(workers):
+            parse_queue.put(_DONE)
+
+
+class _InFlightHashes:
+    """
+    Hashes claimed by parse workers, so copies in the same run are parsed once.
+
+    A copy that shows up while its first file is still in flight waits here;
+    the writer saves it as a duplicate as soon as the first file is saved.
+    """
+
+    def __init__(self):
+        self._owners = {}    # hash -> filename that claimed it
+        self._waiting = {}   # filename in flight -> copies waiting for its resume ID
+        self._saved = {}     # filename -> resume ID it was saved as
+        self._lock = threading.Lock()
+
+    def claim(self, waiter: tuple, *hashes: str) -> tuple:
+        """
+        Claim the hashes for a file, or queue it behind the copy that holds them.
+
+        Args:
+            waiter: (filename, file_hash, content_hash) of the file
+            hashes: Hashes identifying its content
+
+        Returns:
+            (claimed, resume_id): claimed=True means parse it; otherwise
+            resume_id is the saved copy's ID, or None if it now waits
+        """
+        with self._lock:
+            owner = next((self._owners[h] for h in hashes if h in self._owners), None)
+            if owner in self._waiting:
+                self._waiting[owner].append(waiter)
+                return False, None
+            if owner in self._saved:
+                return False, self._saved[owner]
+            # New content (or its first copy failed) - this file parses it
+            for h in hashes:
+                self._owners[h] = waiter[0]
+            self._waiting[waiter[0]] = []
+            return True, None
+
+    def release(self, filename: str, resume_id: Optional[int] = None) -> list:
+        """
+        A claimed file was saved (resume_id) or failed (None).
+
+        Returns:
+            Write items (filename, None, file_hash, content_hash, resume_id) for
+            the copies that waited on it (resume_id None if it failed)
+        """
+        with self._lock:
+            waiters = self._waiting.pop(filename, [])
+            if resume_id is not None:
+                self._saved[filename] = resume_id
+        return [(name, None, file_hash, content_hash, resume_id) for name, file_hash, content_hash in waiters]
+
+
+def _defer(waiters: list, ledger: JobLedger, deferred: list):
+    """Leave copies of a file that failed for the next run."""
+    for filename, *_ in waiters:
+        print(f"⏸️  {filename} waited on a copy that failed - left for the next run")
+        ledger.mark(filename, PENDING)
+        deferred.append(filename)
+
+
+class _Pending:
+    """A resume that passed the duplicate checks and needs the AI."""
+
+    __slots__ = ("filename", "text", "file_hash", "content_hash", "signature", "near_match", "start")
+
+    def __init__(self, filename, text, file_hash, content_hash, signature, near_match, start):
+        self.filename = filename
+        self.text = text
+        self.file_hash = file_hash
+        self.content_hash = content_hash
+        self.signature = signature
+        self.near_match = near_match
+        self.start = start
+
+
+def _take(parse_queue: queue.Queue, batch_size: int) -> list:
+    """Block for one item, then take up to batch_size - 1 more that are already waiting."""
+    items = [parse_queue.get()]
+    while len(items) < batch_size and items[-1] is not _DONE:
+        try:
+            items.append(parse_queue.get_nowait())
+        except queue.Empty:
+            break
+    return items
+
+
+def _prepare(item: tuple, write_queue: queue.Queue, stats: StageStats, in_flight: _InFlightHashes,
+             repo: ResumeRepository, ledger: JobLedger, near: NearDuplicateIndex, near_duplicates: list):
+    """
+    Run the checks that can skip the AI for one queued file.
+
+    Returns:
+        _Pending if the resume still has to be parsed, otherwise None
+        (already sent to the writer, or waiting for a copy in flight)
+    """
+    filename, text, file_hash, stored = item
+    start = time.perf_counter()
+
+    # Parsed by an earlier run - straight to the writer
+    if stored is not None:
+        resume_data, content_hash = stored
+        print(f"♻️  {filename} was parsed by an earlier run - saving without AI")
+        stats.record(time.perf_counter() - start)
+        write_queue.put((filename, resume_data, file_hash, content_hash, None))
+        return None
+
+    with telemetry.trace(filename), telemetry.span("prepare"):
+        content_hash = compute_text_hash(text)
+        existing_id = repo.find_duplicate(file_hash, content_hash)
+        if existing_id is not None:
+            print(f"♻️  {filename} duplicates resume ID {existing_id} - skipping AI parsing")
+            stats.record(time.perf_counter() - start)
+            write_queue.put((filename, None, file_hash, content_hash, existing_id))
+            return None
+
+        # A copy is being parsed right now - save this file as its duplicate once it's saved
+        claimed, copy_id = in_flight.claim((filename, file_hash, content_hash), file_hash, content_hash)
+        if not claimed:
+            stats.record(time.perf_counter() - start)
+            if copy_id is not None:
+                print(f"♻️  {filename} duplicates resume ID {copy_id} - skipping AI parsing")
+                write_queue.put((filename, None, file_hash, content_hash, copy_id))
+            else:
+                print(f"♻️  {filename} duplicates a file in this batch - waiting for it to be saved")
+            return None
+
+        # Slightly edited copy of a saved resume? Flag it (or reuse the saved one)
+        signature = near_match = None
+        if near is not None:
+            with telemetry.span("near_duplicate"):
+                signature = near.signature(text)
+                near_match = near.find(signature)
+        if near_match is not None:
+            near_id, similarity = near_match
+            print(f"🪞 {filename} is a near-duplicate of resume ID {near_id} ({similarity:.0%} similar)")
+            near_duplicates.append(filename)
+            if NEAR_DUPLICATE_REUSE:
+                stats.record(time.perf_counter() - start)
+                write_queue.put((filename, None, file_hash, content_hash, near_id))
+                return None
+
+        ledger.mark(filename, PARSING)
+    return _Pending(filename, text, file_hash, content_hash, signature, near_match, start)
+
+
+def _parse_all(pending: list, parse_resume, parse_resumes) -> list:
+    """Parse resumes one by one, or all together with the engine's batch parser."""
+    if parse_resumes is not None and len(pending) > 1:
+        with telemetry.span("parse_batch", size=len(pending)):
+            try:
+                return parse_resumes([p.text for p in pending])
+            except Exception as e:
+                print(f"⚠️  Batch parse failed ({e}), parsing one by one...")
+
+    results = []
+    for p in pending:
+        with telemetry.trace(p.filename), telemetry.span("parse_resume"):
+            try:
+                results.append(parse_resume(p.text))
+            except Exception as e:
+                results.append(e)
+    return results
+
+
+def _parser(parse_queue: queue.Queue, write_queue: queue.Queue, stats: StageStats,
+            in_flight: _InFlightHashes, parse_resume, repo: ResumeRepository, ledger: JobLedger,
+            near: NearDuplicateIndex, near_duplicates: list, deferred: list, parse_resumes=None,
+            batch_size: int = 1):
+    """
+    Parse resumes with AI until the loader is done (duplicates skip the AI).
+
+    With a batch parser (parse_resumes) and batch_size > 1, up to batch_size
+    queued resumes are parsed together, sharing each extractor's LLM batch.
+    """
+    done = False
+    while not done:
+        items = _take(parse_queue, batch_size if parse_resumes is not None else 1)
+        if items[-1] is _DONE:
+            items.pop()
+            done = True
+
+        pending = []
+        for item in items:
+            try:
+                prepared = _prepare(item, write_queue, stats, in_flight, repo, ledger, near, near_duplicates)
+            except Exception as e:
+                stats.record(0.0, ok=False)
+                print(f"❌ Failed to parse {item[0]}: {e}")
+                ledger.fail(item[0], e)
+                _defer(in_flight.release(item[0]), ledger, deferred)
+                continue
+            if prepared is not None:
+                pending.append(prepared)
+
+        if not pending:
+            continue
+
+        for p, result in zip(pending, _parse_all(pending, parse_resume, parse_resumes)):
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                ledger.store_result(p.filename, result, p.content_hash)
+                if p.signature is not None:
+                    near.add(p.content_hash, p.signature, p.near_match)
+            except Exception as e:
+                stats.record(time.perf_counter() - p.start, ok=False)
+                print(f"❌ Failed to parse {p.filename}: {e}")
+                ledger.fail(p.filename, e)
+                _defer(in_flight.release(p.filename), ledger, deferred)
+                continue
+
+            stats.record(time.perf_counter() - p.start)
+            write_queue.put((p.filename, result, p.file_hash, p.content_hash, None))
+
+    write_queue.put(_DONE)
+
+
+def _writer(write_queue: queue.Queue, stats: StageStats, workers: int, source_folder: Path,
+            duplicates: list, batch_size: int, ledger: JobLedger, in_flight: _InFlightHashes, deferred: list):
+    """Single DB writer: save resumes in batches, then delete their source files."""
+    remaining = workers
+    while remaining:
+        # Block for the first item, then take whatever else is already waiting
+        batch = []
+        item = write_queue.get()
+        while True:
+            if item is _DONE:
+                remaining -= 1
+            else:
+                batch.append(item)
+            if len(batch) >= batch_size or not remaining:
+                break
+            try:
+                item = write_queue.get_nowait()
+            except queue.Empty:
+                break
+
+        if batch:
+            _write_batch(ledger, batch, stats, source_folder, duplicates, in_flight, deferred)
+
+
+def _write_batch(ledger: JobLedger, batch: list, stats: StageStats, source_folder: Path,
+                 duplicates: list, in_flight: _InFlightHashes, deferred: list):
+    """Save one batch in a single transaction, then delete the saved files."""
+    start = time.perf_counter()
+
+    saved = [filename for filename, *_ in batch]
+    try:
+        ids = ledger.save(batch)
+    except Exception as e:
+        # One bad row rolls back the whole batch - retry one by one to keep the good ones
+        print(f"⚠️  Batch save failed ({e}), retrying individually...")
+        saved = []
+        ids = []
+        with telemetry.span("save_retry", rows=len(batch), retries=len(batch)):
+            for item in batch:
+                try:
+                    ids += ledger.save([item])
+                    saved.append(item[0])
+                except Exception as item_error:
+                    print(f"❌ Failed to save {item[0]}: {item_error}")
+                    ledger.fail(item[0], item_error)
+                    stats.record(0.0, ok=False)
+                    _defer(in_flight.release(item[0]), ledger, deferred)
+
+    # New resumes (not duplicates) go into the semantic search index
+    saved_items = [item for item in batch if item[0] in saved]
+    new = [(resume_id, item[1]) for resume_id, item in zip(ids, saved_items) if item[1] is not None]
+    vector_index.try_index_resumes([resume_id for resume_id, _ in new], [resume for _, resume in new])
+
+    per_item = (time.perf_counter() - start) / len(batch)
+    for filename, resume_data, *_ in batch:
+        if filename not in saved:
+            continue
+        try:
+            # Duplicates are already in the database - just remove the file
+            if resume_data is None:
+                duplicates.append(filename)
+            else:
+                print(f"✅ Saved: {resume_data.contact.name}")
+            (source_folder / filename).unlink()
+            print(f"🗑️  Deleted: {filename}")
+        except Exception as e:
+            stats.record(per_item, ok=False)
+            print(f"❌ Failed to delete {filename}: {e}")
+            continue
+        stats.record(per_item)
+
+    # Copies that waited for these files are duplicates of the saved resumes
+    waiters = []
+    for resume_id, item in zip(ids, saved_items):
+        waiters += in_flight.release(item[0], resume_id)
+    if waiters:
+        _write_batch(ledger, waiters, stats, source_folder, duplicates, in_flight, deferred)
+
+
+# ============================================================
+# REPORTING
+# ============================================================
+
+def _report(stages: list, queues: dict, elapsed: float):
+    """Print one line of per-stage throughput and queue depth."""
+    rates = " | ".join(
+        f"{s.name}: {s.processed} ok, {s.failed} failed ({s.throughput(elapsed):.2f}/s)"
+        for s in stages
+    )
+    depths = " ".join(f"{name}={q.qsize()}/{q.maxsize}" for name, q in queues.items())
+    print(f"📊 [{elapsed:6.1f}s] {rates} | queues: {depths}")
+    telemetry.write_metrics()
+
+
+# ============================================================
+# MAIN FUNCTION
+# ============================================================
+
+def run_pipeline(source_folder=SOURCE_FOLDER, workers: int = PARSE_WORKERS,
+                 load_workers: int = LOAD_WORKERS, queue_size: int = QUEUE_SIZE, report_interval: float = REPORT_INTERVAL,
+                 batch_size: int = WRITE_BATCH_SIZE, engine: str = None,
+                 parse_batch: int = PARSE_BATCH_SIZE) -> dict:
+    """
+    Process every resume in source_folder with a pool of parse workers.
+
+    Args:
+        source_folder: Folder containing resume files
+        workers: Number of concurrent parse workers
+        load_workers: Worker processes extracting text (1 = in the loader thread)
+        queue_size: Max items buffered between stages
+        report_interval: Seconds between progress reports
+        batch_size: Max resumes saved per database transaction
+        engine: Parser engine name (defaults to PARSER_ENGINE in config.py)
+        parse_batch: Max resumes a parse worker parses together (engines with
+                     parse_resumes only; 1 = one resume at a time)
+
+    Returns:
+        Dictionary with per-stage stats:
+        {"load": StageStats, "parse": StageStats, "save": StageStats,
+         "duplicates": int, "near_duplicates": int, "recovered": int, "skipped": int,
+         "deferred": int, "elapsed": float}
+    """
+    load_stats = StageStats("load")
+    parse_stats = StageStats("parse")
+    save_stats = StageStats("save")
+    stages = [load_stats, parse_stats, save_stats]
+
+    parse_queue = queue.Queue(maxsize=queue_size)
+    write_queue = queue.Queue(maxsize=queue_size)
+    queues = {"parse": parse_queue, "write": write_queue}
+
+    source_folder = Path(source_folder)
+    parse_resume = load_parser(engine)
+    parse_resumes = load_batch_parser(engine) if parse_batch > 1 else None
+    in_flight = _InFlightHashes()
+    duplicates = []
+    near_duplicates = []
+    deferred = []
+
+    # One connection shared by all stages (the repository serializes access)
+    repo = ResumeRepository()
+    ledger = JobLedger(repo)
+    near = NearDuplicateIndex(repo) if NEAR_DUPLICATE_ENABLED else None
+    to_extract, recovered, skipped = _plan_jobs(ledger, source_folder)
+
+    threads = [
+        threading.Thread(target=_loader,
+                         args=(str(source_folder), parse_queue, load_stats, workers, load_workers,
+                               to_extract, recovered, ledger),
+                         name="loader", daemon=True),
+        threading.Thread(target=_writer,
+                         args=(write_queue, save_stats, workers, source_folder, duplicates, batch_size, ledger,
+                               in_flight, deferred),
+                         name="writer", daemon=True),
+    ]
+    threads += [
+        threading.Thread(target=_parser,
+                         args=(parse_queue, write_queue, parse_stats, in_flight, parse_resume, repo, ledger,
+                               near, near_duplicates, deferred, parse_resumes, parse_batch),
+                         name=f"parser-{i}", daemon=True)
+        for i in range(workers)
+    ]
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+
+    # Report progress until the writer has drained everything
+    writer = threads[1]
+    while writer.is_alive():
+        writer.join(timeout=report_interval)
+        if writer.is_alive():
+            _report(stages, queues, time.perf_counter() - started)
+
+    for thread in threads:
+        thread.join()
+    repo.close()
+
+    elapsed = time.perf_counter() - started
+    _report(stages, queues, elapsed)
+
+    return {"load": load_stats, "parse": parse_stats, "save": save_stats,
+            "duplicates": len(duplicates), "near_duplicates": len(near_duplicates), "recovered": len(recovered), "skipped": skipped,
+            "deferred": len(deferred), "elapsed": elapsed}
@@ -0,0 +1,135 @@
+"""
+Resume Section Segmenter
+
+Splits resume text into sections (summary, skills, experience, education, ...)
+by spotting header lines such as "WORK EXPERIENCE" or "Technical Skills:",
+then picks the sections each field extractor needs and trims them to that
+field's token budget (FIELD_TOKEN_BUDGETS in config.py).
+
+Instead of sending every extractor the same first 2000 characters:
+- contact info only sees the header block at the top of the resume
+- experience sees the whole experience section, even past character 2000
+- skills and summary see their own sections
+
+Resumes without recognizable headers fall back to the start of the text.
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import re
+from functools import lru_cache
+from config import FIELD_TOKEN_BUDGETS, DEFAULT_TOKEN_BUDGET, CHARS_PER_TOKEN
+
+
+# Section name -> header spellings (matched case-insensitively, whole line)
+SECTION_HEADERS = {
+    "contact": ["contact", "contact info", "contact information", "personal details", "personal information"],
+    "summary": ["summary", "professional summary", "career summary", "profile", "professional profile",
+                "objective", "career objective", "about", "about me"],
+    "skills": ["skills", "technical skills", "key skills", "core skills", "core competencies",
+               "competencies", "technologies", "tech stack", "tools", "skills and tools", "expertise"],
+    "experience": ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "career history", "relevant experience"],
+    "education": ["education", "academic background", "qualifications", "academic qualifications"],
+    "projects": ["projects", "personal projects", "key projects"],
+    "certifications": ["certifications", "certificates", "licenses", "licenses and certifications"],
+    "other": ["awards", "achievements", "publications", "languages", "interests", "hobbies",
+              "volunteering", "references"],
+}
+
+# Text before the first header (name, email, phone, ...)
+HEADER_SECTION = "header"
+
+# Field -> sections to send, most important first
+FIELD_SECTIONS = {
+    "contact": [HEADER_SECTION, "contact"],
+    "skills": ["skills", "summary", "projects"],
+    "summary": ["summary", HEADER_SECTION, "experience", "skills"],
+    "experience": ["experience", "projects"],
+    "education": ["education", "certifications"],
+}
+
+_HEADER_LOOKUP = {
+    spelling: section
+    for section, spellings in SECTION_HEADERS.items()
+    for spelling in spellings
+}
+
+# One alternation over every spelling, longest first so "work experience" wins over "experience"
+_HEADER_RE = re.compile(
+    r"^[ \t#*•=_-]*(" + "|".join(
+        re.escape(s).replace(r"\ ", r"\s+") for s in sorted(_HEADER_LOOKUP, key=len, reverse=True)
+    ) + r")[ \t]*[:\-–—]?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+@lru_cache(maxsize=64)
+def split_sections(text: str) -> dict:
+    """
+    Split resume text into sections.
+
+    Args:
+        text: Raw resume text
+
+    Returns:
+        Dictionary of section name -> text (without the header line).
+        Text before the first header is under "header". Sections that
+        appear more than once are joined.
+    """
+    sections = {}
+    name = HEADER_SECTION
+    start = 0
+
+    for match in _HEADER_RE.finditer(text):
+        body = text[start:match.start()].strip()
+        if body:
+            sections[name] = f"{sections[name]}\n\n{body}" if name in sections else body
+        name = _HEADER_LOOKUP[" ".join(match.group(1).lower().split())]
+        start = match.end()
+
+    body = text[start:].strip()
+    if body:
+        sections[name] = f"{sections[name]}\n\n{body}" if name in sections else body
+
+    return sections
+
+
+def clip(text: str, max_chars: int) -> str:
+    """Cut text to max_chars, at a line break when there is one in the last quarter."""
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind("\n", 0, max_chars)
+    return text[:cut] if cut > max_chars * 3 // 4 else text[:max_chars]
+
+
+def token_budget(field: str) -> int:
+    """Approximate prompt tokens a field's resume text may use."""
+    return FIELD_TOKEN_BUDGETS.get(field, DEFAULT_TOKEN_BUDGET)
+
+
+def route_text(text: str, field: str = None) -> str:
+    """
+    Select the part of a resume one field extractor should see.
+
+    Args:
+        text: Raw resume text
+        field: "contact", "skills", "summary", "experience", "education"
+               (None = start of the text under the default budget)
+
+    Returns:
+        Relevant sections joined together, trimmed to the field's token budget
+    """
+    max_chars = token_budget(field) * CHARS_PER_TOKEN
+    sections = split_sections(text)
+
+    # No headers found - nothing to route on
+    if field not in FIELD_SECTIONS or list(sections) == [HEADER_SECTION]:
+        return clip(text, max_chars)
+
+    parts = [sections[name] for name in FIELD_SECTIONS[field] if name in sections]
+    if not parts:
+        return clip(text, max_chars)
+
+    return clip("\n\n".join(parts), max_chars)
@@ -0,0 +1,241 @@
+"""
+Skill Dictionary (Aho-Corasick)
+
+Turns skill mentions into canonical names without an LLM call.
+skill_aliases.json maps every canonical skill to its spellings ("JS",
+"Javascript", "ECMAScript" -> "JavaScript"), and they are compiled into an
+Aho-Corasick automaton over words: one left-to-right pass over the text
+finds every alias at once, however large the dictionary.
+
+- Text is lowercased and split into words that keep skill punctuation
+  ("c++", "c#", "node.js", ".net"); "/" and "-" split words, and aliases
+  are split the same way, so "CI/CD" and "ci cd" both match
+- Overlapping matches resolve leftmost-longest ("React Native", not "React");
+  a multi-word alias never spans two list items
+- Aliases that are common words (_list_only: "go", "spring", "excel") only
+  count as a whole list item ("Python, Go, SQL"), not in running text
+
+parser_production.extract_skills scans the skills section with it and only
+asks the LLM about the items it does not know.
+
+Usage:
+    from skills import get_skill_dictionary
+    dictionary = get_skill_dictionary()
+    dictionary.scan("Python, JS and k8s")       # ['Python', 'JavaScript', 'Kubernetes']
+    dictionary.canonical("Javascript")           # 'JavaScript'
+    dictionary.canonicalize(["js", "Foo"])       # ['JavaScript', 'Foo']
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import json
+import re
+import threading
+import zlib
+from collections import deque
+from typing import Iterable, List, Optional
+from config import SKILL_ALIASES_FILE
+
+
+# Words of text or an alias: letters/digits plus the punctuation skill names use
+_TOKEN_RE = re.compile(r"\.?[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+# Text between two words that ends a list item (or a sentence)
+_ITEM_BREAK_RE = re.compile(r"[,;:|&•·()\[\]\n.]")
+_JOINERS = {"and", "or"}
+
+# Splits a skills-section line into items (not on "/", so "CI/CD" stays whole)
+_ITEM_SPLIT_RE = re.compile(r"[,;|•·]|\s+(?:and|&)\s+")
+
+# Skills-section items longer than this are sentences, not unknown skill names
+MAX_TERM_WORDS = 4
+MAX_TERM_CHARS = 40
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SkillDictionary:
+    """
+    Alias dictionary compiled into a word-level Aho-Corasick automaton.
+
+    Args:
+        aliases: Canonical skill name -> list of other spellings
+        list_only: Aliases that only match as a whole list item
+    """
+
+    def __init__(self, aliases: dict, list_only: Iterable[str] = (), fingerprint: int = 0):
+        self.fingerprint = fingerprint
+        list_only = {" ".join(_tokens(a)) for a in list_only}
+
+        # Trie: goto[state][word] -> state; out[state] -> [(words, skill, list_only)]
+        self._goto = [{}]
+        self._out = [[]]
+        self._exact = {}
+        for skill, spellings in aliases.items():
+            for alias in [skill, *spellings]:
+                words = _tokens(alias)
+                key = " ".join(words)
+                if not words or key in self._exact:
+                    continue
+                self._exact[key] = skill
+                state = 0
+                for word in words:
+                    if word not in self._goto[state]:
+                        self._goto.append({})
+                        self._out.append([])
+                        self._goto[state][word] = len(self._goto) - 1
+                    state = self._goto[state][word]
+                self._out[state].append((len(words), skill, key in list_only))
+
+        # Failure links (breadth first); each state also reports its suffix states' matches
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and word not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(word, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    @classmethod
+    def from_file(cls, path=SKILL_ALIASES_FILE) -> "SkillDictionary":
+        """Load skill_aliases.json (keys starting with "_" are settings, not skills)."""
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = json.loads(raw)
+        aliases = {skill: spellings for skill, spellings in data.items() if not skill.startswith("_")}
+        return cls(aliases, data.get("_list_only", []), zlib.crc32(raw))
+
+    def __len__(self):
+        return len(self._exact)
+
+    # -------------------- lookup --------------------
+
+    def scan(self, text: str) -> List[str]:
+        """
+        Canonical skills mentioned in a text, in order of first mention.
+
+        One pass over the words; overlapping aliases resolve leftmost-longest.
+        """
+        # breaks[i]: how strongly word i is separated from the previous one -
+        # 0 = same item, 1 = "/" or and/or (splits items, not "ci/cd"), 2 = new item
+        words, breaks = [], []
+        last = 0
+        lowered = text.lower()
+        for match in _TOKEN_RE.finditer(lowered):
+            word = match.group()
+            if not words or _ITEM_BREAK_RE.search(lowered, last, match.start()):
+                breaks.append(2)
+            else:
+                breaks.append(1 if word in _JOINERS or words[-1] in _JOINERS
+                              or "/" in lowered[last:match.start()] else 0)
+            words.append(word)
+            last = match.end()
+        breaks.append(2)
+
+        goto, fail, out = self._goto, self._fail, self._out
+        matches = []
+        state = 0
+        for end, word in enumerate(words):
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            for length, skill, list_only in out[state]:
+                start = end - length + 1
+                if length > 1 and max(breaks[start + 1:end + 1]) == 2:
+                    continue  # "AWS (EC2" is two items, not "aws ec2"
+                if list_only and not (breaks[start] and breaks[end + 1]):
+                    continue
+                matches.append((start, -length, skill))
+
+        found = {}
+        covered = 0
+        for start, length, skill in sorted(matches):
+            if start >= covered:
+                found.setdefault(skill, None)
+                covered = start - length
+        return list(found)
+
+    def canonical(self, term: str) -> Optional[str]:
+        """Canonical name of a whole term ("Javascript" -> "JavaScript"), or None if unknown."""
+        return self._exact.get(" ".join(_tokens(term)))
+
+    def canonicalize(self, skills: Iterable[str]) -> List[str]:
+        """
+        Map a skill list (e.g. from the LLM) to canonical names.
+
+        Known terms become their canonical name, terms that mention known
+        skills ("Python scripting") become those skills, anything else is
+        kept as written. Duplicates (ignoring case) are dropped.
+        """
+        result = {}
+        for skill in skills:
+            skill = skill.strip()
+            if not skill:
+                continue
+            canonical = self.canonical(skill)
+            for name in [canonical] if canonical else (self.scan(skill) or [skill]):
+                result.setdefault(name.lower(), name)
+        return list(result.values())
+
+    def unknown_terms(self, section: str) -> List[str]:
+        """
+        Items of a skills section that mention no known skill.
+
+        "Languages: Python, Foo" -> ["Foo"]. Long items (sentences) are skipped.
+        """
+        terms = {}
+        for line in section.splitlines():
+            line = line.rsplit(":", 1)[-1]  # drop "Languages:"-style labels
+            for item in _ITEM_SPLIT_RE.split(line):
+                # Bullets on the left, trailing dots on the right (".NET" keeps its dot)
+                item = item.lstrip(" \t-–*").rstrip(" \t-–*.")
+                if (2 <= len(item) <= MAX_TERM_CHARS and len(item.split()) <= MAX_TERM_WORDS
+                        and any(c.isalpha() for c in item) and not self.scan(item)):
+                    terms.setdefault(item.lower(), item)
+        return list(terms.values())
+
+
+def skill_key(skill: str) -> str:
+    """Comparison key for a skill: its canonical name if known, lowercased."""
+    canonical = get_skill_dictionary().canonical(skill)
+    return " ".join((canonical or skill).lower().split())
+
+
+_dictionary = None
+_dictionary_lock = threading.Lock()
+
+
+def get_skill_dictionary() -> SkillDictionary:
+    """The shared dictionary from SKILL_ALIASES_FILE, compiled on first use."""
+    global _dictionary
+    if _dictionary is None:
+        with _dictionary_lock:
+            if _dictionary is None:
+                _dictionary = SkillDictionary.from_file()
+    return _dictionary
+
+
+# ============================================================
+# COMMAND LINE
+# ============================================================
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python skills.py resume.txt | \"Python, JS, k8s\"")
+        sys.exit(1)
+
+    from pathlib import Path
+    source = Path(sys.argv[1])
+    text = source.read_text(encoding="utf-8") if source.is_file() else sys.argv[1]
+    dictionary = get_skill_dictionary()
+    print(f"📚 {len(dictionary)} aliases from {SKILL_ALIASES_FILE.name}")
+    print(f"🧰 Skills: {', '.join(dictionary.scan(text)) or '(none)'}")
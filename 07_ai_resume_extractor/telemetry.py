@@ -0,0 +1,379 @@
+"""
+Per-Stage Telemetry (spans + metrics)
+
+Records a span for every stage a resume goes through - load, each
+extract_* call, every LLM request, validation and the database save - with
+its duration, prompt/completion tokens and retry count.
+
+- Spans are appended to TELEMETRY_SPANS_FILE as JSON lines
+- Totals per span name go to TELEMETRY_METRICS_FILE in the Prometheus
+  textfile format (histogram of durations, token and retry counters)
+- print_summary() shows where the batch spent its time, e.g. whether PDF
+  parsing, the LLM or SQLite is the bottleneck
+
+Usage:
+    with telemetry.trace("resume1.pdf"):
+        with telemetry.span("load"):
+            text = load_resume_file(path)
+        with telemetry.span("extract_skills") as s:
+            ...
+            s.add(retries=1)
+
+Spans nest automatically (contextvars), including inside llm.batch threads.
+LLM calls are recorded by the callback handler from llm_callbacks().
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from config import TELEMETRY_ENABLED, TELEMETRY_SPANS_FILE, TELEMETRY_METRICS_FILE
+
+
+# Histogram buckets for span durations (seconds)
+DURATION_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+METRIC_PREFIX = "resume_extractor"
+
+# Span name used for each LLM request
+LLM_SPAN = "llm"
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+_current_trace = contextvars.ContextVar("current_trace", default=None)
+_span_ids = itertools.count(1)
+_lock = threading.Lock()
+
+
+# ============================================================
+# SPANS
+# ============================================================
+
+class Span:
+    """One timed stage. Attributes end up as fields of the JSON line."""
+
+    __slots__ = ("name", "id", "parent", "trace", "attrs", "started", "duration", "status", "error")
+
+    def __init__(self, name: str, attrs: dict):
+        parent = _current_span.get()
+        self.name = name
+        self.id = next(_span_ids)
+        self.parent = parent.id if parent else None
+        self.trace = _current_trace.get()
+        self.attrs = attrs
+        self.started = time.time()
+        self.duration = 0.0
+        self.status = "ok"
+        self.error = None
+
+    def set(self, **attrs):
+        """Set attributes (e.g. rows=32)."""
+        with _lock:
+            self.attrs.update(attrs)
+
+    def add(self, **counts):
+        """Increment numeric attributes (e.g. retries=1, prompt_tokens=812)."""
+        with _lock:
+            for key, value in counts.items():
+                self.attrs[key] = self.attrs.get(key, 0) + value
+
+    def to_dict(self) -> dict:
+        record = {
+            "ts": round(self.started, 6),
+            "trace": self.trace,
+            "span": self.name,
+            "id": self.id,
+            "parent": self.parent,
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": self.status,
+        }
+        if self.error:
+            record["error"] = self.error
+        record.update(self.attrs)
+        return record
+
+
+class _NoopSpan:
+    """Returned when telemetry is disabled."""
+
+    def set(self, **attrs):
+        pass
+
+    def add(self, **counts):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+@contextmanager
+def trace(trace_id: str):
+    """Group every span opened inside this block under one trace (e.g. the filename)."""
+    token = _current_trace.set(trace_id)
+    try:
+        yield
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """
+    Time a block as a span (child of the enclosing span, if any).
+
+    Args:
+        name: Stage name, e.g. "load", "extract_skills", "save"
+        **attrs: Extra fields for the JSON line
+
+    Yields:
+        Span (use .set() / .add() to attach counts)
+    """
+    if not TELEMETRY_ENABLED:
+        yield _NOOP
+        return
+
+    current = Span(name, attrs)
+    token = _current_span.set(current)
+    start = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.error = str(e) or type(e).__name__
+        raise
+    finally:
+        current.duration = time.perf_counter() - start
+        _current_span.reset(token)
+        _collector.record(current)
+
+
+def record_span(name: str, seconds: float, trace_id: str = None, error: str = None, **attrs):
+    """Record a span timed elsewhere (e.g. text extraction in a worker process)."""
+    if not TELEMETRY_ENABLED:
+        return
+
+    token = _current_trace.set(trace_id) if trace_id is not None else None
+    try:
+        recorded = Span(name, attrs)
+    finally:
+        if token is not None:
+            _current_trace.reset(token)
+    recorded.started -= seconds
+    recorded.duration = seconds
+    if error:
+        recorded.status = "error"
+        recorded.error = error
+    _collector.record(recorded)
+
+
+def current_span():
+    """The innermost open span, or None."""
+    return _current_span.get()
+
+
+# ============================================================
+# COLLECTOR (JSON lines + aggregated metrics)
+# ============================================================
+
+class _Stats:
+    """Aggregated numbers for one span name."""
+
+    __slots__ = ("count", "errors", "seconds", "buckets", "prompt_tokens", "completion_tokens", "retries")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.buckets = [0] * len(DURATION_BUCKETS)
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.retries = 0
+
+
+class _Collector:
+    """Writes spans as JSON lines and keeps per-name totals for the metrics file."""
+
+    def __init__(self, spans_file: Path):
+        self.spans_file = spans_file
+        self.stats = {}
+        self._file = None
+
+    def record(self, recorded: Span):
+        line = json.dumps(recorded.to_dict(), default=str)
+        with _lock:
+            stats = self.stats.setdefault(recorded.name, _Stats())
+            stats.count += 1
+            stats.errors += recorded.status != "ok"
+            stats.seconds += recorded.duration
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if recorded.duration <= bound:
+                    stats.buckets[i] += 1
+            stats.retries += recorded.attrs.get("retries", 0)
+
+            # Tokens are counted once, from the LLM span, under the stage that made the call
+            # (parent spans also carry them in their JSON line, as a per-stage total)
+            if recorded.name == LLM_SPAN:
+                stage = self.stats.setdefault(recorded.attrs.get("stage", LLM_SPAN), _Stats())
+                stage.prompt_tokens += recorded.attrs.get("prompt_tokens", 0)
+                stage.completion_tokens += recorded.attrs.get("completion_tokens", 0)
+
+            if self._file is None:
+                Path(self.spans_file).parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.spans_file, "a", encoding="utf-8", buffering=1)
+            self._file.write(line + "\n")
+
+    def snapshot(self) -> dict:
+        with _lock:
+            return {name: _copy_stats(stats) for name, stats in self.stats.items()}
+
+
+def _copy_stats(stats: _Stats) -> _Stats:
+    copy = _Stats()
+    for field in _Stats.__slots__:
+        value = getattr(stats, field)
+        setattr(copy, field, list(value) if isinstance(value, list) else value)
+    return copy
+
+
+_collector = _Collector(TELEMETRY_SPANS_FILE)
+
+
+def write_metrics(path=None):
+    """
+    Write totals per span in the Prometheus textfile format.
+
+    Written to a temp file and renamed, so a scraper (node_exporter's
+    textfile collector) never sees a half-written file.
+    """
+    if not TELEMETRY_ENABLED:
+        return
+
+    path = Path(path or TELEMETRY_METRICS_FILE)
+    stats = _collector.snapshot()
+    p = METRIC_PREFIX
+    lines = [
+        f"# HELP {p}_span_duration_seconds Time spent per pipeline stage.",
+        f"# TYPE {p}_span_duration_seconds histogram",
+    ]
+    for name, s in sorted(stats.items()):
+        for bound, count in zip(DURATION_BUCKETS, s.buckets):
+            lines.append(f'{p}_span_duration_seconds_bucket{{span="{name}",le="{bound}"}} {count}')
+        lines.append(f'{p}_span_duration_seconds_bucket{{span="{name}",le="+Inf"}} {s.count}')
+        lines.append(f'{p}_span_duration_seconds_sum{{span="{name}"}} {s.seconds:.6f}')
+        lines.append(f'{p}_span_duration_seconds_count{{span="{name}"}} {s.count}')
+
+    counters = [
+        ("span_errors_total", "Spans that raised an error.", "errors"),
+        ("llm_prompt_tokens_total", "Prompt tokens sent to the LLM.", "prompt_tokens"),
+        ("llm_completion_tokens_total", "Completion tokens returned by the LLM.", "completion_tokens"),
+        ("retries_total", "Retries recorded by spans.", "retries"),
+    ]
+    for metric, help_text, field in counters:
+        lines.append(f"# HELP {p}_{metric} {help_text}")
+        lines.append(f"# TYPE {p}_{metric} counter")
+        for name, s in sorted(stats.items()):
+            lines.append(f'{p}_{metric}{{span="{name}"}} {getattr(s, field)}')
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def print_summary():
+    """Print time per span name, slowest first (where did the batch go?)."""
+    stats = _collector.snapshot()
+    if not stats:
+        return
+
+    print(f"⏱️  {'stage':<20} {'count':>6} {'total s':>9} {'avg ms':>9} {'errors':>7} {'tokens in/out':>15}")
+    for name, s in sorted(stats.items(), key=lambda item: item[1].seconds, reverse=True):
+        if not s.count:
+            continue
+        tokens = f"{s.prompt_tokens}/{s.completion_tokens}" if s.prompt_tokens or s.completion_tokens else "-"
+        print(f"   {name:<20} {s.count:>6} {s.seconds:>9.2f} {s.seconds / s.count * 1000:>9.1f} "
+              f"{s.errors:>7} {tokens:>15}")
+    print(f"📈 Spans: {TELEMETRY_SPANS_FILE}  Metrics: {TELEMETRY_METRICS_FILE}")
+
+
+# ============================================================
+# LLM CALLBACKS
+# ============================================================
+
+_handler = None
+
+
+def llm_callbacks() -> list:
+    """
+    Callback handlers for ChatOllama(callbacks=...) that record every LLM call
+    as an "llm" span with prompt/completion tokens (also added to the parent span).
+
+    langchain_core is imported here, not at module load, to keep startup fast.
+    """
+    global _handler
+    if not TELEMETRY_ENABLED:
+        return []
+
+    with _lock:
+        if _handler is None:
+            _handler = _make_handler()
+    return [_handler]
+
+
+def _make_handler():
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class LLMSpanHandler(BaseCallbackHandler):
+        """Times each LLM request and reads token usage from the response."""
+
+        def __init__(self):
+            self._started = {}
+
+        def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs):
+            self._started[run_id] = (time.perf_counter(), _current_span.get(), metadata or {})
+
+        def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, **kwargs):
+            self._started[run_id] = (time.perf_counter(), _current_span.get(), metadata or {})
+
+        def on_llm_end(self, response, *, run_id, **kwargs):
+            self._finish(run_id, response=response)
+
+        def on_llm_error(self, error, *, run_id, **kwargs):
+            self._finish(run_id, error=str(error) or type(error).__name__)
+
+        def _finish(self, run_id, response=None, error=None):
+            started = self._started.pop(run_id, None)
+            if started is None:
+                return
+            start, parent, metadata = started
+
+            prompt_tokens = completion_tokens = 0
+            if response is not None and response.generations and response.generations[0]:
+                usage = getattr(response.generations[0][0], "message", None)
+                usage = getattr(usage, "usage_metadata", None) or {}
+                prompt_tokens = usage.get("input_tokens", 0)
+                completion_tokens = usage.get("output_tokens", 0)
+
+            attrs = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens}
+            if parent is not None:
+                attrs["stage"] = parent.name
+            if "field" in metadata:
+                attrs["field"] = metadata["field"]
+            if parent is not None:
+                parent.add(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+
+            # Parent/trace come from the span that was open when the call started
+            token = _current_span.set(parent)
+            try:
+                record_span(LLM_SPAN, time.perf_counter() - start,
+                            trace_id=parent.trace if parent else None, error=error, **attrs)
+            finally:
+                _current_span.reset(token)
+
+    return LLMSpanHandler()
@@ -0,0 +1,19 @@
+"""Tests for skills.SkillDictionary.unknown_terms (no Ollama needed)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from skills import get_skill_dictionary
+
+
+def test_leading_dot_skill_is_known():
+    # ".NET" must not be stripped to "NET" and reported as unknown
+    terms = get_skill_dictionary().unknown_terms("Frameworks: .NET, Django, Foo.")
+    assert terms == ["Foo"]
+
+
+def test_bullets_and_trailing_dots_are_stripped():
+    terms = get_skill_dictionary().unknown_terms("- Foo.\n* Bar\n– .NET Core")
+    assert terms == ["Foo", "Bar"]
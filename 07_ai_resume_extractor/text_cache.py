@@ -0,0 +1,264 @@
+"""
+Extracted Text Cache
+
+Stores the text pulled out of each resume file (zlib-compressed, SQLite) so
+re-running the same folder - while developing, or after a failed parse -
+never runs PyPDF/Unstructured again on a file that has not changed.
+
+- Fast path: same path, size and mtime as the cached entry - the file is
+  not even opened
+- Otherwise the file's SHA-256 is compared: a touched or copied file with
+  the same bytes still hits (and its entry is updated)
+- Entries remember which loader produced them; changing the loader of an
+  extension (register_loader) makes them misses
+- Size-bounded: least recently used entries are evicted once the compressed
+  text passes max_mb
+- Hit/miss counters and the extraction time saved, for reporting
+
+Usage:
+    cache = get_text_cache()
+    text = cache.get(path, file_hash)   # None on a miss
+    if text is None:
+        text = load_resume_file(path)
+        cache.put(path, text, seconds, file_hash)
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+from config import TEXT_CACHE_ENABLED, TEXT_CACHE_FILE, TEXT_CACHE_MAX_MB, TEXT_CACHE_COMPRESSION
+
+
+TEXT_CACHE_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS text_cache (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        file_hash TEXT NOT NULL,
+        loader TEXT NOT NULL,
+        text BLOB NOT NULL,
+        text_bytes INTEGER NOT NULL,
+        stored_bytes INTEGER NOT NULL,
+        extract_seconds REAL NOT NULL,
+        last_used REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_text_cache_file_hash ON text_cache(file_hash)",
+    "CREATE INDEX IF NOT EXISTS idx_text_cache_last_used ON text_cache(last_used)",
+]
+
+SELECT_COLUMNS = "path, size, mtime_ns, file_hash, loader, text, extract_seconds"
+UPSERT_SQL = """
+    INSERT OR REPLACE INTO text_cache
+        (path, size, mtime_ns, file_hash, loader, text, text_bytes, stored_bytes, extract_seconds, last_used)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _loader_name(path: Path) -> str:
+    """Loader registered for the file's extension, e.g. 'langchain_community.document_loaders.PyPDFLoader'."""
+    # Imported here: file_loader imports this module lazily
+    from file_loader import LOADERS
+    return ".".join(LOADERS.get(path.suffix.lower(), ("", "")))
+
+
+class TextCache:
+    """LRU-bounded cache of extracted resume text, stored compressed in a SQLite file."""
+
+    def __init__(self, db_file=TEXT_CACHE_FILE, max_mb: float = TEXT_CACHE_MAX_MB,
+                 level: int = TEXT_CACHE_COMPRESSION):
+        self.db_file = db_file
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.level = level
+        self.hits = 0
+        self.hash_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.seconds_saved = 0.0
+
+        # Shared by the pipeline's loader thread and the main thread
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        with self.conn:
+            for statement in TEXT_CACHE_SCHEMA:
+                self.conn.execute(statement)
+        self._entries, self._bytes = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(stored_bytes), 0) FROM text_cache"
+        ).fetchone()
+
+    def get(self, file_path, file_hash: Optional[str] = None) -> Optional[str]:
+        """
+        Cached text of a file, or None on a miss.
+
+        Args:
+            file_path: The resume file
+            file_hash: compute_file_hash of it, if the caller already has it
+                       (only needed when size/mtime changed)
+        """
+        path = Path(file_path).resolve()
+        try:
+            stat = path.stat()
+        except OSError:
+            return None  # let the loader report the missing file
+        loader = _loader_name(path)
+
+        with self._lock:
+            row = self.conn.execute(f"SELECT {SELECT_COLUMNS} FROM text_cache WHERE path = ?",
+                                    (str(path),)).fetchone()
+            unchanged = (row is not None and row["size"] == stat.st_size and row["mtime_ns"] == stat.st_mtime_ns
+                         and row["loader"] == loader and (file_hash is None or row["file_hash"] == file_hash))
+
+        if not unchanged:
+            # Same bytes under a new mtime or path (touched, copied, re-uploaded)?
+            if file_hash is None:
+                from file_loader import compute_file_hash
+                file_hash = compute_file_hash(str(path))
+            with self._lock:
+                row = self.conn.execute(
+                    f"SELECT {SELECT_COLUMNS} FROM text_cache WHERE file_hash = ? AND loader = ? LIMIT 1",
+                    (file_hash, loader)).fetchone()
+
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            text = zlib.decompress(row["text"]).decode("utf-8")
+        except (zlib.error, UnicodeDecodeError):
+            # Unreadable entry - treat as a miss
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock, self.conn:
+            self.hits += 1
+            self.hash_hits += not unchanged
+            self.seconds_saved += row["extract_seconds"]
+            if unchanged:
+                self.conn.execute("UPDATE text_cache SET last_used = ? WHERE path = ?", (time.time(), str(path)))
+        if not unchanged:
+            # Remember this path too, so the next run takes the fast path
+            self.put(path, text, row["extract_seconds"], file_hash)
+        return text
+
+    def put(self, file_path, text: str, seconds: float = 0.0, file_hash: Optional[str] = None):
+        """
+        Store a file's extracted text, evicting least recently used entries if over the size cap.
+
+        Args:
+            file_path: The resume file
+            text: Text returned by load_resume_file
+            seconds: How long the extraction took (reported as time saved on hits)
+            file_hash: compute_file_hash of the file (computed if not given)
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        if file_hash is None:
+            from file_loader import compute_file_hash
+            file_hash = compute_file_hash(str(path))
+        raw = text.encode("utf-8")
+        blob = zlib.compress(raw, self.level)
+
+        with self._lock, self.conn:
+            old = self.conn.execute("SELECT stored_bytes FROM text_cache WHERE path = ?", (str(path),)).fetchone()
+            self.conn.execute(UPSERT_SQL, (str(path), stat.st_size, stat.st_mtime_ns, file_hash, _loader_name(path),
+                                           blob, len(raw), len(blob), seconds, time.time()))
+            if old is None:
+                self._entries += 1
+            else:
+                self._bytes -= old["stored_bytes"]
+            self._bytes += len(blob)
+
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until 10% under the cap (lock held)."""
+        target = self.max_bytes * 0.9
+        freed = []
+        for row in self.conn.execute("SELECT path, stored_bytes FROM text_cache ORDER BY last_used"):
+            if self._bytes <= target:
+                break
+            freed.append((row["path"],))
+            self._bytes -= row["stored_bytes"]
+        self.conn.executemany("DELETE FROM text_cache WHERE path = ?", freed)
+        self._entries -= len(freed)
+        self.evictions += len(freed)
+
+    def clear(self):
+        """Delete every cached text."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM text_cache")
+            self._entries = self._bytes = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters for this process, plus the size of the cache file's contents."""
+        with self._lock:
+            text_bytes = self.conn.execute("SELECT COALESCE(SUM(text_bytes), 0) FROM text_cache").fetchone()[0]
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "hash_hits": self.hash_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "seconds_saved": self.seconds_saved,
+                "entries": self._entries,
+                "stored_mb": self._bytes / 1024 / 1024,
+                "compression": text_bytes / self._bytes if self._bytes else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+# ============================================================
+# SHARED INSTANCE
+# ============================================================
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_text_cache() -> Optional[TextCache]:
+    """
+    Get the cache shared by the loaders (None when TEXT_CACHE_ENABLED is False).
+
+    Returns:
+        TextCache instance, or None to disable caching
+    """
+    global _cache
+    if not TEXT_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = TextCache()
+    return _cache
+
+
+# ============================================================
+# COMMAND LINE
+# ============================================================
+
+if __name__ == "__main__":
+    import sys
+
+    cache = TextCache()
+    if len(sys.argv) > 1 and sys.argv[1] == "--clear":
+        cache.clear()
+        print(f"🧹 Cleared {TEXT_CACHE_FILE.name}")
+    else:
+        stats = cache.stats()
+        print(f"📦 {stats['entries']} cached text(s), {stats['stored_mb']:.2f} MB compressed "
+              f"({stats['compression']:.1f}x) in {TEXT_CACHE_FILE.name}, cap {TEXT_CACHE_MAX_MB} MB")
+        print(f"   Size on disk: {os.path.getsize(TEXT_CACHE_FILE) / 1024 / 1024:.2f} MB")
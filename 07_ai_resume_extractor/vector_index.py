@@ -0,0 +1,461 @@
+"""
+Local Vector Index (semantic candidate search)
+
+Embeds each resume's summary, skills and experience at ingest time and keeps
+the vectors in a compact store next to resumes.db - no external vector DB:
+
+    resumes_vectors/
+        vectors.f16   float16 matrix, one L2-normalized row per resume (memmap)
+        signs.u64     sign bit of every dimension, 96 bytes per resume (memmap)
+        ids.i64       resume id of each row (memmap)
+        meta.json     embedding model, dimension and row count
+
+- Vectors are normalized when stored, so cosine similarity is one dot product
+- Up to EXACT_SEARCH_MAX_ROWS resumes, a query scores every row with NumPy in
+  chunks (float16 → float32 per chunk, spread over SEARCH_WORKERS threads)
+- Past that, scanning ~730 MB of float16 per query (500k x 768 dims) is too
+  slow, so the query's sign bits are compared to every row's first (Hamming
+  distance, ~48 MB) and only the RERANK_CANDIDATES closest rows get the exact
+  float16 score. Approximate, but the top few are almost always found.
+- The top k are picked with argpartition - no full sort
+- meta.json is written after the vectors, so rows from an interrupted write
+  are ignored; sync_index() embeds anything the index is missing
+
+Usage:
+    from vector_index import find_similar_candidates
+    for match in find_similar_candidates("senior python developer with AWS", k=10):
+        print(match["score"], match["name"])
+
+    python vector_index.py --sync                  # backfill existing resumes
+    python vector_index.py "data engineer, spark"  # search
+
+Author: Klement
+Date: October 16, 2026
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional
+import numpy as np
+from config import (DATABASE_FILE, VECTOR_INDEX_ENABLED, VECTOR_INDEX_DIR, EMBEDDING_MODEL,
+                    EMBEDDING_BATCH_SIZE, SEARCH_WORKERS, EXACT_SEARCH_MAX_ROWS, RERANK_CANDIDATES)
+import telemetry
+
+
+# Rows scored per chunk (768 dims → 3 MB of float32, stays in cache)
+SCORE_CHUNK_ROWS = 1024
+
+# Rows added when the files are full (grown geometrically after that)
+INITIAL_CAPACITY = 1024
+
+# nomic-embed-text is trained with task prefixes for queries vs documents
+DOCUMENT_PREFIX = "search_document: "
+QUERY_PREFIX = "search_query: "
+
+# Characters of experience text embedded per resume
+MAX_DOCUMENT_CHARS = 6000
+
+
+# ============================================================
+# EMBEDDING TEXT
+# ============================================================
+
+def resume_document(summary: Optional[str], skills: Iterable[str], experience: Iterable) -> str:
+    """
+    Text embedded for one resume: summary, skills, then each job.
+
+    Args:
+        summary: Professional summary (or None)
+        skills: Skill names
+        experience: JobExperience objects or dicts (from the database JSON)
+    """
+    parts = []
+    if summary:
+        parts.append(summary)
+    skills = list(skills or [])
+    if skills:
+        parts.append("Skills: " + ", ".join(skills))
+    for job in experience or []:
+        if not isinstance(job, dict):
+            job = job.model_dump()
+        line = " at ".join(p for p in (job.get("title"), job.get("company")) if p)
+        details = "; ".join(job.get("responsibilities") or [])
+        parts.append(f"{line}. {details}" if details else line)
+    return "\n".join(parts)[:MAX_DOCUMENT_CHARS]
+
+
+def _row_document(row) -> str:
+    """resume_document for a database row (skills/experience stored as JSON)."""
+    return resume_document(row["summary"], json.loads(row["skills"] or "[]"),
+                           json.loads(row["experience"] or "[]"))
+
+
+_embeddings = None
+_embeddings_lock = threading.Lock()
+
+
+def get_embeddings():
+    """Ollama embedding client, created on first use (keeps startup fast)."""
+    global _embeddings
+    if _embeddings is None:
+        with _embeddings_lock:
+            if _embeddings is None:
+                from langchain_ollama import OllamaEmbeddings
+                _embeddings = OllamaEmbeddings(model=EMBEDDING_MODEL)
+    return _embeddings
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows (zero rows stay zero)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def _sign_words(dim: int) -> int:
+    """uint64 words holding one sign bit per dimension."""
+    return (dim + 63) // 64
+
+
+def _sign_bits(vectors: np.ndarray) -> np.ndarray:
+    """Pack the sign of every dimension into uint64 words (one row per vector)."""
+    vectors = np.atleast_2d(vectors)
+    words = _sign_words(vectors.shape[1])
+    packed = np.zeros((len(vectors), words * 8), dtype=np.uint8)
+    bits = np.packbits(vectors > 0, axis=1)
+    packed[:, :bits.shape[1]] = bits
+    return packed.view(np.uint64)
+
+
+# ============================================================
+# VECTOR STORE
+# ============================================================
+
+class VectorIndex:
+    """
+    Float16 vectors keyed by resume id, memory-mapped from VECTOR_INDEX_DIR.
+
+    Thread-safe: writes are serialized, searches read a consistent row count.
+    """
+
+    def __init__(self, index_dir=VECTOR_INDEX_DIR, model: str = EMBEDDING_MODEL):
+        self.index_dir = Path(index_dir)
+        self.model = model
+        self.dim = None
+        self.count = 0
+        self.capacity = 0
+        self.vectors = None
+        self.signs = None
+        self.ids = None
+        self._positions = {}
+        self._lock = threading.Lock()
+        self._pool = None
+
+        meta_file = self.index_dir / "meta.json"
+        if meta_file.exists():
+            meta = json.loads(meta_file.read_text())
+            if meta["model"] != model:
+                raise ValueError(f"Vector index was built with {meta['model']}, not {model}. "
+                                 f"Delete {self.index_dir} and run: python vector_index.py --sync")
+            self.dim = meta["dim"]
+            self.count = meta["count"]
+            self._open(max(meta["capacity"], self.count))
+            self._positions = {int(resume_id): row for row, resume_id in enumerate(self.ids[:self.count])}
+
+    def __len__(self):
+        return self.count
+
+    # -------------------- storage --------------------
+
+    def _open(self, capacity: int):
+        """(Re)map the files with room for `capacity` rows, growing them if needed."""
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        files = (("vectors.f16", 2 * self.dim), ("signs.u64", 8 * _sign_words(self.dim)), ("ids.i64", 8))
+        for name, itemsize in files:
+            path = self.index_dir / name
+            with open(path, "ab") as f:
+                if f.tell() < capacity * itemsize:
+                    f.truncate(capacity * itemsize)
+
+        self.vectors = np.memmap(self.index_dir / "vectors.f16", dtype=np.float16, mode="r+",
+                                 shape=(capacity, self.dim))
+        self.signs = np.memmap(self.index_dir / "signs.u64", dtype=np.uint64, mode="r+",
+                               shape=(capacity, _sign_words(self.dim)))
+        self.ids = np.memmap(self.index_dir / "ids.i64", dtype=np.int64, mode="r+", shape=(capacity,))
+        self.capacity = capacity
+
+    def _write_meta(self):
+        meta = {"model": self.model, "dim": self.dim, "count": self.count, "capacity": self.capacity}
+        tmp = self.index_dir / "meta.json.tmp"
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, self.index_dir / "meta.json")
+
+    def add(self, resume_ids: List[int], vectors) -> int:
+        """
+        Store (or replace) the vectors of some resumes.
+
+        Args:
+            resume_ids: Resume IDs from the database
+            vectors: One embedding per ID (any float array-like)
+
+        Returns:
+            Number of rows written
+        """
+        vectors = _normalize(vectors)
+        if len(resume_ids) != len(vectors):
+            raise ValueError(f"{len(resume_ids)} ids but {len(vectors)} vectors")
+        if not len(resume_ids):
+            return 0
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(f"Expected {self.dim}-dim vectors, got {vectors.shape[1]}")
+
+            new = sum(1 for resume_id in set(resume_ids) if resume_id not in self._positions)
+            if self.count + new > self.capacity:
+                self._open(max(INITIAL_CAPACITY, self.capacity * 2, self.count + new))
+
+            signs = _sign_bits(vectors)
+            for resume_id, vector, sign in zip(resume_ids, vectors, signs):
+                row = self._positions.get(resume_id)
+                if row is None:
+                    row = self._positions[resume_id] = self.count
+                    self.ids[row] = resume_id
+                    self.count += 1
+                self.vectors[row] = vector
+                self.signs[row] = sign
+
+            # Vectors first, then the row count that makes them visible
+            self.vectors.flush()
+            self.signs.flush()
+            self.ids.flush()
+            self._write_meta()
+        return len(resume_ids)
+
+    def __contains__(self, resume_id: int) -> bool:
+        return resume_id in self._positions
+
+    def rows(self, resume_ids) -> np.ndarray:
+        """Row of each resume id in scores() order, -1 for ids not in the index."""
+        resume_ids = np.asarray(resume_ids, dtype=np.int64)
+        with self._lock:
+            stored = np.array(self.ids[:self.count]) if self.count else np.empty(0, dtype=np.int64)
+        if not len(stored):
+            return np.full(len(resume_ids), -1, dtype=np.int64)
+
+        # Sorted lookup: one searchsorted instead of a dict probe per id
+        order = np.argsort(stored, kind="stable")
+        sorted_ids = stored[order]
+        at = np.minimum(np.searchsorted(sorted_ids, resume_ids), len(stored) - 1)
+        return np.where(sorted_ids[at] == resume_ids, order[at], -1).astype(np.int64)
+
+    # -------------------- search --------------------
+
+    def _score_chunk(self, query: np.ndarray, scores: np.ndarray, start: int, end: int):
+        # astype per chunk: float16 matmul has no BLAS path and is several times slower
+        np.dot(self.vectors[start:end].astype(np.float32), query, out=scores[start:end])
+
+    def scores(self, query_vector) -> np.ndarray:
+        """Cosine similarity of the query to every stored resume (in row order)."""
+        count = self.count
+        query = _normalize(query_vector).reshape(-1)
+        scores = np.empty(count, dtype=np.float32)
+        starts = range(0, count, SCORE_CHUNK_ROWS)
+
+        if SEARCH_WORKERS > 1 and count > SCORE_CHUNK_ROWS:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix="vector-search")
+            # NumPy releases the GIL in astype/dot, so chunks really run in parallel
+            list(self._pool.map(lambda s: self._score_chunk(query, scores, s, min(s + SCORE_CHUNK_ROWS, count)),
+                                starts))
+        else:
+            for start in starts:
+                self._score_chunk(query, scores, start, min(start + SCORE_CHUNK_ROWS, count))
+        return scores
+
+    def candidates(self, query_vector, limit: int) -> np.ndarray:
+        """Rows whose sign bits are closest to the query's (Hamming distance), sorted by row."""
+        count = self.count
+        query = _sign_bits(_normalize(query_vector).reshape(1, -1))[0]
+        distances = np.empty(count, dtype=np.uint16)
+        for start in range(0, count, SCORE_CHUNK_ROWS * 16):
+            end = min(start + SCORE_CHUNK_ROWS * 16, count)
+            np.bitwise_count(self.signs[start:end] ^ query).sum(axis=1, dtype=np.uint16, out=distances[start:end])
+        return np.sort(np.argpartition(distances, limit - 1)[:limit])
+
+    def search(self, query_vector, k: int = 10, exact: bool = None) -> List[tuple]:
+        """
+        Top-k most similar resumes.
+
+        Args:
+            query_vector: Query embedding
+            k: Number of results
+            exact: Score every row (default: only up to EXACT_SEARCH_MAX_ROWS)
+
+        Returns:
+            List of (resume_id, score), best first
+        """
+        if not self.count or k <= 0:
+            return []
+        if exact is None:
+            exact = self.count <= EXACT_SEARCH_MAX_ROWS
+        limit = max(RERANK_CANDIDATES, k)
+
+        if exact or limit >= self.count:
+            rows = None
+            scores = self.scores(query_vector)
+        else:
+            rows = self.candidates(query_vector, limit)
+            query = _normalize(query_vector).reshape(-1)
+            scores = self.vectors[rows].astype(np.float32) @ query
+
+        k = min(k, len(scores))
+        top = np.argpartition(scores, len(scores) - k)[-k:]
+        top = top[np.argsort(scores[top])[::-1]]
+        rows = top if rows is None else rows[top]
+        return [(int(self.ids[row]), float(score)) for row, score in zip(rows, scores[top])]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> VectorIndex:
+    """The shared index for VECTOR_INDEX_DIR, opened on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = VectorIndex()
+    return _index
+
+
+# ============================================================
+# INGEST + SEARCH API
+# ============================================================
+
+def index_resumes(resume_ids: List[int], resumes: list, index: VectorIndex = None) -> int:
+    """
+    Embed freshly saved resumes and add them to the index.
+
+    Args:
+        resume_ids: IDs returned by the database save
+        resumes: The matching Resume objects
+
+    Returns:
+        Number of resumes indexed
+    """
+    index = get_index() if index is None else index
+    documents = [DOCUMENT_PREFIX + resume_document(r.summary, r.skills, r.experience) for r in resumes]
+    indexed = 0
+    for start in range(0, len(documents), EMBEDDING_BATCH_SIZE):
+        batch = documents[start:start + EMBEDDING_BATCH_SIZE]
+        vectors = get_embeddings().embed_documents(batch)
+        indexed += index.add(resume_ids[start:start + EMBEDDING_BATCH_SIZE], vectors)
+    return indexed
+
+
+def try_index_resumes(resume_ids: List[int], resumes: list) -> int:
+    """
+    index_resumes for the ingest path: never fails the run.
+
+    If Ollama's embedding model is unavailable the resumes stay saved, and
+    `python vector_index.py --sync` indexes them later.
+    """
+    if not VECTOR_INDEX_ENABLED or not resume_ids:
+        return 0
+    try:
+        with telemetry.span("embed", rows=len(resume_ids)):
+            return index_resumes(resume_ids, resumes)
+    except Exception as e:
+        print(f"⚠️  Could not add {len(resume_ids)} resume(s) to the vector index ({e}) - "
+              f"run: python vector_index.py --sync")
+        return 0
+
+
+def sync_index(db_file=None, index: VectorIndex = None) -> int:
+    """
+    Embed every resume in the database that the index does not have yet
+    (backfill, or rows saved while the embedding model was unavailable).
+
+    Returns:
+        Number of resumes indexed
+    """
+    index = get_index() if index is None else index
+    conn = sqlite3.connect(db_file or DATABASE_FILE)
+    conn.row_factory = sqlite3.Row
+    indexed = 0
+    try:
+        pending_ids, documents = [], []
+        rows = conn.execute("SELECT id, summary, skills, experience FROM resumes ORDER BY id")
+        for row in rows:
+            if row["id"] in index:
+                continue
+            pending_ids.append(row["id"])
+            documents.append(DOCUMENT_PREFIX + _row_document(row))
+            if len(documents) == EMBEDDING_BATCH_SIZE:
+                indexed += index.add(pending_ids, get_embeddings().embed_documents(documents))
+                pending_ids, documents = [], []
+        if documents:
+            indexed += index.add(pending_ids, get_embeddings().embed_documents(documents))
+    finally:
+        conn.close()
+    return indexed
+
+
+def find_similar_candidates(query_text: str, k: int = 10, index: VectorIndex = None,
+                            db_file=None) -> List[dict]:
+    """
+    Find the resumes most similar in meaning to a query or job description.
+
+    Args:
+        query_text: e.g. "backend engineer, Python, Kubernetes, fintech"
+        k: Number of candidates to return
+        index: Vector index (defaults to the one next to resumes.db)
+        db_file: Database to read the candidate rows from
+
+    Returns:
+        List of resume dictionaries, best match first, each with a "score"
+        (cosine similarity). Resumes deleted from the database are skipped.
+    """
+    index = get_index() if index is None else index
+    query = get_embeddings().embed_query(QUERY_PREFIX + query_text)
+    matches = index.search(query, k)
+    if not matches:
+        return []
+
+    conn = sqlite3.connect(db_file or DATABASE_FILE)
+    conn.row_factory = sqlite3.Row
+    try:
+        placeholders = ", ".join("?" * len(matches))
+        rows = conn.execute(f"SELECT * FROM resumes WHERE id IN ({placeholders})",
+                            [resume_id for resume_id, _ in matches]).fetchall()
+    finally:
+        conn.close()
+
+    by_id = {row["id"]: dict(row) for row in rows}
+    return [{**by_id[resume_id], "score": score} for resume_id, score in matches if resume_id in by_id]
+
+
+# ============================================================
+# COMMAND LINE
+# ============================================================
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print('Usage: python vector_index.py --sync | "query text" [k]')
+        sys.exit(1)
+
+    if sys.argv[1] == "--sync":
+        print(f"🧭 Indexed {sync_index()} resume(s) - {len(get_index())} in {VECTOR_INDEX_DIR}")
+    else:
+        k = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+        for match in find_similar_candidates(sys.argv[1], k):
+            print(f"{match['score']:.3f}  #{match['id']:<6} {match['name']} - {match['email']}")
@@ -8,7 +8,11 @@ Day 11: Production Hybrid RAG
 from common_config import get_model
 from langchain_community.document_loaders import TextLoader, UnstructuredMarkdownLoader, PyPDFLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_ollama import OllamaEmbeddings
+import sys
+from pathlib import Path
+# Shared helpers (rag_common/) live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from rag_common.embedding_cache import get_embeddings
 from langchain_chroma import Chroma
 from langchain_community.retrievers import BM25Retriever
 from langchain_core.runnables import RunnableParallel, RunnableLambda, RunnablePassthrough
@@ -41,14 +45,16 @@ all_docs = (
 chunks = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50).split_documents(all_docs)
 
 # Create retrievers
-embeddings = OllamaEmbeddings(model="nomic-embed-text")
+# Embeddings cached on disk: chunks/queries seen before never reach Ollama again
+embeddings = get_embeddings("nomic-embed-text")
 vector_store = Chroma.from_documents(chunks, embeddings, persist_directory=f"{BASE_DIR}/chroma_day11")
 semantic_retriever = vector_store.as_retriever(search_kwargs={"k": 10})
 bm25_retriever = BM25Retriever.from_documents(chunks)
 bm25_retriever.k = 10
 
 model = get_model(temperature=0)
-print(f"✅ Ready! Loaded {len(chunks)} chunks from 4 files\n")
+print(f"✅ Ready! Loaded {len(chunks)} chunks from 4 files")
+print(f"   Embedding cache: {embeddings.stats()['hits']} hits, {embeddings.stats()['misses']} embedded\n")
 
 
 # ============================================
@@ -1,15 +1,29 @@
-from langchain_community.document_loaders import TextLoader
+import sys
+from pathlib import Path
+# Shared helpers (rag_common/) live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from rag_common.streaming_loader import StreamingTextLoader
 from langchain_ollama import ChatOllama
 from langchain_core.messages import SystemMessage, HumanMessage
 
 
+# The whole document goes into the SystemMessage, so only read as much as
+# the model's context window can take (~2,000 tokens) - never the whole file
+MAX_CONTEXT_CHARS = 8000
+
 #step1 . Load document
 print("Step 1: Loading document")
-loader = TextLoader("day6_RAG_knowledge.txt")
-docs = loader.load()
+loader = StreamingTextLoader("day6_RAG_knowledge.txt")
+document = loader.preview(MAX_CONTEXT_CHARS + 1)
+
+if len(document) > MAX_CONTEXT_CHARS:
+	# Too big - keep whole paragraphs up to the limit (Iteration 2 fixes this properly)
+	cut = document.rfind("\n\n", 0, MAX_CONTEXT_CHARS)
+	document = document[:cut if cut > 0 else MAX_CONTEXT_CHARS]
+	print(f" ⚠️ Document is longer than {MAX_CONTEXT_CHARS} characters - using only the first part")
 
-print(f" Loaded document has {len(docs[0].page_content)} characters")
-print(f" Preview {docs[0].page_content[:100]}....\n")
+print(f" Loaded document has {len(document)} characters")
+print(f" Preview {document[:100]}....\n")
 
  # Step 2: Setup AI model
 print("Step 2: Loading AI model...")
@@ -17,7 +31,7 @@ model = ChatOllama(model="qwen3:4b", temperature=0.7)
 print("✅ Model loaded!\n")
 
 conversation_history = [
-			SystemMessage(content=f"answer based on this document {docs[0].page_content}")]
+			SystemMessage(content=f"answer based on this document {document}")]
 # Step 3: Interactive Q&A with document
 print("="*60)
 print("RAG Chatbot - Ask questions about the document!")
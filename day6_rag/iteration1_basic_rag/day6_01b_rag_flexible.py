@@ -1,7 +1,15 @@
-from langchain_community.document_loaders import TextLoader
+import sys
+from pathlib import Path
+# Shared helpers (rag_common/) live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from rag_common.streaming_loader import StreamingTextLoader
 from langchain_ollama import ChatOllama
 from langchain_core.messages import SystemMessage,HumanMessage
 
+# The whole document goes into the SystemMessage, so only read as much as
+# the model's context window can take (~2,000 tokens) - never the whole file
+MAX_CONTEXT_CHARS = 8000
+
 print("="* 60)
 print(" Document Loader \n")
 print("=" * 60)
@@ -12,16 +20,25 @@ filename = input(" \n Enter the Fie Name: ").strip()
 #step 2 : Try loading the file with error handling..
 try:
 	print(f"\n file {filename} loading....\n")
-	loader = TextLoader(filename)
-	docs = loader.load()
-	
-	char_count = len(docs[0].page_content)
-	word_count = len(docs[0].page_content.split())
+	loader = StreamingTextLoader(filename)
+	document = loader.preview(MAX_CONTEXT_CHARS + 1)
+
+	# Count the whole file block by block (lazy_load), without holding it in memory
+	for block in loader.lazy_load():
+		pass
+	char_count = loader.char_count
+	word_count = loader.word_count
 
 	print("Success")
 	print(f" characters : {char_count}\n")
 	print(f" words : {word_count} \n")
-	print(f" preview : {docs[0].page_content[:100]} \n")
+	print(f" preview : {document[:100]} \n")
+
+	if len(document) > MAX_CONTEXT_CHARS:
+		# Too big - keep whole paragraphs up to the limit (Iteration 2 fixes this properly)
+		cut = document.rfind("\n\n", 0, MAX_CONTEXT_CHARS)
+		document = document[:cut if cut > 0 else MAX_CONTEXT_CHARS]
+		print(f" ⚠️ Document is longer than {MAX_CONTEXT_CHARS} characters - the AI only gets the first {len(document)}\n")
 
 except (FileNotFoundError, RuntimeError) as e:
 	print(f" Error File {filename} not found \n")
@@ -36,7 +53,7 @@ print("Model Loaded sucessfully")
 #step 4 : Initialize conversation with document in SystemMessage
 
 conversation_history = [
-	SystemMessage(content= f" Answer based on this document: {docs[0].page_content}")
+	SystemMessage(content= f" Answer based on this document: {document}")
 ]
 
 # step 5 : Interactive Q&A lopp with memory
@@ -0,0 +1,85 @@
+"""
+Benchmark: keyword chunk search - linear scan vs inverted index (BM25)
+
+Splits test_data/langchain_1000_lines.txt like day6_02_text_splitters.py,
+repeats the chunks SCALE times (default 1000x, ~100 MB of text) and times
+a set of questions with:
+- the old loop: lowercase every chunk, any(word in chunk_text), first 3
+- KeywordIndex.search: postings of the question words only, top 3 by BM25
+
+Does not need Ollama.
+
+Usage:
+    python bench_keyword_index.py [scale]
+"""
+
+import sys
+import time
+from pathlib import Path
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from keyword_index import KeywordIndex
+
+DOCUMENT = Path(__file__).resolve().parent.parent / "test_data" / "langchain_1000_lines.txt"
+QUESTIONS = [
+    "What is RAG?",
+    "How do text splitters work?",
+    "vector database embeddings",
+    "conversation memory for chatbots",
+    "What is LCEL streaming?",
+]
+
+
+def linear_search(texts, question):
+    """The original Q&A loop search."""
+    question_words = question.lower().split()
+    relevant_chunks = []
+    for idx, text in enumerate(texts):
+        chunk_text = text.lower()
+        if any(word in chunk_text for word in question_words):
+            relevant_chunks.append((idx, text))
+    return relevant_chunks[:3]
+
+
+def time_per_question(search, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for question in QUESTIONS:
+            search(question)
+    return (time.perf_counter() - start) / repeat / len(QUESTIONS)
+
+
+def main():
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    text = DOCUMENT.read_text(encoding="utf-8")
+    chunks = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50).split_text(text)
+    texts = chunks * scale
+    size_mb = sum(len(t) for t in texts) / 1024 / 1024
+    print(f"📄 {len(chunks)} chunks x {scale} = {len(texts):,} chunks ({size_mb:.0f} MB of text)")
+
+    start = time.perf_counter()
+    index = KeywordIndex(texts)
+    build = time.perf_counter() - start
+    postings_mb = (index.chunk_ids.nbytes + index.weights.nbytes + index.starts.nbytes) / 1024 / 1024
+
+    print("\n🔍 Top 3 per question in the original document (scan vs index):")
+    single = KeywordIndex(chunks)
+    for question in QUESTIONS:
+        scan = [idx for idx, _ in linear_search(chunks, question)]
+        ranked = [idx for idx, _ in single.search(question)]
+        print(f"   {question!r}: first matches {scan} -> BM25 {ranked}")
+
+    scan_s = time_per_question(lambda q: linear_search(texts, q), 1)
+    index_s = time_per_question(index.search, 20)
+
+    print("\n" + "=" * 60)
+    print(f"KEYWORD SEARCH ({len(texts):,} chunks, {index.vocab_size:,} words)")
+    print("=" * 60)
+    print(f"   Index build (once):         {build:8.2f} s  ({postings_mb:.0f} MB of postings)")
+    print(f"   Linear scan per question:   {scan_s * 1000:8.1f} ms")
+    print(f"   Index search per question:  {index_s * 1000:8.1f} ms  ({scan_s / index_s:,.0f}x faster)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
-from langchain_community.document_loaders import TextLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+import sys
+from pathlib import Path
+# Shared helpers (rag_common/) live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from rag_common.streaming_loader import StreamingTextLoader, StreamingTextSplitter
 from langchain_ollama import ChatOllama
 from langchain_core.messages import SystemMessage,HumanMessage
+from keyword_index import KeywordIndex
 
 print("=" * 60)
 print("Iteration 2: Text Splitters  and basic Chunk search")
@@ -13,11 +17,15 @@ filename = input("\n Enter the filename : ").strip()
 # step 2 : Laod the document with error handling....
 try:
 	print(f" \n Loading '{filename}'....")
-	loader = TextLoader(filename)
-	docs = loader.load()
-
-	char_count =  len(docs[0].page_content)
-	word_count = len(docs[0].page_content.split())
+	# Read the file in blocks and split it while reading (lazy_load -> splitter),
+	# so the whole document is never held in memory as one string
+	loader = StreamingTextLoader(filename)
+	text_splitter = StreamingTextSplitter(
+		chunk_size = 500, chunk_overlap = 50)
+	chunks = list(text_splitter.split_stream(loader.lazy_load()))
+
+	char_count = loader.char_count
+	word_count = loader.word_count
 	
 	print(f"\n  Characters count : {char_count}")
 	print(f" words count : {word_count}")
@@ -28,17 +36,11 @@ except (FileNotFoundError, RuntimeError):
 
 	exit()
 
-# Step 3 :  Split the loaded Doc
+# Step 3 :  Chunks of the Doc (split while loading)
 print("\n" + "=" * 60)
 print(" Splitting the document into chunks")
 print("=" * 60)
 
-text_splitter = RecursiveCharacterTextSplitter(
-	chunk_size = 500, chunk_overlap = 50)
-
-
-chunks = text_splitter.split_documents(docs)
-
 print(f"\n Document split into {len(chunks)} chunks!")
 print(f" Original size is {char_count} characters")
 print(" Each chunk is 500 characters")
@@ -50,6 +52,11 @@ for i in range(min(3, len(chunks))):
 	print(f" length of Chunk : {len(chunks[0].page_content)} chars")
 	print(f" Preview : {chunks[0].page_content[:80]}")
 
+# Step 4b : Build the keyword index ONCE (word -> chunks containing it)
+print("\n Building keyword index....")
+index = KeywordIndex([chunk.page_content for chunk in chunks])
+print(f" Indexed {index.vocab_size} words across {len(index)} chunks")
+
 # Step 5 :Setup AI Model
 print( " Model Loading....")
 model = ChatOllama( model = "qwen3:4b", temperature = 0.7)
@@ -72,26 +79,17 @@ while True:
 	# Search the chunks
 	print(f"\n Searching {len(chunks)} chunks!...")
 
-	# Extract keywords from question
-	question_words = question.lower().split()
-	relevant_chunks = []
-
-	# Find chunks that contain question keywords - TRACK INDEX!
-	for idx, chunk in enumerate(chunks):
-		chunk_text = chunk.page_content.lower()
-		if any(word in chunk_text for word in question_words):
-			# Store BOTH chunk content AND its index number
-			relevant_chunks.append((idx, chunk.page_content))
+	# Look up only the question's words in the index and rank by BM25 - TRACK INDEX!
+	# (no loop over every chunk, and the best chunks come first)
+	results = index.search(question, k=3)
 
-	if len(relevant_chunks) == 0:
+	if len(results) == 0:
 		print(" No relevant chunks found! \n ")
 		continue
 
-
-	print(f" \n Found {len(relevant_chunks)} relevant chunks!")
-
-	# take only top 3 chunks as of now
-	top_chunks_with_idx = relevant_chunks[:3]
+	# Store BOTH chunk index AND its content
+	top_chunks_with_idx = [(idx, chunks[idx].page_content) for idx, score in results]
+	print(f" \n Found the {len(results)} best matching chunks!")
 
 	# Extract just the content for context
 	top_chunks = [content for idx, content in top_chunks_with_idx]
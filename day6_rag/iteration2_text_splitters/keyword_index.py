@@ -0,0 +1,148 @@
+"""
+Keyword Index (BM25) for chunk search
+
+Builds an inverted index over the chunks once, right after splitting:
+every word points to the chunks that contain it (its postings) together
+with how often it appears there. A question then only touches the
+postings of its own words - it never loops over (or lowercases) every
+chunk - and the chunks come back ranked by BM25, best first, instead of
+the first three matches in document order.
+
+- Whole words only: "rag" no longer matches "storage" or "fragmentation"
+- Common words ("what", "is", "the") are not indexed
+- BM25 weights are computed at build time, so a search is a few array
+  slices plus a sum per matching chunk
+
+Usage:
+    from keyword_index import KeywordIndex
+
+    index = KeywordIndex([chunk.page_content for chunk in chunks])
+    for idx, score in index.search("What is RAG?", k=3):
+        print(idx, score, chunks[idx].page_content[:80])
+"""
+
+import re
+from array import array
+from collections import Counter
+import numpy as np
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does", "for",
+    "from", "how", "i", "in", "is", "it", "of", "on", "or", "that", "the", "this",
+    "to", "was", "what", "when", "where", "which", "who", "why", "with", "you",
+}
+
+
+def tokenize(text):
+    """Lowercase words of a text, without stop words."""
+    return [word for word in WORD_RE.findall(text.lower()) if word not in STOP_WORDS]
+
+
+class KeywordIndex:
+    """
+    Inverted index over chunk texts with BM25 ranking.
+
+    Postings are stored CSR-style: the chunks containing word w are
+    chunk_ids[starts[w]:starts[w + 1]], with their BM25 weights in the
+    same slice of weights.
+
+    Args:
+        texts: Chunk texts (a chunk's position is its index in search results)
+        k1: BM25 term-frequency saturation
+        b: BM25 length normalization (0 = none, 1 = full)
+    """
+
+    def __init__(self, texts, k1=1.5, b=0.75):
+        self.vocab = {}
+        word_ids, chunk_ids, counts = array("i"), array("i"), array("i")
+        lengths = array("i")
+
+        for chunk_id, text in enumerate(texts):
+            words = tokenize(text)
+            lengths.append(len(words))
+            for word, count in Counter(words).items():
+                word_ids.append(self.vocab.setdefault(word, len(self.vocab)))
+                chunk_ids.append(chunk_id)
+                counts.append(count)
+
+        self.chunk_count = len(lengths)
+        word_ids = np.frombuffer(word_ids, dtype=np.int32)
+        order = np.argsort(word_ids, kind="stable")  # group by word, chunks stay in order
+        self.chunk_ids = np.frombuffer(chunk_ids, dtype=np.int32)[order]
+        self.starts = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(word_ids, minlength=len(self.vocab)), out=self.starts[1:])
+
+        # BM25: idf(w) * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg_length))
+        lengths = np.frombuffer(lengths, dtype=np.int32)
+        avg_length = lengths.mean() if self.chunk_count else 0.0
+        tf = np.frombuffer(counts, dtype=np.int32)[order].astype(np.float32)
+        norm = k1 * (1 - b + b * lengths[self.chunk_ids] / max(avg_length, 1.0))
+        df = np.diff(self.starts)
+        idf = np.log(1 + (self.chunk_count - df + 0.5) / (df + 0.5))
+        self.weights = (np.repeat(idf, df) * tf * (k1 + 1) / (tf + norm)).astype(np.float32)
+
+    def __len__(self):
+        return self.chunk_count
+
+    @property
+    def vocab_size(self):
+        return len(self.vocab)
+
+    def postings(self, word):
+        """Chunk ids and BM25 weights of one (already lowercased) word."""
+        word_id = self.vocab.get(word)
+        if word_id is None:
+            return self.chunk_ids[:0], self.weights[:0]
+        start, end = self.starts[word_id], self.starts[word_id + 1]
+        return self.chunk_ids[start:end], self.weights[start:end]
+
+    def search(self, query, k=3):
+        """
+        Best chunks for a query, ranked by BM25.
+
+        Args:
+            query: The question (any casing/punctuation)
+            k: How many chunks to return
+
+        Returns:
+            List of (chunk index, score), best first; empty if no word matches
+        """
+        hits = [self.postings(word) for word in dict.fromkeys(tokenize(query))]
+        hits = [(ids, weights) for ids, weights in hits if len(ids)]
+        if not hits:
+            return []
+
+        if len(hits) == 1:
+            ids, scores = hits[0]
+        else:
+            # Sum the weights of each chunk over the query words
+            ids, where = np.unique(np.concatenate([ids for ids, _ in hits]), return_inverse=True)
+            scores = np.bincount(where, weights=np.concatenate([weights for _, weights in hits]))
+
+        if len(ids) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(ids))
+        top = top[np.lexsort((ids[top], -scores[top]))]  # best first, ties in document order
+        return [(int(ids[i]), float(scores[i])) for i in top]
+
+
+# Quick test if run directly
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3:
+        print("Usage: python keyword_index.py document.txt \"question\"")
+        sys.exit(1)
+
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+    with open(sys.argv[1], encoding="utf-8") as f:
+        text = f.read()
+    texts = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50).split_text(text)
+    index = KeywordIndex(texts)
+    print(f"📚 {len(index)} chunks, {index.vocab_size} words indexed")
+    for idx, score in index.search(sys.argv[2]):
+        print(f"   Chunk #{idx} ({score:.2f}): {texts[idx][:80]!r}")
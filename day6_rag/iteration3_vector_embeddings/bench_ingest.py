@@ -0,0 +1,95 @@
+"""
+Benchmark: embedding + storing chunks - all at once vs streamed batches
+
+Indexes the chunks of test_data/langchain_1000_lines.txt repeated SCALE
+times (each copy made unique) into a fresh ChromaDB in a temp folder:
+- all at once: one embed_documents call over every chunk, one big add
+  (what day6_03_vector_embeddings.py used to do)
+- ingest_chunks with 1, 4 and 8 embedding workers, 64 chunks per batch,
+  fed from a generator
+
+and prints chunks/sec and the peak Python memory of each (tracemalloc).
+
+Does not need Ollama: a fake 768-dim embedder stands in for it and sleeps
+like a server that answers LATENCY + PER_TEXT seconds per request and
+runs requests side by side (Ollama with OLLAMA_NUM_PARALLEL > 1).
+
+Usage:
+    python bench_ingest.py [scale]
+"""
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+import chromadb
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from incremental_index import ingest_chunks
+
+DOCUMENT = Path(__file__).resolve().parent.parent / "test_data" / "langchain_1000_lines.txt"
+DIMENSIONS = 768
+LATENCY = 0.02
+PER_TEXT = 0.002
+CHROMA_MAX_BATCH = 5000
+
+
+class SlowEmbeddings(DeterministicFakeEmbedding):
+    """Fake embedder with server-like latency."""
+
+    def embed_documents(self, texts):
+        time.sleep(LATENCY + PER_TEXT * len(texts))
+        return super().embed_documents(texts)
+
+
+def stream_chunks(chunks, scale):
+    for copy in range(scale):
+        for chunk in chunks:
+            yield f"{copy}: {chunk}"
+
+
+def all_at_once(collection, embeddings, chunks, scale):
+    texts = list(stream_chunks(chunks, scale))
+    vectors = embeddings.embed_documents(texts)
+    for i in range(0, len(texts), CHROMA_MAX_BATCH):
+        collection.add(
+            ids=[f"chunk_{j}" for j in range(i, min(i + CHROMA_MAX_BATCH, len(texts)))],
+            documents=texts[i:i + CHROMA_MAX_BATCH],
+            embeddings=vectors[i:i + CHROMA_MAX_BATCH],
+        )
+    return len(texts)
+
+
+def measure(name, run):
+    with tempfile.TemporaryDirectory() as db_dir:
+        collection = chromadb.PersistentClient(path=db_dir).get_or_create_collection(name="bench")
+        tracemalloc.start()
+        start = time.perf_counter()
+        count = run(collection)
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    print(f"   {name:<28} {count / seconds:8,.0f} chunks/s   peak {peak / 1024 / 1024:7.1f} MB")
+
+
+def main():
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    text = DOCUMENT.read_text(encoding="utf-8")
+    chunks = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50).split_text(text)
+    embeddings = SlowEmbeddings(size=DIMENSIONS)
+
+    print("\n" + "=" * 60)
+    print(f"INGEST ({len(chunks) * scale:,} chunks = {len(chunks)} x {scale})")
+    print("=" * 60)
+    measure("All at once", lambda collection: all_at_once(collection, embeddings, chunks, scale))
+    for workers in (1, 4, 8):
+        measure(f"Streamed, {workers} worker(s)", lambda collection: ingest_chunks(
+            collection, embeddings, stream_chunks(chunks, scale), source="bench",
+            batch_size=64, workers=workers, progress=False)["chunks"])
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
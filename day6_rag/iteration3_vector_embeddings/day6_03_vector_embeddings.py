@@ -1,9 +1,15 @@
-from langchain_ollama import ChatOllama, OllamaEmbeddings
+from langchain_ollama import ChatOllama
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
-from langchain_community.document_loaders import TextLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 import chromadb
 from chromadb.config import Settings
+from incremental_index import ingest_chunks
+import sys
+from pathlib import Path
+# Shared helpers (rag_common/) live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from rag_common.embedding_cache import get_embeddings
+from rag_common.streaming_loader import StreamingTextLoader, StreamingTextSplitter
+import os
 
 print(" Imports loaded \n Langhcain Components ready! \n Chromadb ready \n")
 
@@ -11,17 +17,13 @@ print(" Imports loaded \n Langhcain Components ready! \n Chromadb ready \n")
 
 try:
 	filename = input(" \n Enter the filename : ").strip()
-	loader = TextLoader(filename)
-	docs = loader.load()
+	# The file is streamed in blocks later - never loaded into memory at once
+	loader = StreamingTextLoader(filename)
+	preview = loader.preview(100)
 
-	print("\n file loaded successfully")
-
-	char_count = len(docs[0].page_content)
-	word_count = len(docs[0].page_content.split())
-
-	print(f" \n length of the file : {char_count}")
-	print(f"\n Total words in the file : {word_count}")
-	print(f" \n Preview : {docs[0].page_content[:100]}.......")
+	print("\n file found successfully")
+	print(f" \n size of the file : {os.path.getsize(filename):,} bytes")
+	print(f" \n Preview : {preview}.......")
 
 except (FileNotFoundError, RuntimeError) :
 	print(f"Error loading {filename}:")
@@ -29,9 +31,10 @@ except (FileNotFoundError, RuntimeError) :
 	exit()
 
 
-print("\n Splitting up the file into chunks")
-text_splitter = RecursiveCharacterTextSplitter( chunk_size=500, chunk_overlap=50)
-chunks = text_splitter.split_documents(docs)
+print("\n Splitting up the file into chunks (lazily, while it's read)")
+text_splitter = StreamingTextSplitter( chunk_size=500, chunk_overlap=50)
+# A generator: nothing is read yet - chunks are produced as STEP 5 consumes them
+chunks = text_splitter.split_stream(loader.lazy_load())
 
 
 print("=" * 60)
@@ -39,7 +42,8 @@ print("STEP 3: Initializing embedding model...")
 print("=" * 60)
 
 # Use Nomic Embed (local, free, 768 dimensions)
-embeddings = OllamaEmbeddings(
+# with a disk cache in front: texts embedded once are never sent to Ollama again
+embeddings = get_embeddings(
       model="nomic-embed-text",
       base_url="http://localhost:11434"
   )
@@ -48,6 +52,7 @@ print("✅ Embedding model: nomic-embed-text")
 print("   - Dimensions: 768")
 print("   - Context length: 8192 tokens")
 print("   - Runs locally (free!)")
+print("   - Cached in ./embedding_cache")
 print()
 
 # Test embedding
@@ -78,44 +83,29 @@ print(f"   Collection: langchain_docs")
 print()
 
 print("=" * 60)
-print("STEP 5: Embedding and storing all chunks...")
+print("STEP 5: Syncing chunks with the vector database...")
 print("=" * 60)
 
-# Prepare data for ChromaDB
-chunk_ids = []
-chunk_texts = []
-chunk_metadatas = []
-
-for i, chunk in enumerate(chunks):
-    chunk_ids.append(f"chunk_{i}")
-    chunk_texts.append(chunk.page_content)
-    chunk_metadatas.append({
-        "source": filename,
-        "chunk_index": i,
-        "chunk_size": len(chunk.page_content)
-    })
-
-print(f"📦 Preparing {len(chunks)} chunks for embedding...")
-
-# Embed all chunks at once (batch operation)
-print(f"🔄 Embedding chunks... (this may take a moment)")
-chunk_embeddings = embeddings.embed_documents(chunk_texts)
-
-print(f"✅ Generated {len(chunk_embeddings)} embeddings")
-print(f"   Each embedding: {len(chunk_embeddings[0])} dimensions")
-print()
-
-# Store in ChromaDB
-print(f"💾 Storing in ChromaDB...")
-collection.add(
-    ids=chunk_ids,
-    documents=chunk_texts,
-    embeddings=chunk_embeddings,
-    metadatas=chunk_metadatas
-)
-
-print(f"✅ Stored {len(chunk_ids)} chunks in vector database!")
-print(f"   HNSW index built automatically for fast search")
+# Chunk ids come from source + chunk text (not chunk_0, chunk_1, ...),
+# so only chunks the collection doesn't have yet are embedded.
+# Chunks are embedded BATCH_SIZE at a time, EMBED_WORKERS requests at once,
+# and each batch is stored as soon as it's done (memory stays bounded)
+BATCH_SIZE = 64
+EMBED_WORKERS = 4
+
+print(f"📦 Streaming {filename} and comparing chunks with what ChromaDB already holds...")
+print(f"🔄 Embedding new/changed chunks only ({BATCH_SIZE} per request, {EMBED_WORKERS} at a time)...")
+stats = ingest_chunks(collection, embeddings, chunks, source=filename,
+                      batch_size=BATCH_SIZE, workers=EMBED_WORKERS)
+
+print(f"✅ Synced {stats['chunks']} chunks in vector database!")
+print(f"   File:                {loader.char_count:,} characters, {loader.word_count:,} words")
+print(f"   New (embedded):      {stats['added']}")
+print(f"   Unchanged (reused):  {stats['unchanged']}")
+print(f"   Vanished (deleted):  {stats['deleted']}")
+print(f"   Throughput:          {stats['chunks_per_sec']:,.0f} chunks/sec")
+print(f"   Embedding cache:     {embeddings.stats()['entries']} vectors, {embeddings.stats()['misses']} sent to Ollama")
+print(f"   HNSW index updated automatically for fast search")
 print()
 
 print("=" * 60)
@@ -191,7 +181,7 @@ while True:
 	if not question:
 		continue
 
-	print(f" Searching {len(chunks)} chunks with vector similarity...")
+	print(f" Searching {stats['chunks']} chunks with vector similarity...")
 
 	# Embed the question with OUR model (nomic-embed-text, 768 dim)
 	question_embedding = embeddings.embed_query(question)
@@ -0,0 +1,171 @@
+"""
+Incremental (content-addressed), streaming indexing into a ChromaDB collection
+
+Instead of positional ids ("chunk_0", "chunk_1", ...) every chunk gets an
+id derived from its source and its text. Re-running the indexer then only
+has to compare ids:
+
+- ids already in the collection  -> unchanged, NOT embedded again
+- ids not in the collection      -> new or edited chunks, embedded + upserted
+- ids in the collection only     -> chunks that vanished from the file, deleted
+
+So an unchanged file costs zero embedding calls, and a file with one edit
+costs one embed_documents call for just the chunks around the edit.
+
+Chunks are consumed as a stream, batch_size at a time: each batch with new
+chunks becomes one embed_documents request, up to `workers` requests run
+at once, and every finished batch is written to Chroma straight away. Only
+a few batches of texts and vectors are ever held in memory (plus the ids
+seen so far, to find vanished chunks at the end), so the input can be a
+generator over a file much larger than RAM.
+
+Usage:
+    from incremental_index import ingest_chunks
+
+    stats = ingest_chunks(collection, embeddings, chunks, source=filename)
+    print(stats)   # {'chunks': 297, 'added': 1, 'deleted': 1, 'unchanged': 296, ...}
+"""
+
+import hashlib
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+# Chroma only stores these metadata types
+METADATA_TYPES = (str, int, float, bool)
+
+
+def chunk_id(source, text, occurrence=1):
+    """
+    Content-addressed id of a chunk: a hash of (source, text).
+
+    If the same text appears more than once in a source, the repeats get
+    "-2", "-3", ... so ids stay unique.
+    """
+    digest = hashlib.sha256(f"{source}\0{text}".encode("utf-8")).hexdigest()[:32]
+    return digest if occurrence == 1 else f"{digest}-{occurrence}"
+
+
+def chunk_metadata(source, index, text, extra=None):
+    """Metadata stored with a chunk (plus any simple values from the Document's own metadata)."""
+    metadata = {key: value for key, value in (extra or {}).items() if isinstance(value, METADATA_TYPES)}
+    metadata.update({
+        "source": source,
+        "chunk_index": index,
+        "chunk_size": len(text),
+    })
+    return metadata
+
+
+def _stored_ids(collection, source, page_size=10000):
+    """Ids the collection holds for a source, read a page at a time."""
+    offset = 0
+    while True:
+        ids = collection.get(where={"source": source}, include=[], limit=page_size, offset=offset)["ids"]
+        yield from ids
+        if len(ids) < page_size:
+            return
+        offset += page_size
+
+
+def ingest_chunks(collection, embeddings, chunks, source, batch_size=64, workers=4, progress=True):
+    """
+    Make the collection hold exactly these chunks for this source, streaming.
+
+    Args:
+        collection: ChromaDB collection
+        embeddings: LangChain embeddings (only embed_documents is used, from
+                    several threads at once)
+        chunks: Chunk texts or Documents, in document order - any iterable,
+                e.g. a generator
+        source: Source name stored in the "source" metadata (e.g. the filename)
+        batch_size: Chunks per embed_documents request / Chroma write
+        workers: Embedding requests running at the same time
+        progress: Print a chunks/sec progress line
+
+    Returns:
+        Dict with how many chunks were seen, added, deleted, left unchanged,
+        and unchanged but moved (new chunk_index, start_index, ...:
+        metadata-only update),
+        plus seconds and chunks_per_sec
+    """
+    counts = {}  # digest -> occurrences so far (ids of this run, for vanished chunks)
+    stats = {"chunks": 0, "added": 0, "unchanged": 0, "moved": 0, "deleted": 0}
+    pending = deque()  # (future vectors, ids, texts, metadatas), oldest first
+    start = time.perf_counter()
+    last_report = start
+
+    def write(future, ids, texts, metadatas):
+        collection.upsert(ids=ids, documents=texts, embeddings=future.result(), metadatas=metadatas)
+        stats["added"] += len(ids)
+
+    chunks = iter(chunks)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            batch = list(islice(chunks, batch_size))
+            if not batch:
+                break
+
+            ids, texts, metadatas = [], [], []
+            for chunk in batch:
+                text = getattr(chunk, "page_content", chunk)
+                digest = chunk_id(source, text)
+                counts[digest] = counts.get(digest, 0) + 1
+                ids.append(chunk_id(source, text, counts[digest]))
+                texts.append(text)
+                metadatas.append(chunk_metadata(source, stats["chunks"], text, getattr(chunk, "metadata", None)))
+                stats["chunks"] += 1
+
+            # Which of these the collection already has (ids + metadata, no vectors)
+            stored = collection.get(ids=ids, include=["metadatas"])
+            stored_metadata = {
+                stored_id: metadata or {}
+                for stored_id, metadata in zip(stored["ids"], stored["metadatas"])
+            }
+            new = [i for i, id_ in enumerate(ids) if id_ not in stored_metadata]
+            # Any differing field counts: chunk_index, but also start_index and
+            # the like, which shift when text is inserted above the chunk
+            moved = [i for i, id_ in enumerate(ids)
+                     if id_ in stored_metadata and stored_metadata[id_] != metadatas[i]]
+            stats["unchanged"] += len(ids) - len(new)
+            stats["moved"] += len(moved)
+
+            if moved:
+                # Text (and so the vector) is the same - only its position/metadata changed
+                collection.update(ids=[ids[i] for i in moved], metadatas=[metadatas[i] for i in moved])
+
+            if new:
+                new_texts = [texts[i] for i in new]
+                pending.append((pool.submit(embeddings.embed_documents, new_texts),
+                                [ids[i] for i in new], new_texts, [metadatas[i] for i in new]))
+
+            # Write finished batches in order; wait once 2 x workers are queued (bounded memory)
+            while pending and (len(pending) >= 2 * workers or pending[0][0].done()):
+                write(*pending.popleft())
+
+            if progress and time.perf_counter() - last_report >= 1.0:
+                last_report = time.perf_counter()
+                rate = stats["chunks"] / (last_report - start)
+                print(f"\r   {stats['chunks']:,} chunks, {stats['added']:,} embedded "
+                      f"({rate:,.0f} chunks/s, {len(pending)} batches in flight)", end="", flush=True)
+
+        while pending:
+            write(*pending.popleft())
+
+    # Chunks of this source that weren't in the stream any more
+    def seen(id_):
+        digest, _, occurrence = id_.partition("-")
+        return counts.get(digest, 0) >= (int(occurrence) if occurrence.isdigit() else 1)
+
+    vanished = [id_ for id_ in _stored_ids(collection, source) if not seen(id_)]
+    for i in range(0, len(vanished), 5000):
+        collection.delete(ids=vanished[i:i + 5000])
+    stats["deleted"] = len(vanished)
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["chunks_per_sec"] = stats["chunks"] / stats["seconds"] if stats["seconds"] else 0.0
+    if progress:
+        print(f"\r   {stats['chunks']:,} chunks, {stats['added']:,} embedded "
+              f"in {stats['seconds']:.1f}s ({stats['chunks_per_sec']:,.0f} chunks/s)" + " " * 20)
+    return stats
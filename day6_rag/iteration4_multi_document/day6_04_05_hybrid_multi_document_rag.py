@@ -7,7 +7,11 @@ Day 6 Hybrid Multi-Document RAG
 
 from langchain_community.document_loaders import TextLoader, UnstructuredMarkdownLoader, PyPDFLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_ollama import OllamaEmbeddings
+import sys
+from pathlib import Path
+# Shared helpers (rag_common/) live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from rag_common.embedding_cache import get_embeddings
 from langchain_chroma import Chroma
 from langchain_community.retrievers import BM25Retriever
 from langchain_ollama import ChatOllama
@@ -64,13 +68,15 @@ for idx, chunk in enumerate(chunks):
 print(f" Created {len(chunks)} chunks with metadata")
 
 # Create semantic retriever
-embeddings = OllamaEmbeddings(model="nomic-embed-text")
+# Embeddings cached on disk (./embedding_cache): re-runs don't re-embed the same chunks
+embeddings = get_embeddings("nomic-embed-text")
 vector_store = Chroma.from_documents( documents=chunks, embedding=embeddings, persist_directory="./chroma_hybrid_db")
 
 semantic_retriever = vector_store.as_retriever( search_kwargs={"k": 20})
 
 
 print("Semantic search Ready")
+print(f"Embedding cache: {embeddings.stats()['hits']} hits, {embeddings.stats()['misses']} embedded")
 
 # Create BM25 keyword retriever
 
@@ -0,0 +1,11 @@
+"""
+Helpers shared by the RAG scripts (day6_rag iterations, day11_production_rag)
+
+One copy of each module, imported by every script that needs it:
+- embedding_cache: persistent, memory-mapped embedding cache
+- streaming_loader: block-by-block text loader + streaming splitter
+
+Scripts put the repo root on sys.path first, e.g. from day6_rag/iteration3_vector_embeddings/:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from rag_common.embedding_cache import get_embeddings
+"""
@@ -0,0 +1,75 @@
+"""
+Benchmark: persistent embedding cache
+
+Fills a fresh cache (temp folder) with the chunks of
+test_data/langchain_1000_lines.txt repeated SCALE times, each made unique,
+then measures:
+- restart: opening the cache again (index replay + memmap)
+- embed_documents on cached texts (what the scripts call)
+- lookup on cached texts (zero-copy views, no list conversion)
+- file size with float32 and float16
+
+Uses a fake 768-dim embedder instead of Ollama (no embedding server
+needed) - with nomic-embed-text every miss is a ~10-50 ms server call.
+
+Usage:
+    python rag_common/bench_embedding_cache.py [scale]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from embedding_cache import CachedEmbeddings
+
+DOCUMENT = Path(__file__).resolve().parent.parent / "day6_rag" / "test_data" / "langchain_1000_lines.txt"
+DIMENSIONS = 768
+
+
+def main():
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    text = DOCUMENT.read_text(encoding="utf-8")
+    chunks = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50).split_text(text)
+    texts = [f"{copy}: {chunk}" for copy in range(scale) for chunk in chunks]
+    print(f"📄 {len(texts):,} unique chunks ({len(chunks)} x {scale})")
+
+    for dtype in ("float32", "float16"):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            fake = DeterministicFakeEmbedding(size=DIMENSIONS)
+            cached = CachedEmbeddings(fake, model="fake", cache_dir=cache_dir, dtype=dtype, max_mb=4096)
+            start = time.perf_counter()
+            cached.embed_documents(texts)
+            fill = time.perf_counter() - start
+            cached.cache.close()
+
+            start = time.perf_counter()
+            cached = CachedEmbeddings(fake, model="fake", cache_dir=cache_dir, dtype=dtype, max_mb=4096)
+            restart = time.perf_counter() - start
+
+            start = time.perf_counter()
+            cached.embed_documents(texts)
+            embed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            views = cached.lookup(texts)
+            lookup = time.perf_counter() - start
+            assert all(view is not None for view in views) and cached.stats()["misses"] == 0
+
+            stats = cached.stats()
+            cached.cache.close()
+
+        print("\n" + "=" * 60)
+        print(f"EMBEDDING CACHE ({stats['entries']:,} vectors x {DIMENSIONS} {dtype}, {stats['size_mb']:.0f} MB)")
+        print("=" * 60)
+        print(f"   Fill (fake embedder, all misses): {fill:8.2f} s")
+        print(f"   Restart (index replay + memmap):  {restart * 1000:8.1f} ms")
+        print(f"   embed_documents, all hits:        {embed / len(texts) * 1e6:8.1f} µs per text")
+        print(f"   lookup (zero-copy views):         {lookup / len(texts) * 1e6:8.1f} µs per text")
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
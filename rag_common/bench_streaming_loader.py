@@ -0,0 +1,82 @@
+"""
+Benchmark: load() + split_documents() vs the streaming loader/splitter
+
+Writes test_data/langchain_1000_lines.txt repeated SCALE times (default
+300x, ~30 MB) to a temp file, then splits it:
+- TextLoader.load() + RecursiveCharacterTextSplitter.split_documents()
+- StreamingTextLoader.lazy_load() -> StreamingTextSplitter.split_stream(),
+  counting the chunks as they come (nothing kept)
+
+and prints time, chunks and peak Python memory (tracemalloc) of each, and
+whether both produced the same chunks.
+
+Does not need Ollama.
+
+Usage:
+    python rag_common/bench_streaming_loader.py [scale]
+"""
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from langchain_community.document_loaders import TextLoader
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from streaming_loader import StreamingTextLoader, StreamingTextSplitter
+
+DOCUMENT = Path(__file__).resolve().parent.parent / "day6_rag" / "test_data" / "langchain_1000_lines.txt"
+
+
+def measure(run):
+    """Result, seconds and peak MB of run (timed without tracemalloc, which slows it down)."""
+    start = time.perf_counter()
+    result = run()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak / 1024 / 1024
+
+
+def load_and_split(path):
+    docs = TextLoader(path).load()
+    chunks = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50).split_documents(docs)
+    return [chunk.page_content for chunk in chunks]
+
+
+def stream(path, keep=False):
+    chunks = StreamingTextSplitter(chunk_size=500, chunk_overlap=50).split_stream(
+        StreamingTextLoader(path).lazy_load())
+    if keep:
+        return [chunk.page_content for chunk in chunks]
+    return sum(1 for _ in chunks)
+
+
+def main():
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    text = DOCUMENT.read_text(encoding="utf-8")
+
+    with tempfile.TemporaryDirectory() as temp:
+        path = str(Path(temp) / "big.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(scale):
+                f.write(text)
+        size_mb = Path(path).stat().st_size / 1024 / 1024
+
+        loaded, load_s, load_mb = measure(lambda: load_and_split(path))
+        count, stream_s, stream_mb = measure(lambda: stream(path))
+        same = loaded == stream(path, keep=True)
+
+    print("\n" + "=" * 60)
+    print(f"LOAD + SPLIT ({size_mb:.0f} MB file, {len(loaded):,} chunks)")
+    print("=" * 60)
+    print(f"   load() + split_documents():  {load_s:6.2f} s   peak {load_mb:8.1f} MB")
+    print(f"   lazy_load() -> split_stream: {stream_s:6.2f} s   peak {stream_mb:8.1f} MB  ({count:,} chunks)")
+    print(f"   Same chunks: {'✅ yes' if same else '❌ no'}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+"""
+Persistent Embedding Cache (memory-mapped vector file)
+
+Wraps any LangChain embeddings (OllamaEmbeddings, ...) so a text is sent
+to the embedding server at most once per model - across runs, not just
+within one. Restarting a script whose chunks and test queries were seen
+before needs no embedding server at all.
+
+- Keyed by (model, text hash): every model has its own files, and a text
+  is identified by a 16-byte BLAKE2 hash of it
+- Vectors live in ONE append-only file of float32 (or float16, half the
+  size) rows, opened with numpy.memmap - a hit is a view into the mapped
+  file, not a copy (see lookup)
+- The index (hash -> row) is an append-only log of 20-byte records,
+  replayed into a dict on start
+- Size-bounded: when the vector file would pass max_mb, the least recently
+  used vectors are dropped (the file is rewritten once, down to 90%)
+
+Files in cache_dir, per model:
+    <model>.vectors   raw rows, dim x dtype each
+    <model>.index     (hash, row) records, oldest first
+    <model>.json      {"model", "dim", "dtype"}
+
+One process at a time per cache_dir (threads are fine).
+
+Usage:
+    from rag_common.embedding_cache import get_embeddings   # repo root on sys.path
+
+    embeddings = get_embeddings("nomic-embed-text")   # CachedEmbeddings(OllamaEmbeddings)
+    vectors = embeddings.embed_documents(texts)        # only misses reach Ollama
+    print(embeddings.stats())
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+INDEX_DTYPE = np.dtype([("key", "V16"), ("row", "<u4")])
+
+
+def text_key(text, kind="document"):
+    """16-byte hash of a text (queries and documents are kept apart)."""
+    return hashlib.blake2b(f"{kind}\0{text}".encode("utf-8"), digest_size=16).digest()
+
+
+class EmbeddingCache:
+    """
+    Vector store of one model: append-only memmap file + hash -> row index.
+
+    Args:
+        cache_dir: Folder for the cache files (created if missing)
+        model: Model name (part of the file names)
+        dtype: "float32" or "float16" for new caches (an existing cache keeps its own)
+        max_mb: Size cap of the vector file
+    """
+
+    def __init__(self, cache_dir, model, dtype="float32", max_mb=1024):
+        self.dir = Path(cache_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", model)
+        self.vectors_path = self.dir / f"{name}.vectors"
+        self.index_path = self.dir / f"{name}.index"
+        self.meta_path = self.dir / f"{name}.json"
+        self.model = model
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.dtype = np.dtype(dtype)
+        self.dim = None
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._index = {}      # key -> row
+        self._used = []       # row -> last use tick (for LRU)
+        self._logged = set()  # keys whose latest use is already in the index log
+        self._tick = 0
+        self._vectors = None
+        self._log = None
+        self._load()
+        if self._log is None:
+            self._log = open(self.index_path, "ab")
+
+    # -------------------- files --------------------
+
+    def _load(self):
+        if not self.meta_path.exists():
+            for path in (self.vectors_path, self.index_path):
+                path.unlink(missing_ok=True)
+            return
+
+        meta = json.loads(self.meta_path.read_text())
+        self.dim, self.dtype = meta["dim"], np.dtype(meta["dtype"])
+        row_bytes = self.dim * self.dtype.itemsize
+
+        # Drop a half-written row/record left by a crash
+        rows = os.path.getsize(self.vectors_path) // row_bytes if self.vectors_path.exists() else 0
+        with open(self.vectors_path, "ab") as f:
+            f.truncate(rows * row_bytes)
+        raw = self.index_path.read_bytes() if self.index_path.exists() else b""
+        records = np.frombuffer(raw[:len(raw) - len(raw) % INDEX_DTYPE.itemsize], dtype=INDEX_DTYPE)
+        records = records[records["row"] < rows]
+
+        # Later records win: a key's row and its last use are its last record
+        self._index = dict(zip(records["key"].tolist(), records["row"].tolist()))
+        used = np.zeros(rows, dtype=np.int64)
+        np.maximum.at(used, records["row"].astype(np.int64), np.arange(1, len(records) + 1))
+        self._used = used.tolist()
+        self._tick = len(records)
+        self._remap(rows)
+
+        if len(records) > 2 * len(self._index) + 1000 or len(self._index) < rows:
+            self._compact(sorted(self._index.items(), key=lambda item: self._used[item[1]]))
+
+    def _remap(self, rows):
+        """Map the vector file again after it grew (old views stay valid)."""
+        self._vectors = (np.memmap(self.vectors_path, dtype=self.dtype, mode="r", shape=(rows, self.dim))
+                         if rows else np.empty((0, self.dim or 0), dtype=self.dtype))
+
+    def _compact(self, keep):
+        """Rewrite the files with only the (key, row) pairs in keep, oldest first."""
+        vectors_tmp = self.vectors_path.with_suffix(".vectors.tmp")
+        index_tmp = self.index_path.with_suffix(".index.tmp")
+        rows = np.fromiter((row for _, row in keep), dtype=np.int64, count=len(keep))
+        records = np.empty(len(keep), dtype=INDEX_DTYPE)
+        records["key"] = [key for key, _ in keep] if keep else []
+        records["row"] = np.arange(len(keep))
+
+        with open(vectors_tmp, "wb") as f:
+            for start in range(0, len(rows), 65536):
+                f.write(np.ascontiguousarray(self._vectors[rows[start:start + 65536]]).tobytes())
+        records.tofile(index_tmp)
+
+        if self._log is not None:
+            self._log.close()
+        os.replace(vectors_tmp, self.vectors_path)
+        os.replace(index_tmp, self.index_path)
+        self._log = open(self.index_path, "ab")
+
+        self._index = {key: row for row, (key, _) in enumerate(keep)}
+        self._used = list(range(1, len(keep) + 1))
+        self._logged = set(self._index)
+        self._tick = len(keep)
+        self._remap(len(keep))
+
+    def _evict(self, incoming_rows):
+        """Drop least recently used rows until the file plus incoming_rows fits in 90% of the cap."""
+        row_bytes = self.dim * self.dtype.itemsize
+        keep_rows = max(int(self.max_bytes * 0.9) // row_bytes - incoming_rows, 0)
+        by_use = sorted(self._index.items(), key=lambda item: self._used[item[1]])
+        self.evictions += len(by_use) - min(keep_rows, len(by_use))
+        self._compact(by_use[max(len(by_use) - keep_rows, 0):] if keep_rows else [])
+
+    # -------------------- lookup / store --------------------
+
+    def get_many(self, keys):
+        """Vectors for keys (views into the memmap), None for misses."""
+        found = []
+        with self._lock:
+            for key in keys:
+                row = self._index.get(key)
+                if row is None:
+                    found.append(None)
+                    continue
+                self._tick += 1
+                self._used[row] = self._tick
+                if key not in self._logged:
+                    # Persist the use so LRU order survives a restart
+                    self._log.write(key + int(row).to_bytes(4, "little"))
+                    self._logged.add(key)
+                found.append(self._vectors[row])
+            self._log.flush()
+        return found
+
+    def put_many(self, keys, vectors):
+        """Append vectors for keys (keys already cached are skipped)."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                self.meta_path.write_text(json.dumps(
+                    {"model": self.model, "dim": self.dim, "dtype": self.dtype.name}))
+                self._remap(0)
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"{self.model} cache holds {self.dim}-dim vectors, got {vectors.shape[1]}")
+
+            new, seen = [], set()
+            for i, key in enumerate(keys):
+                if key not in self._index and key not in seen:
+                    new.append(i)
+                    seen.add(key)
+            if not new:
+                return
+
+            row_bytes = self.dim * self.dtype.itemsize
+            if (len(self._used) + len(new)) * row_bytes > self.max_bytes:
+                self._evict(len(new))
+                new = new[max(len(new) - self.max_bytes // row_bytes, 0):]
+
+            first = len(self._used)
+            with open(self.vectors_path, "ab") as f:
+                f.write(vectors[new].astype(self.dtype).tobytes())
+            for offset, i in enumerate(new):
+                key = keys[i]
+                self._tick += 1
+                self._index[key] = first + offset
+                self._used.append(self._tick)
+                self._logged.add(key)
+                self._log.write(key + (first + offset).to_bytes(4, "little"))
+            self._log.flush()
+            self._remap(len(self._used))
+
+    def __len__(self):
+        return len(self._index)
+
+    def size_mb(self):
+        return len(self._used) * (self.dim or 0) * self.dtype.itemsize / 1024 / 1024
+
+    def close(self):
+        with self._lock:
+            self._log.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    LangChain embeddings with a persistent cache in front of them.
+
+    Args:
+        embeddings: The real embeddings (called only for cache misses)
+        model: Cache namespace; defaults to embeddings.model
+        cache_dir, dtype, max_mb: See EmbeddingCache
+    """
+
+    def __init__(self, embeddings, model=None, cache_dir="./embedding_cache", dtype="float32", max_mb=1024):
+        self.embeddings = embeddings
+        self.model = model or getattr(embeddings, "model", None) or type(embeddings).__name__
+        self.cache = EmbeddingCache(cache_dir, self.model, dtype, max_mb)
+        self.hits = 0
+        self.misses = 0
+        self._counts_lock = threading.Lock()  # embed_documents may run in several threads
+
+    def lookup(self, texts, kind="document"):
+        """
+        Cached vectors without copying: read-only numpy views into the
+        vector file (None for texts not cached). embed_documents/embed_query
+        have to return lists of floats for LangChain, which copies.
+        """
+        return self.cache.get_many([text_key(text, kind) for text in texts])
+
+    def _embed(self, texts, kind):
+        keys = [text_key(text, kind) for text in texts]
+        vectors = self.cache.get_many(keys)
+
+        # Each distinct missing text goes to the server once
+        missing = {}
+        for i, vector in enumerate(vectors):
+            if vector is None:
+                missing.setdefault(keys[i], texts[i])
+        with self._counts_lock:
+            self.hits += len(texts) - sum(vector is None for vector in vectors)
+            self.misses += len(missing)
+
+        if missing:
+            if kind == "query":
+                fresh = [self.embeddings.embed_query(text) for text in missing.values()]
+            else:
+                fresh = self.embeddings.embed_documents(list(missing.values()))
+            self.cache.put_many(list(missing), fresh)
+            # Rounded to the cache's dtype, so a miss returns what later hits will
+            fresh = dict(zip(missing, np.asarray(fresh, dtype=self.cache.dtype)))
+            vectors = [fresh[key] if vector is None else vector for key, vector in zip(keys, vectors)]
+
+        return [vector.tolist() for vector in vectors]
+
+    def embed_documents(self, texts):
+        return self._embed(list(texts), "document")
+
+    def embed_query(self, text):
+        return self._embed([text], "query")[0]
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self.cache),
+            "size_mb": self.cache.size_mb(),
+            "dtype": self.cache.dtype.name,
+            "evictions": self.cache.evictions,
+        }
+
+
+class UncachedEmbeddings(Embeddings):
+    """
+    Pass-through with CachedEmbeddings' stats(), for EMBEDDING_CACHE=off:
+    every text goes to the real embeddings and counts as a miss.
+    """
+
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+        self.hits = 0
+        self.misses = 0
+        self._counts_lock = threading.Lock()
+
+    def embed_documents(self, texts):
+        texts = list(texts)
+        with self._counts_lock:
+            self.misses += len(texts)
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text):
+        with self._counts_lock:
+            self.misses += 1
+        return self.embeddings.embed_query(text)
+
+    def stats(self):
+        return {"hits": 0, "misses": self.misses, "hit_rate": 0.0, "entries": 0,
+                "size_mb": 0.0, "dtype": None, "evictions": 0}
+
+
+def get_embeddings(model="nomic-embed-text", base_url=None):
+    """
+    Ollama embeddings with the persistent cache in front.
+
+    Settings (environment variables):
+        EMBEDDING_CACHE_DIR     folder of the cache files (default ./embedding_cache)
+        EMBEDDING_CACHE_DTYPE   float32 or float16 (default float32)
+        EMBEDDING_CACHE_MAX_MB  size cap of each model's vector file (default 1024)
+        EMBEDDING_CACHE=off     no cache, every text goes to Ollama
+
+    Returns:
+        CachedEmbeddings (UncachedEmbeddings when the cache is off - same stats())
+    """
+    from langchain_ollama import OllamaEmbeddings
+
+    embeddings = OllamaEmbeddings(model=model, base_url=base_url or "http://localhost:11434")
+    if os.getenv("EMBEDDING_CACHE", "on").lower() in ("off", "0", "false"):
+        return UncachedEmbeddings(embeddings)
+    return CachedEmbeddings(
+        embeddings,
+        model=model,
+        cache_dir=os.getenv("EMBEDDING_CACHE_DIR", "./embedding_cache"),
+        dtype=os.getenv("EMBEDDING_CACHE_DTYPE", "float32"),
+        max_mb=float(os.getenv("EMBEDDING_CACHE_MAX_MB", "1024")),
+    )
+
+
+# Quick test if run directly
+if __name__ == "__main__":
+    # python rag_common/embedding_cache.py [cache_dir]   - what's cached
+    import sys
+
+    cache_dir = Path(sys.argv[1] if len(sys.argv) > 1 else os.getenv("EMBEDDING_CACHE_DIR", "./embedding_cache"))
+    metas = sorted(cache_dir.glob("*.json"))
+    if not metas:
+        print(f"📭 No embedding cache in {cache_dir}")
+    for meta_path in metas:
+        meta = json.loads(meta_path.read_text())
+        cache = EmbeddingCache(cache_dir, meta["model"])
+        print(f"📦 {meta['model']}: {len(cache)} vectors x {cache.dim} {cache.dtype.name}, {cache.size_mb():.1f} MB")
+        cache.close()
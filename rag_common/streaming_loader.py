@@ -0,0 +1,224 @@
+"""
+Streaming loader + splitter for large documents
+
+TextLoader.load() reads the whole file into one Document, and
+split_documents() then keeps every chunk in a list - both sit in memory
+before the first chunk is embedded. Here the same work is a generator
+pipeline:
+
+    StreamingTextLoader.lazy_load()  ->  StreamingTextSplitter.split_stream()  ->  consumer
+    (file in 64 KB blocks)               (chunks, as soon as they're complete)    (embed/store/index)
+
+- Memory stays at one block + the paragraph being split + one chunk,
+  however big the file is
+- Chunks are the same as RecursiveCharacterTextSplitter(chunk_size,
+  chunk_overlap).split_text() on the whole text (paragraphs longer than
+  max_piece characters are cut at a line break first)
+- Every chunk has metadata["start_index"]: its exact character offset in
+  the file, whatever the block size
+
+Usage:
+    from rag_common.streaming_loader import StreamingTextLoader, StreamingTextSplitter
+
+    loader = StreamingTextLoader("big_file.txt")
+    splitter = StreamingTextSplitter(chunk_size=500, chunk_overlap=50)
+    for chunk in splitter.split_stream(loader.lazy_load()):
+        print(chunk.metadata["start_index"], chunk.page_content[:40])
+"""
+
+from collections import deque
+from langchain_core.document_loaders import BaseLoader
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+PARAGRAPH = "\n\n"
+
+
+class StreamingTextLoader(BaseLoader):
+    """
+    TextLoader that yields the file block by block instead of all at once.
+
+    Each block is a Document with metadata {"source", "offset"}; offset is
+    the character position of the block in the file. After lazy_load has
+    gone through the whole file, char_count and word_count are set.
+
+    Args:
+        file_path: Text file to read
+        encoding: File encoding (None = system default, like TextLoader)
+        block_size: Characters per block
+    """
+
+    def __init__(self, file_path, encoding=None, block_size=65536):
+        self.file_path = str(file_path)
+        self.encoding = encoding
+        self.block_size = block_size
+        self.char_count = 0
+        self.word_count = 0
+
+    def preview(self, length=100):
+        """First `length` characters of the file (raises FileNotFoundError if it's missing)."""
+        with open(self.file_path, encoding=self.encoding) as f:
+            return f.read(length)
+
+    def lazy_load(self):
+        chars = words = 0
+        in_word = False
+        with open(self.file_path, encoding=self.encoding) as f:
+            while True:
+                try:
+                    block = f.read(self.block_size)
+                except UnicodeDecodeError as e:
+                    raise RuntimeError(f"Error loading {self.file_path}") from e
+                if not block:
+                    break
+                yield Document(page_content=block, metadata={"source": self.file_path, "offset": chars})
+
+                # A word cut in two by the block boundary counts once
+                words += len(block.split()) - (in_word and not block[0].isspace())
+                in_word = not block[-1].isspace()
+                chars += len(block)
+        self.char_count, self.word_count = chars, words
+
+
+class StreamingTextSplitter:
+    """
+    RecursiveCharacterTextSplitter that works on a stream of blocks.
+
+    The text is cut into paragraphs as blocks arrive, and paragraphs are
+    merged into chunks with the same greedy rule (and overlap) as
+    RecursiveCharacterTextSplitter; paragraphs too long for one chunk are
+    split by it directly ("\\n", then " ", then characters).
+
+    Args:
+        chunk_size: Target characters per chunk
+        chunk_overlap: Characters shared by neighbouring chunks
+        max_piece: Longest paragraph held in memory before it's cut at a line break
+    """
+
+    def __init__(self, chunk_size=500, chunk_overlap=50, max_piece=1_000_000):
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.max_piece = max_piece
+        self.long_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size, chunk_overlap=chunk_overlap, separators=["\n", " ", ""])
+
+    def split_stream(self, documents):
+        """
+        Chunks of a stream of Documents, in order.
+
+        Consecutive blocks from StreamingTextLoader (same source, offsets
+        following on) are split as one text. Any other Document (e.g. a
+        PDF page from another loader's lazy_load) is split on its own.
+
+        Yields:
+            Document per chunk, metadata = the source Document's + "start_index"
+        """
+        stream, metadata, end = None, None, None
+
+        for document in documents:
+            offset = document.metadata.get("offset")
+            source = document.metadata.get("source")
+            if stream is not None and not (offset == end and source == metadata.get("source")):
+                yield from stream.finish(metadata)
+                stream = None
+
+            if offset is None:
+                single = _ChunkStream(self)
+                single.feed(document.page_content)
+                yield from single.finish(document.metadata)
+                continue
+
+            if stream is None:
+                stream = _ChunkStream(self, start=offset)
+                metadata = {key: value for key, value in document.metadata.items() if key != "offset"}
+            stream.feed(document.page_content)
+            end = offset + len(document.page_content)
+
+            # Hand over whatever chunks this block completed
+            yield from stream.ready(metadata)
+
+        if stream is not None:
+            yield from stream.finish(metadata)
+
+
+class _ChunkStream:
+    """Paragraph cutting + greedy merge state for one text being split."""
+
+    def __init__(self, splitter, start=0):
+        self.splitter = splitter
+        self.buffer = ""            # text not yet cut into paragraphs
+        self.buffer_start = start   # offset of buffer[0] in the text
+        self.search = 0             # where to look for the next paragraph break in buffer
+        self.window = deque()       # (offset, paragraph) being merged into the next chunk
+        self.total = 0
+        self.out = deque()          # (offset, chunk text) ready to yield
+
+    def feed(self, block):
+        self.buffer += block
+        cut = 0
+        while True:
+            # Like re.split with keep_separator: a paragraph starts at each "\n\n"
+            i = self.buffer.find(PARAGRAPH, self.search)
+            if i == -1:
+                break
+            if i > cut:
+                self._piece(self.buffer_start + cut, self.buffer[cut:i])
+                cut = i
+            self.search = i + len(PARAGRAPH)
+        self.search = max(self.search, len(self.buffer) - len(PARAGRAPH) + 1)
+
+        if len(self.buffer) - cut > self.splitter.max_piece:
+            # A huge paragraph: cut it at its last line break to bound memory
+            j = self.buffer.rfind("\n", cut + 1)
+            j = j if j > cut else len(self.buffer)
+            self._piece(self.buffer_start + cut, self.buffer[cut:j])
+            cut = j
+
+        self.buffer = self.buffer[cut:]
+        self.buffer_start += cut
+        self.search = max(self.search - cut, 0)
+
+    def ready(self, metadata):
+        while self.out:
+            offset, text = self.out.popleft()
+            yield Document(page_content=text, metadata={**metadata, "start_index": offset})
+
+    def finish(self, metadata):
+        if self.buffer:
+            self._piece(self.buffer_start, self.buffer)
+            self.buffer = ""
+        self._flush()
+        yield from self.ready(metadata)
+
+    def _piece(self, offset, piece):
+        """One paragraph: merge it, or split it on its own if it's too long."""
+        size, overlap = self.splitter.chunk_size, self.splitter.chunk_overlap
+        if len(piece) >= size:
+            self._flush()
+            # Offsets found the way RecursiveCharacterTextSplitter(add_start_index=True) does
+            index, previous = 0, 0
+            for chunk in self.splitter.long_splitter.split_text(piece):
+                index = piece.find(chunk, max(0, index + previous - overlap))
+                previous = len(chunk)
+                self.out.append((offset + index, chunk))
+            return
+
+        # Greedy merge with overlap (TextSplitter._merge_splits, separator "")
+        if self.total + len(piece) > size and self.window:
+            self._emit()
+            while self.total > overlap or (self.total + len(piece) > size and self.total > 0):
+                self.total -= len(self.window.popleft()[1])
+        self.window.append((offset, piece))
+        self.total += len(piece)
+
+    def _emit(self):
+        text = "".join(piece for _, piece in self.window)
+        stripped = text.strip()
+        if stripped:
+            self.out.append((self.window[0][0] + len(text) - len(text.lstrip()), stripped))
+
+    def _flush(self):
+        if self.window:
+            self._emit()
+        self.window.clear()
+        self.total = 0
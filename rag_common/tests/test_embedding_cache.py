@@ -0,0 +1,28 @@
+"""Tests for rag_common.embedding_cache (no Ollama needed)."""
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from rag_common.embedding_cache import CachedEmbeddings, UncachedEmbeddings, get_embeddings
+
+
+def test_cache_off_still_has_stats(monkeypatch):
+    for value in ("off", "0", "false", "OFF"):
+        monkeypatch.setenv("EMBEDDING_CACHE", value)
+        embeddings = get_embeddings()
+        assert isinstance(embeddings, UncachedEmbeddings)
+
+        # What the scripts print after indexing
+        embeddings.embeddings = DeterministicFakeEmbedding(size=8)
+        embeddings.embed_documents(["a", "b", "a"])
+        embeddings.embed_query("q")
+        stats = embeddings.stats()
+        assert stats["hits"] == 0
+        assert stats["misses"] == 4
+        assert stats["entries"] == 0
+
+
+def test_cache_on_by_default(monkeypatch, tmp_path):
+    monkeypatch.delenv("EMBEDDING_CACHE", raising=False)
+    monkeypatch.setenv("EMBEDDING_CACHE_DIR", str(tmp_path))
+    embeddings = get_embeddings()
+    assert isinstance(embeddings, CachedEmbeddings)
+    embeddings.cache.close()